@@ -1,9 +1,15 @@
 
-"""Generate custom sine wave .wav files for Breakout game sound effects."""
+"""Generate custom sine wave .wav files for Breakout game sound effects.
+
+The game synthesizes its sound effects in memory (see sound_manager.SOUND_MAP); the
+.wav files are used for the background music and when the mixer's sample format can't
+be synthesized directly.
+"""
 
 import wave
 import os
 import numpy as np
+from sound_manager import SOUND_MAP, MUSIC_TONE, MUSIC_PATH, tone
 
 
 def create_dummy_wav(file_path, duration_seconds=0.25, sample_rate=44100, frequency=440):
@@ -20,9 +26,7 @@ def create_dummy_wav(file_path, duration_seconds=0.25, sample_rate=44100, freque
     using Python's built-in wave module. The output is a 16-bit PCM mono file.
     """
 
-    n_samples = int(sample_rate * duration_seconds)
-    t = np.linspace(0, duration_seconds, n_samples, False)
-    audio = 0.2 * np.sin(2 * np.pi * frequency * t)
+    audio = tone(frequency, duration_seconds, sample_rate)
     audio = (audio * 32767).astype(np.int16)
 
     with wave.open(file_path, 'w') as wf:
@@ -36,22 +40,10 @@ def create_dummy_wav(file_path, duration_seconds=0.25, sample_rate=44100, freque
 os.makedirs("assets/sounds", exist_ok=True)
 os.makedirs("assets/music", exist_ok=True)
 
-# sounds and associated frequencies
-sound_map = {
-    "brick_hit.wav": 880,
-    "wall_hit.wav": 660,
-    "paddle_hit.wav": 550,
-    "floor_hit.wav": 330,
-    "life_lost.wav": 220,
-    "game_over.wav": 110,
-    "startup.wav": 990
-}
-
 # Generate each .wav file
-for name, freq in sound_map.items():
-    path = os.path.join("assets/sounds", name)
-    create_dummy_wav(path, frequency=freq)
+for name, (freq, duration) in SOUND_MAP.items():
+    path = os.path.join("assets/sounds", f"{name}.wav")
+    create_dummy_wav(path, duration_seconds=duration, frequency=freq)
 
 # looping background tone
-create_dummy_wav("assets/music/background.wav",
-                 duration_seconds=3.0, frequency=260)
+create_dummy_wav(MUSIC_PATH, duration_seconds=MUSIC_TONE[1], frequency=MUSIC_TONE[0])
@@ -1,8 +1,134 @@
-"""SoundManager module for handling sound effects and background music in the game."""
+"""SoundManager module for handling sound effects and background music in the game.
 
+Sound effects play on channels reserved for their category (short impacts, game
+events), with a cap on how many copies of one sound overlap and at most one start of
+each sound per frame, so a frame full of collisions costs a bounded amount of mixing.
+
+The effects are sine tones synthesized in memory in the mixer's own format, so no WAV
+file is read or resampled at startup. With a cache directory the synthesized buffers
+are kept as .npy files named after a hash of their parameters and the mixer format.
+
+Opening the audio device can be slow, so the mixer can be set up on a background thread
+while the game draws its first frames; sounds played before it is ready are skipped.
+"""
+
+import hashlib
 import os
+import tempfile
+import threading
+import time
+import numpy as np
 import pygame
 
+# Tone of each sound effect: (frequency in Hz, duration in seconds)
+SOUND_MAP = {
+    "brick_hit": (880, 0.25),
+    "wall_hit": (660, 0.25),
+    "paddle_hit": (550, 0.25),
+    "floor_hit": (330, 0.25),
+    "life_lost": (220, 0.25),
+    "game_over": (110, 0.25),
+    "startup": (990, 0.25),
+    "powerup": (1320, 0.25),
+}
+# Looping background tone, streamed from a file by pygame.mixer.music
+MUSIC_TONE = (260, 3.0)
+MUSIC_PATH = "assets/music/background.wav"
+
+# Peak amplitude of the tones (1.0 is full scale)
+TONE_VOLUME = 0.2
+# Bump when the synthesis changes, so cached buffers are made again
+SYNTH_VERSION = 1
+
+# Sample type for each mixer sample size (as reported by pygame.mixer.get_init)
+SAMPLE_TYPES = {
+    8: np.uint8,
+    -8: np.int8,
+    16: np.uint16,
+    -16: np.int16,
+    -32: np.int32,
+    32: np.float32,
+}
+
+# Channel pools: reserved channels per category, and whether a new sound may cut off
+# the oldest one when every channel of the pool is busy (otherwise it is dropped)
+SOUND_CATEGORIES = {
+    "impact": {"channels": 4, "steal": False},
+    "event": {"channels": 3, "steal": True},
+}
+
+# Category and most overlapping voices of each sound effect
+SOUND_VOICES = {
+    "brick_hit": ("impact", 2),
+    "wall_hit": ("impact", 1),
+    "paddle_hit": ("impact", 1),
+    "floor_hit": ("event", 1),
+    "life_lost": ("event", 1),
+    "game_over": ("event", 1),
+    "startup": ("event", 1),
+    "powerup": ("event", 1),
+}
+
+
+def tone(frequency, duration, sample_rate=44100, volume=TONE_VOLUME):
+    """
+    A sine tone as floats between -volume and volume.
+
+    Parameters:
+        frequency (float): Frequency of the sine wave in Hz.
+        duration (float): Length of the tone in seconds.
+        sample_rate (int): Samples per second. Default is 44100 Hz.
+        volume (float): Peak amplitude. Default is TONE_VOLUME.
+
+    Returns:
+        numpy.ndarray: One sample per element.
+    """
+    n_samples = int(sample_rate * duration)
+    t = np.linspace(0, duration, n_samples, False)
+    return volume * np.sin(2 * np.pi * frequency * t)
+
+
+def to_mixer_samples(wave, size, channels):
+    """
+    Convert a float wave to the mixer's sample format, one column per channel.
+
+    Parameters:
+        wave (numpy.ndarray): Samples between -1 and 1.
+        size (int): Mixer sample size (a key of SAMPLE_TYPES).
+        channels (int): Mixer channel count.
+
+    Returns:
+        numpy.ndarray: Array ready for pygame.sndarray.make_sound.
+    """
+    sample_type = SAMPLE_TYPES[size]
+    if np.issubdtype(sample_type, np.floating):
+        samples = wave.astype(sample_type)
+    else:
+        limits = np.iinfo(sample_type)
+        # Unsigned formats are centered on the middle of their range
+        middle = (int(limits.max) + int(limits.min) + 1) // 2
+        peak = int(limits.max) - middle
+        samples = (wave * peak + middle).astype(sample_type)
+    if channels == 1:
+        return samples
+    return np.ascontiguousarray(np.repeat(samples[:, None], channels, axis=1))
+
+
+def cache_key(frequency, duration, mixer_format):
+    """
+    Hash of everything a synthesized buffer depends on.
+
+    Parameters:
+        frequency (float): Tone frequency.
+        duration (float): Tone duration.
+        mixer_format (tuple): (sample rate, size, channels) from pygame.mixer.get_init.
+
+    Returns:
+        str: A short hex digest.
+    """
+    params = repr((SYNTH_VERSION, frequency, duration, TONE_VOLUME, tuple(mixer_format)))
+    return hashlib.sha1(params.encode()).hexdigest()[:16]
+
 
 class SoundManager:
     """
@@ -10,30 +136,162 @@ class SoundManager:
     Initializes the pygame mixer and provides helper methods for sound control.
     """
 
-    def __init__(self):
+    def __init__(self, cache_dir=None, background=False):
         """
         Initialize the SoundManager by setting up the pygame mixer
         and loading all required sound effects and music.
+
+        Parameters:
+            cache_dir (str, optional): Directory to keep synthesized sounds in between
+                runs. Default is None (synthesize them every run).
+            background (bool, optional): Set up the mixer on a background thread and
+                return at once. Default is False.
+        """
+        self.cache_dir = cache_dir
+        self.stats = {"played": 0, "dropped": 0, "stolen": 0,
+                      "synthesized": 0, "cache_hits": 0}
+        self.sounds = {}
+        self.pools = {}
+        self.background_music_path = MUSIC_PATH
+        # Sounds already started this frame (see begin_frame)
+        self.frame_sounds = set()
+        # channel -> (sound name, start order) of the voices this manager started
+        self.voices = {}
+        self.started = 0
+
+        # Set once the mixer is open and the sounds are loaded
+        self.ready = threading.Event()
+        self.lock = threading.Lock()
+        self.ready_callbacks = []
+        self.load_time = None  # (start, end) in time.perf_counter_ns()
+        self.loader = None
+        if background:
+            self.loader = threading.Thread(target=self.start_in_background, name="audio",
+                                           daemon=True)
+            self.loader.start()
+        else:
+            self.start()
+
+    def start(self):
+        """
+        Open the mixer, load the sounds and reserve the channels, then run the
+        callbacks waiting in when_ready().
         """
+        started = time.perf_counter_ns()
         pygame.mixer.init()
         self.load_sounds()
+        self.reserve_channels()
+        self.load_time = (started, time.perf_counter_ns())
+        with self.lock:
+            self.ready.set()
+            callbacks, self.ready_callbacks = self.ready_callbacks, []
+        for callback in callbacks:
+            callback(self)
+
+    def start_in_background(self):
+        """
+        Loader thread: start(), leaving the game silent if there is no audio device.
+        """
+        try:
+            self.start()
+        except pygame.error as error:
+            print(f"Warning: Audio unavailable: {error}")
+
+    def when_ready(self, callback):
+        """
+        Call callback(sound_manager) once the sounds are loaded (at once if they are).
+        A callback waiting for the loader thread runs on that thread.
+
+        Parameters:
+            callback (callable): Function taking the SoundManager.
+        """
+        with self.lock:
+            if not self.ready.is_set():
+                self.ready_callbacks.append(callback)
+                return
+        callback(self)
 
     def load_sounds(self):
         """
-        Load all predefined sound effect files into a dictionary for later use.
+        Synthesize all predefined sound effects into a dictionary for later use.
         Also stores the path for the looping background music track.
         """
-        self.sounds = {
-            "brick_hit": self.load("assets/sounds/brick_hit.wav"),
-            "wall_hit": self.load("assets/sounds/wall_hit.wav"),
-            "paddle_hit": self.load("assets/sounds/paddle_hit.wav"),
-            "floor_hit": self.load("assets/sounds/floor_hit.wav"),
-            "life_lost": self.load("assets/sounds/life_lost.wav"),
-            "game_over": self.load("assets/sounds/game_over.wav"),
-            "startup": self.load("assets/sounds/startup.wav"),
-        }
+        mixer_format = pygame.mixer.get_init()
+        self.sounds = {}
+        for name, (frequency, duration) in SOUND_MAP.items():
+            if mixer_format[1] in SAMPLE_TYPES:
+                samples = self.samples(name, frequency, duration, mixer_format)
+                self.sounds[name] = pygame.sndarray.make_sound(samples)
+            else:
+                # A sample format NumPy can't hold: let pygame convert the WAV file
+                self.sounds[name] = self.load(f"assets/sounds/{name}.wav")
 
-        self.background_music_path = "assets/music/background.wav"
+        self.background_music_path = MUSIC_PATH
+
+    def samples(self, name, frequency, duration, mixer_format):
+        """
+        The samples of a tone in the mixer's format, from the cache if possible.
+
+        Parameters:
+            name (str): Sound name, used in the cache file name.
+            frequency (float): Tone frequency in Hz.
+            duration (float): Tone duration in seconds.
+            mixer_format (tuple): (sample rate, size, channels) of the mixer.
+
+        Returns:
+            numpy.ndarray: Array for pygame.sndarray.make_sound.
+        """
+        path = None
+        if self.cache_dir is not None:
+            key = cache_key(frequency, duration, mixer_format)
+            path = os.path.join(self.cache_dir, f"{name}-{key}.npy")
+            try:
+                samples = np.load(path)
+                self.stats["cache_hits"] += 1
+                return samples
+            except (OSError, ValueError):
+                pass  # not cached yet, or unreadable: synthesize it again
+
+        sample_rate, size, channels = mixer_format
+        samples = to_mixer_samples(tone(frequency, duration, sample_rate), size, channels)
+        self.stats["synthesized"] += 1
+        if path is not None:
+            self.save_samples(path, samples)
+        return samples
+
+    def save_samples(self, path, samples):
+        """
+        Write samples to the cache. A failed write only costs synthesizing them again.
+
+        Parameters:
+            path (str): Cache file.
+            samples (numpy.ndarray): The samples.
+        """
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write next to the cache file, then rename, so a reader never sees half a file
+            handle, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(handle, "wb") as file:
+                np.save(file, samples)
+            os.replace(temp_path, path)
+        except OSError as error:
+            print(f"Warning: Could not cache sound {path}: {error}")
+
+    def reserve_channels(self):
+        """
+        Reserve the first mixer channels for the category pools, so plays outside the
+        manager (which pick a free channel themselves) can never take them.
+        """
+        total = sum(info["channels"] for info in SOUND_CATEGORIES.values())
+        if pygame.mixer.get_num_channels() < total:
+            pygame.mixer.set_num_channels(total)
+        pygame.mixer.set_reserved(total)
+        self.pools = {}
+        first = 0
+        for category, info in SOUND_CATEGORIES.items():
+            self.pools[category] = [pygame.mixer.Channel(index)
+                                    for index in range(first, first + info["channels"])]
+            first += info["channels"]
 
     def load(self, path):
         """
@@ -51,21 +309,67 @@ class SoundManager:
             print(f"Warning: Sound file not found: {path}")
             return None
 
+    def begin_frame(self):
+        """
+        Start a new frame: each sound may be started once more.
+        """
+        self.frame_sounds.clear()
+
     def play_sound(self, name):
         """
         Play a specific sound effect by name.
 
+        A sound already started this frame is dropped. If the sound is playing its
+        most voices, the oldest voice restarts it; if its pool has no free channel,
+        the sound either takes the oldest channel of the pool or is dropped.
+
         Parameters:
             name (str): The name of the sound effect to play (e.g., 'brick_hit').
+
+        Returns:
+            bool: True if the sound was started.
         """
+        if not self.ready.is_set():
+            return False  # still loading
         sound = self.sounds.get(name)
-        if sound:
-            sound.play()
+        if not sound:
+            return False
+        if name in self.frame_sounds:
+            self.stats["dropped"] += 1
+            return False
+        self.frame_sounds.add(name)
+
+        category, max_voices = SOUND_VOICES.get(name, ("event", 1))
+        pool = self.pools[category]
+        playing = [channel for channel in pool
+                   if channel.get_busy() and channel in self.voices]
+        same = [channel for channel in playing if self.voices[channel][0] == name]
+        if len(same) >= max_voices:
+            channel = min(same, key=lambda c: self.voices[c][1])
+            self.stats["stolen"] += 1
+        else:
+            channel = next((c for c in pool if not c.get_busy()), None)
+            if channel is None:
+                if not SOUND_CATEGORIES[category]["steal"] or not playing:
+                    self.stats["dropped"] += 1
+                    return False
+                channel = min(playing, key=lambda c: self.voices[c][1])
+                self.stats["stolen"] += 1
+
+        channel.play(sound)
+        self.started += 1
+        self.voices[channel] = (name, self.started)
+        self.stats["played"] += 1
+        return True
 
     def play_music(self):
         """
-        Play the looping background music, if the file exists.
+        Play the looping background music, if the file exists. While the mixer is
+        still loading, the music starts once it is ready.
         """
+        if not self.ready.is_set():
+            self.when_ready(SoundManager.play_music)
+            return
         if os.path.exists(self.background_music_path):
             pygame.mixer.music.load(self.background_music_path)
             pygame.mixer.music.play(-1)
@@ -77,4 +381,5 @@ class SoundManager:
         """
         Stop the currently playing background music.
         """
-        pygame.mixer.music.stop()
+        if self.ready.is_set():
+            pygame.mixer.music.stop()
@@ -7,6 +7,79 @@ import pygame
 
 # pylint: disable=no-member, invalid-name
 
+# Pre-rendered trail dots, one list of fading sprites per (radius, trail length)
+trail_sprite_cache = {}
+
+
+def trail_sprites(radius, length, color=(255, 255, 255)):
+    """
+    Return the trail sprites for a trail of the given length, faintest first.
+
+    Each sprite is a circle drawn once with its fade alpha, so drawing the trail never
+    allocates surfaces.
+    """
+    key = (radius, length, color)
+    sprites = trail_sprite_cache.get(key)
+    if sprites is None:
+        sprites = []
+        for i in range(length):
+            alpha = int(255 * (i + 1) / length)  # Fade from faint to full
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color + (alpha,), (radius, radius), radius)
+            sprites.append(sprite)
+        trail_sprite_cache[key] = sprites
+    return sprites
+
+
+class TrailBuffer:
+    """
+    Fixed-size ring buffer of the ball's recent positions, oldest first when iterated.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.xs = [0.0] * capacity
+        self.ys = [0.0] * capacity
+        self.head = 0  # where the next position is written
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        start = self.head - self.count
+        for i in range(start, self.head):
+            yield self.xs[i % self.capacity], self.ys[i % self.capacity]
+
+    def append(self, x, y):
+        """
+        Add a position, overwriting the oldest one once the buffer is full.
+        """
+        self.xs[self.head] = x
+        self.ys[self.head] = y
+        self.head = (self.head + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def clear(self):
+        """
+        Forget every position.
+        """
+        self.head = 0
+        self.count = 0
+
+    def bounds(self):
+        """
+        Return (min_x, min_y, max_x, max_y) of the stored positions (buffer not empty).
+        """
+        if self.count < self.capacity:
+            xs = [x for x, _ in self]
+            ys = [y for _, y in self]
+        else:
+            xs, ys = self.xs, self.ys
+        return min(xs), min(ys), max(xs), max(ys)
+
+
 class Ball:
     """
     Ball object with trail that moves around the screen, bounces off walls, and interacts
@@ -14,7 +87,7 @@ class Ball:
     """
     # can remove speed_x values for adding difficulties later on.
 
-    def __init__(self, screen_width, screen_height, speed_x=-3, speed_y=-4):
+    def __init__(self, screen_width, screen_height, speed_x=-3, speed_y=-4, trail_length=4):
         """
         Initialize the ball at the center of the screen with specified speed and radius.
         A trail will be generated behind the ball to show momentum.
@@ -24,18 +97,23 @@ class Ball:
             screen_height (int): Height of the game screen.
             speed_x (int, optional): Initial horizontal speed. Defaults to -3.
             speed_y (int, optional): Initial vertical speed. Defaults to -4.
+            trail_length (int, optional): Number of trail dots. Defaults to 4.
         """
         super().__init__()
 
         self.radius = 5
         self.x = int(screen_width // 2)
         self.y = int(screen_height // 1.5)
+        # Position at the previous tick, for interpolated drawing
+        self.prev_x = self.x
+        self.prev_y = self.y
         self.speed_x = speed_x
         self.speed_y = speed_y
         self.color = (255, 255, 255)
         self.bottom_hit = False
-        self.trail = []
-        self.trail_length = 4
+        self.trail_length = trail_length
+        self.trail = TrailBuffer(trail_length)
+        self.trail_sprites = trail_sprites(self.radius, trail_length, self.color)
 
         # Make a small surface to show the ball (needed for Pygame sprites)
         self.image = pygame.Surface(
@@ -52,22 +130,56 @@ class Ball:
         self.bricks_hit_in_rally = 0
 
     # For drawing loop
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         """
         Draw the ball on the screen.
 
         Args:
             screen (pygame.Surface): The surface to draw on.
+            alpha (float, optional): How far between the previous and current tick to draw
+                the ball (0 to 1). Defaults to 1.0 (the current position).
         """
-        pygame.draw.circle(screen, self.color, (self.x, self.y), self.radius)
+        x, y = self.interpolated(alpha)
+        pygame.draw.circle(screen, self.color, (x, y), self.radius)
+
+        # Draw tail with decreasing opacity (oldest point gets the faintest sprite)
+        radius = self.radius
+        screen.blits([(sprite, (tx - radius, ty - radius))
+                      for sprite, (tx, ty) in zip(self.trail_sprites, self.trail)],
+                     doreturn=False)
 
-        # Draw tail with decreasing opacity
-        for i, (tx, ty) in enumerate(self.trail):
-            alpha = int(255 * (i + 1) / self.trail_length)  # Fade from faint to full
-            trail_color = (255, 255, 255, alpha)
-            trail_surface = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(trail_surface, trail_color, (self.radius, self.radius), self.radius)
-            screen.blit(trail_surface, (tx - self.radius, ty - self.radius))
+    def interpolated(self, alpha):
+        """
+        Return the ball position alpha of the way from the previous tick to the current one.
+        """
+        return (self.prev_x + (self.x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha)
+
+    def save_position(self):
+        """
+        Remember the current position as the previous tick's position.
+        """
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def dirty_rect(self):
+        """
+        Return the screen area covered by the ball and its trail (for dirty-rect rendering).
+        """
+        size = self.radius * 2 + 2
+        area = pygame.Rect(0, 0, size, size)
+        area.center = (self.x, self.y)
+        previous = pygame.Rect(0, 0, size, size)
+        previous.center = (self.prev_x, self.prev_y)
+        area.union_ip(previous)
+        if self.trail:
+            # Dots at the trail's corners cover every dot in between
+            min_x, min_y, max_x, max_y = self.trail.bounds()
+            for corner in ((min_x, min_y), (max_x, max_y)):
+                point = pygame.Rect(0, 0, size, size)
+                point.center = corner
+                area.union_ip(point)
+        return area
 
     # For when paddle misses the ball, or game is restarted.
     def restart(self, screen_width, screen_height):
@@ -80,24 +192,30 @@ class Ball:
         """
         self.x = screen_width // 2
         self.y = screen_height // 1.5
+        self.save_position()  # don't interpolate across the jump
         self.speed_y = -abs(self.speed_y)  # ensure it's going up
 
-    def move(self):
+    def move(self, step=1.0):
         """
         Update the ball’s position based on its current velocity.
+
+        Args:
+            step (float, optional): Length of the tick in 60 FPS frames (speeds are in
+                pixels per frame). Defaults to 1.0.
         """
-        self.x += self.speed_x  # Move left/right
-        self.y += self.speed_y  # Move up/down
+        self.x += self.speed_x * step  # Move left/right
+        self.y += self.speed_y * step  # Move up/down
+        self.record_position()
 
+    def record_position(self):
+        """
+        Sync the collision box and trail with the ball's current position.
+        """
         # Update the collision box to match the new position
         self.rect.center = (self.x, self.y)
 
-        # Add current position to trail
-        self.trail.append((self.x, self.y))
-
-        # Limit trail length
-        if len(self.trail) > self.trail_length:
-            self.trail.pop(0)
+        # Add current position to trail (the ring buffer drops the oldest point)
+        self.trail.append(self.x, self.y)
 
     def bounce_walls(
             self,
@@ -146,20 +264,30 @@ class Ball:
 
         if self.rect.colliderect(paddle_rect):
             sound.play_sound("paddle_hit")
-            # Calculate the hit position on the paddle
-            ball_center = self.x
-            paddle_center = paddle_rect.centerx
 
             # Always reverse Y
             self.speed_y *= -1
 
-            # If hitting left edge of paddle → send ball more left
-            if ball_center < paddle_center - 20:
-                self.speed_x = -abs(self.speed_x)  # ensure it's going left
-            # If hitting right edge of paddle → send ball more right
-            elif ball_center > paddle_center + 20:
-                self.speed_x = abs(self.speed_x)  # ensure it's going right
-            # Else: center hit → don't adjust X
+            self.steer_from_paddle(paddle_rect)
 
             # Trigger the paddle shake
             paddle_hop.shake()
+
+    def steer_from_paddle(self, paddle_rect):
+        """
+        Tweak horizontal direction based on where the ball hit the paddle.
+
+        Args:
+            paddle_rect (pygame.Rect): Rect of the paddle that was hit.
+        """
+        # Calculate the hit position on the paddle
+        ball_center = self.x
+        paddle_center = paddle_rect.centerx
+
+        # If hitting left edge of paddle → send ball more left
+        if ball_center < paddle_center - 20:
+            self.speed_x = -abs(self.speed_x)  # ensure it's going left
+        # If hitting right edge of paddle → send ball more right
+        elif ball_center > paddle_center + 20:
+            self.speed_x = abs(self.speed_x)  # ensure it's going right
+        # Else: center hit → don't adjust X
@@ -0,0 +1,284 @@
+"""Vectorized batch simulator for the Breakout game.
+
+Runs N games in lockstep with all ball, paddle, brick and score state stored in NumPy
+arrays, for AI training and difficulty tuning. The physics follow the original per-frame
+game rules (Ball.move, Ball.bounce_walls, Ball.bounce_paddle,
+handle_ball_field_collision and the rally bonus) at one tick per 60 FPS frame, i.e.
+GameSession(swept=False). Menus are skipped: a lost ball is served again on the next
+tick, and a new level starts one tick after the level is cleared.
+"""
+import numpy as np
+from bricks import (
+    BRICK_WIDTH, BRICK_HEIGHT, BRICK_SPACING, BRICK_PADDING_LEFT, BRICK_PADDING_TOP,
+    brick_colors,
+)
+from game_session import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, BORDER_MARGIN, BORDER_THICKNESS, PADDING_SIDE,
+)
+
+# Ticks between the last brick hit and the level counting as cleared
+# (the brick's shake and particle timers have to run out before it is removed)
+CLEAR_DELAY = 10
+
+# Paddle policy used when step() is given no actions: follow the ball
+TRACK_DEADZONE = 10
+
+
+def round_half_away(values):
+    """Round like pygame does when a float is assigned to a Rect (half away from zero)."""
+    return np.sign(values) * np.floor(np.abs(values) + 0.5)
+
+
+class BatchSimulator:
+    """
+    N independent games of Breakout advanced together with vectorized operations.
+
+    Per-game state is exposed as arrays: ball_x, ball_y, speed_x, speed_y, paddle_x,
+    alive (N x rows x columns), score, lives, level, rally and done.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, n, speed_x=-3, speed_y=-4, level_speedup=1.1, paddle_speed=7,
+                 lives=3, brick_scores=None, screen_width=SCREEN_WIDTH,
+                 screen_height=SCREEN_HEIGHT, rows_per_color=2):
+        """
+        The speed, speedup, paddle speed and lives settings take either one value for
+        every game or an array with one value per game.
+
+        Args:
+            n (int): Number of games.
+            speed_x (float, optional): Starting horizontal ball speed. Defaults to -3.
+            speed_y (float, optional): Starting vertical ball speed. Defaults to -4.
+            level_speedup (float, optional): Ball speed multiplier per cleared level.
+                Defaults to 1.1.
+            paddle_speed (float, optional): Paddle pixels per tick. Defaults to 7.
+            lives (int, optional): Lives per game (hard mode uses 1). Defaults to 3.
+            brick_scores (list, optional): Points per brick color, in brick_colors order.
+            screen_width (int, optional): Width of the game screen.
+            screen_height (int, optional): Height of the game screen.
+            rows_per_color (int, optional): Brick rows per color. Defaults to 2.
+        """
+        self.n = n
+        self.start_speed_x = self.per_game(speed_x, np.float64)
+        self.start_speed_y = self.per_game(speed_y, np.float64)
+        self.level_speedup = self.per_game(level_speedup, np.float64)
+        self.paddle_speed = self.per_game(paddle_speed, np.float64)
+        self.start_lives = self.per_game(lives, np.int64)
+        if brick_scores is None:
+            brick_scores = [info["score"] for info in brick_colors]
+
+        # Play area, as in Ball.bounce_walls
+        self.left_bound = BORDER_MARGIN + BORDER_THICKNESS
+        self.right_bound = screen_width - BORDER_THICKNESS - BORDER_MARGIN
+        self.top_bound = BORDER_MARGIN + BORDER_THICKNESS + PADDING_SIDE
+        self.bottom_bound = screen_height - BORDER_THICKNESS - BORDER_MARGIN
+        self.radius = 5
+        self.serve_x = screen_width // 2
+        self.serve_y = screen_height // 1.5
+
+        # Paddle, as in Paddle
+        self.paddle_width = 100
+        self.paddle_height = 20
+        self.paddle_y = screen_height - 50 - self.paddle_height
+        self.paddle_start = (screen_width - self.paddle_width) // 2
+        self.paddle_min = BORDER_MARGIN + BORDER_THICKNESS
+        self.paddle_max = screen_width - BORDER_MARGIN - BORDER_THICKNESS - self.paddle_width
+
+        # Brick grid, as in BrickField.layout
+        self.columns = (screen_width - BRICK_PADDING_LEFT * 2 +
+                        BRICK_SPACING) // (BRICK_WIDTH + BRICK_SPACING)
+        self.rows = len(brick_colors) * rows_per_color
+        self.row_scores = np.repeat(np.asarray(brick_scores, dtype=np.int64), rows_per_color)
+
+        self.reset()
+
+    def per_game(self, value, dtype):
+        """Broadcast a setting to one value per game."""
+        return np.broadcast_to(np.asarray(value, dtype=dtype), (self.n,)).copy()
+
+    def reset(self):
+        """
+        Start every game over from level 1.
+        """
+        n = self.n
+        self.ball_x = np.full(n, float(self.serve_x))
+        self.ball_y = np.full(n, float(int(self.serve_y)))
+        self.speed_x = self.start_speed_x.copy()
+        self.speed_y = self.start_speed_y.copy()
+        self.paddle_x = np.full(n, float(self.paddle_start))
+        self.alive = np.ones((n, self.rows, self.columns), dtype=bool)
+        self.bricks_left = np.full(n, self.rows * self.columns, dtype=np.int64)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.lives = self.start_lives.copy()
+        self.level = np.ones(n, dtype=np.int64)
+        self.rally = np.zeros(n, dtype=np.int64)
+        self.done = np.zeros(n, dtype=bool)
+        self.clear_timer = np.full(n, -1, dtype=np.int64)  # ticks until the level clears
+        self.next_level = np.zeros(n, dtype=bool)
+        self.ticks = np.zeros(n, dtype=np.int64)
+        self.bricks_hit = np.zeros(n, dtype=np.int64)
+        self.paddle_hits = np.zeros(n, dtype=np.int64)
+
+    def track_actions(self):
+        """
+        Scripted paddle policy: move toward the ball when it is off the paddle's center.
+
+        Returns:
+            numpy.ndarray: -1 (left), 0 (stay) or 1 (right) for each game.
+        """
+        center = np.floor(self.paddle_x + 0.5) + self.paddle_width // 2
+        return (np.where(self.ball_x < center - TRACK_DEADZONE, -1, 0)
+                + np.where(self.ball_x > center + TRACK_DEADZONE, 1, 0))
+
+    def step(self, actions=None):
+        """
+        Advance every unfinished game by one tick.
+
+        Args:
+            actions (numpy.ndarray, optional): -1, 0 or 1 per game for the paddle.
+                Defaults to the track_actions() policy.
+        """
+        if actions is None:
+            actions = self.track_actions()
+        live = ~self.done
+
+        # A cleared level is set up on the next tick, which the game sits out
+        starting = live & self.next_level
+        if starting.any():
+            self.start_next_level(starting)
+        moving = live & ~starting
+        self.ticks += live
+
+        # Brick removal timer after the last hit
+        counting = moving & (self.clear_timer > 0)
+        self.clear_timer[counting] -= 1
+
+        # Paddle.move_left / Paddle.move_right
+        px = self.paddle_x
+        px[:] = np.where(moving & (actions < 0),
+                         np.maximum(self.paddle_min, px - self.paddle_speed), px)
+        px[:] = np.where(moving & (actions > 0),
+                         np.minimum(self.paddle_max, px + self.paddle_speed), px)
+
+        # Ball.move
+        x = np.where(moving, self.ball_x + self.speed_x, self.ball_x)
+        y = np.where(moving, self.ball_y + self.speed_y, self.ball_y)
+        self.ball_x, self.ball_y = x, y
+        rect_x = round_half_away(x).astype(np.int64) - self.radius
+        rect_y = round_half_away(y).astype(np.int64) - self.radius
+        size = 2 * self.radius
+
+        # Ball.bounce_walls
+        side = moving & ((x - self.radius <= self.left_bound)
+                         | (x + self.radius >= self.right_bound))
+        self.speed_x = np.where(side, -self.speed_x, self.speed_x)
+        top = moving & (y - self.radius <= self.top_bound)
+        self.speed_y = np.where(top, -self.speed_y, self.speed_y)
+        bottom = moving & (y + self.radius >= self.bottom_bound)
+
+        # Ball.bounce_paddle (Rect.colliderect) and the rally bonus
+        paddle_left = np.floor(px + 0.5).astype(np.int64)
+        on_paddle = (moving
+                     & (rect_x < paddle_left + self.paddle_width)
+                     & (paddle_left < rect_x + size)
+                     & (rect_y < self.paddle_y + self.paddle_height)
+                     & (self.paddle_y < rect_y + size))
+        if on_paddle.any():
+            self.speed_y = np.where(on_paddle, -self.speed_y, self.speed_y)
+            paddle_center = paddle_left + self.paddle_width // 2
+            steer_left = on_paddle & (x < paddle_center - 20)
+            steer_right = on_paddle & ~steer_left & (x > paddle_center + 20)
+            self.speed_x = np.where(steer_left, -np.abs(self.speed_x), self.speed_x)
+            self.speed_x = np.where(steer_right, np.abs(self.speed_x), self.speed_x)
+            bonus = on_paddle & (self.rally >= 3)
+            self.score += np.where(bonus, 100 + 50 * (self.rally - 3), 0)
+            self.rally[on_paddle] = 0
+            self.paddle_hits += on_paddle
+
+        # handle_ball_field_collision: the ball rect overlaps at most 2 x 2 bricks
+        self.collide_bricks(moving, rect_x, rect_y, size)
+
+        # Life update
+        if bottom.any():
+            self.lives -= bottom
+            self.ball_x = np.where(bottom, float(self.serve_x), self.ball_x)
+            self.ball_y = np.where(bottom, self.serve_y, self.ball_y)
+            self.speed_y = np.where(bottom, -np.abs(self.speed_y), self.speed_y)
+            self.done |= bottom & (self.lives <= 0)
+
+        # Level complete once the last hit brick has been removed
+        cleared = moving & ~self.done & (self.clear_timer == 0)
+        self.next_level |= cleared
+        self.clear_timer[cleared] = -1
+
+    def collide_bricks(self, moving, rect_x, rect_y, size):
+        """
+        Score and remove the bricks the ball rects overlap; flip speed_y once per brick.
+        """
+        pitch_x = BRICK_WIDTH + BRICK_SPACING
+        pitch_y = BRICK_HEIGHT + BRICK_SPACING
+        col_lo = (rect_x - BRICK_PADDING_LEFT) // pitch_x
+        row_lo = (rect_y - BRICK_PADDING_TOP) // pitch_y
+        games = np.arange(self.n)
+        hits = np.zeros(self.n, dtype=np.int64)
+        for d_row in (0, 1):
+            row = row_lo + d_row
+            top = BRICK_PADDING_TOP + row * pitch_y
+            row_ok = ((row >= 0) & (row < self.rows)
+                      & (rect_y < top + BRICK_HEIGHT) & (top < rect_y + size))
+            for d_col in (0, 1):
+                col = col_lo + d_col
+                left = BRICK_PADDING_LEFT + col * pitch_x
+                candidate = (moving & row_ok & (col >= 0) & (col < self.columns)
+                             & (rect_x < left + BRICK_WIDTH) & (left < rect_x + size))
+                if not candidate.any():
+                    continue
+                g = games[candidate]
+                r = row[candidate]
+                c = col[candidate]
+                struck = self.alive[g, r, c]
+                g, r = g[struck], r[struck]
+                self.alive[g, r, c[struck]] = False
+                self.score[g] += self.row_scores[r]
+                hits[g] += 1
+        if hits.any():
+            # Every brick flips the ball once, so an even number of hits cancels out
+            self.speed_y = np.where(hits % 2 == 1, -self.speed_y, self.speed_y)
+            self.rally += hits
+            self.bricks_hit += hits
+            self.bricks_left -= hits
+            emptied = (hits > 0) & (self.bricks_left == 0)
+            self.clear_timer[emptied] = CLEAR_DELAY
+
+    def start_next_level(self, mask):
+        """
+        All of the resets for completing a level, for the games in mask.
+        """
+        self.next_level[mask] = False
+        self.level += mask
+        self.speed_x = np.where(mask, self.speed_x * self.level_speedup, self.speed_x)
+        self.speed_y = np.where(mask, self.speed_y * self.level_speedup, self.speed_y)
+        self.alive[mask] = True
+        self.bricks_left[mask] = self.rows * self.columns
+        self.ball_x = np.where(mask, float(self.serve_x), self.ball_x)
+        self.ball_y = np.where(mask, self.serve_y, self.ball_y)
+        self.speed_y = np.where(mask, -np.abs(self.speed_y), self.speed_y)
+
+    def run(self, ticks, policy=None):
+        """
+        Step every game up to ticks times, stopping early once all games are over.
+
+        Args:
+            ticks (int): Maximum number of ticks.
+            policy (callable, optional): Called with the simulator, returns actions.
+                Defaults to track_actions().
+
+        Returns:
+            int: Number of ticks simulated.
+        """
+        for tick in range(ticks):
+            if self.done.all():
+                return tick
+            self.step(policy(self) if policy is not None else None)
+        return ticks
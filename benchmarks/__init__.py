@@ -0,0 +1 @@
+"""Headless benchmark suite for the Breakout game (see benchmarks/run.py)."""
@@ -0,0 +1,355 @@
+"""Headless benchmark suite for the Breakout game.
+
+Runs scripted scenarios through the real GameSession and Renderer with SDL's dummy video
+driver and a fixed seed, one scenario per process so each gets its own peak memory.
+Every scenario reports frames per second, per-frame latency percentiles and peak
+memory; the results are written to JSON and compared against a stored baseline, and
+the run fails if a scenario got slower or bigger than the threshold allows. Each
+scenario runs a few times and keeps its best numbers, which is what is least affected
+by other load on the machine.
+
+Usage:
+    python -m benchmarks.run [--frames N] [--repeat N] [--only NAME ...]
+                             [--output results.json]
+                             [--baseline benchmarks/baseline.json] [--threshold 0.25]
+                             [--update-baseline]
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+
+# Must be set before pygame opens a display, in this process and the scenario processes
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# pylint: disable=wrong-import-position
+import numpy as np
+import pygame
+from game_session import (
+    GameSession, FrameInput, SCREEN_WIDTH, SCREEN_HEIGHT, FPS, GAME_OVER, LIFE_LOST,
+    LEVEL_TRANSITION_MS,
+)
+from brick_field import BrickField
+from renderer import Renderer
+from scoreboard import Scoreboard
+from score_store import TextScoreStore
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+# pylint: disable=no-member
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+SEED = 1234
+TICK_RATE = 120
+# Frames run before timing starts (font loads, layer builds, first allocations)
+WARMUP_FRAMES = 30
+# Lives given to scripted players so a scenario never reaches game over
+ENDLESS_LIVES = 10 ** 6
+# Entries in the scoreboard_large scenario's scoreboard.txt
+LARGE_SCOREBOARD_ENTRIES = 200000
+# Balls in play (the main ball and the extra ones) in the multiball_200 scenario
+MULTIBALL_BALLS = 200
+# Latency changes smaller than this never count as regressions (timer and scheduler noise)
+MIN_DELTA_MS = 0.1
+
+SCENARIOS = {}
+
+
+def scenario(function):
+    """Register a scenario: a function taking a Bench and returning a per-frame callable."""
+    SCENARIOS[function.__name__] = function
+    return function
+
+
+class Bench:
+    """
+    The display, renderer and session a scenario runs on.
+    """
+
+    def __init__(self, workdir):
+        """
+        Args:
+            workdir (str): Scratch directory for files the scenario creates.
+        """
+        self.workdir = workdir
+        pygame.display.init()
+        pygame.font.init()
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.renderer = Renderer(self.screen)
+        self.session = None
+
+    def new_session(self, scoreboard=None, level_transition_ms=LEVEL_TRANSITION_MS,
+                    multiball=False):
+        """A seeded session with the game's tick rate and level transition."""
+        self.session = GameSession(SCREEN_WIDTH, SCREEN_HEIGHT, scoreboard=scoreboard,
+                                   tick_rate=TICK_RATE, seed=SEED,
+                                   level_transition_ms=level_transition_ms,
+                                   multiball=multiball)
+        return self.session
+
+    def start_endless(self, session):
+        """Serve the ball and give the player lives enough for any scenario."""
+        session.step(FrameInput(presses=[(pygame.K_SPACE, " ")]))
+        session.lives = ENDLESS_LIVES
+
+    def play_sound(self, name):
+        """Sound sink for scenarios that hit bricks directly; the bench is silent."""
+
+    def frame(self, inputs):
+        """One rendered frame: the ticks of a 60 FPS frame, then draw and present."""
+        for _ in range(TICK_RATE // FPS):
+            self.session.step(inputs)
+            inputs = FrameInput(inputs.left, inputs.right)  # presses go to the first tick
+        self.renderer.draw(self.session)
+        self.renderer.present()
+
+
+def tracking_input(session):
+    """A player who follows the ball and serves or unpauses whenever needed."""
+    ball = session.game_ball
+    paddle = session.paddle
+    presses = []
+    if session.current_state == LIFE_LOST or not session.ball_active:
+        presses.append((pygame.K_SPACE, " "))
+    elif session.paused:
+        presses.append((pygame.K_p, "p"))
+    return FrameInput(ball.x < paddle.rect.centerx - 10, ball.x > paddle.rect.centerx + 10,
+                      presses)
+
+
+@scenario
+def welcome_idle(bench):
+    """The welcome screen with no input."""
+    bench.new_session()
+    idle = FrameInput()
+    return lambda: bench.frame(idle)
+
+
+@scenario
+def full_grid_rally(bench):
+    """A level 1 game from the serve, with the full grid in place."""
+    session = bench.new_session()
+    bench.start_endless(session)
+    return lambda: bench.frame(tracking_input(session))
+
+
+@scenario
+def level7_fast_ball(bench):
+    """Level 7: the ball is 1.1^6 times faster than on level 1."""
+    session = bench.new_session()
+    session.current_level = 7
+    session.game_ball.speed_x *= 1.1 ** 6
+    session.game_ball.speed_y *= 1.1 ** 6
+    bench.start_endless(session)
+    return lambda: bench.frame(tracking_input(session))
+
+
+@scenario
+def particle_storm(bench):
+    """Every brick hit at once every half second, each with its particle burst."""
+    # No transition, so a new grid is there for the next storm
+    session = bench.new_session(level_transition_ms=0)
+    bench.start_endless(session)
+    frames = [0]
+
+    def frame():
+        if frames[0] % (FPS // 2) == 0:
+            bricks = session.bricks
+            for row, column in zip(*np.nonzero(bricks.alive)):
+                bricks.hit((int(row), int(column)), session.game_ball, bench, session.particles)
+        frames[0] += 1
+        bench.frame(tracking_input(session))
+    return frame
+
+
+@scenario
+def multiball_200(bench):
+    """Multi-ball mode with 200 balls in play; lost balls and broken bricks come back."""
+    session = bench.new_session(multiball=True)
+    bench.start_endless(session)
+    layout = BrickField.layout(SCREEN_WIDTH)
+    rng = np.random.default_rng(SEED)
+    ball = session.game_ball
+
+    def frame():
+        # Serve lost balls again from the main ball's start position, fanned upwards
+        missing = MULTIBALL_BALLS - 1 - len(session.balls)
+        if missing > 0:
+            angle = rng.uniform(-1.0, 1.0, missing)
+            session.balls.spawn(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 1.5,
+                                5 * np.sin(angle), -5 * np.cos(angle))
+        # Rebuild the grid before it is cleared, so the level never ends
+        bricks = session.bricks
+        if len(bricks) < bricks.alive.size // 3:
+            for row, kinds in enumerate(layout):
+                bricks.fill_row(row, kinds)
+        bench.frame(FrameInput(ball.x < session.paddle.rect.centerx - 10,
+                               ball.x > session.paddle.rect.centerx + 10))
+    return frame
+
+
+@scenario
+def scoreboard_large(bench):
+    """The game over scoreboard read from a huge scoreboard.txt that keeps changing."""
+    path = os.path.join(bench.workdir, "scoreboard.txt")
+    rng = np.random.default_rng(SEED)
+    scores = rng.integers(0, 100000, LARGE_SCOREBOARD_ENTRIES)
+    with open(path, "w", encoding="utf-8") as file:
+        file.writelines(f"P{i % 1000:03d},{score}\n" for i, score in enumerate(scores))
+    scoreboard = Scoreboard(SCREEN_WIDTH, SCREEN_HEIGHT, store=TextScoreStore(path))
+    session = bench.new_session(scoreboard)
+    session.current_state = GAME_OVER
+    frames = [0]
+    idle = FrameInput()
+
+    def frame():
+        # Another process rewrote the file once a second: the board is read again
+        if frames[0] % FPS == 0:
+            stat = os.stat(path)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        frames[0] += 1
+        bench.frame(idle)
+    return frame
+
+
+def peak_memory_mb():
+    """Peak resident memory of this process in MB, or None where it can't be read."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def run_scenario(name, frames):
+    """
+    Run one scenario in this process.
+
+    Returns:
+        dict: frames, fps, p50/p95/p99 frame time in ms and peak memory in MB.
+    """
+    with tempfile.TemporaryDirectory() as workdir:
+        bench = Bench(workdir)
+        frame = SCENARIOS[name](bench)
+        for _ in range(WARMUP_FRAMES):
+            frame()
+        times = np.empty(frames, dtype=np.int64)
+        clock = time.perf_counter_ns
+        started = clock()
+        for i in range(frames):
+            start = clock()
+            frame()
+            times[i] = clock() - start
+        elapsed = clock() - started
+        pygame.quit()
+    p50, p95, p99 = np.percentile(times, [50, 95, 99]) / 1e6
+    return {"frames": frames, "fps": round(frames / (elapsed / 1e9), 1),
+            "p50_ms": round(p50, 3), "p95_ms": round(p95, 3), "p99_ms": round(p99, 3),
+            "peak_mb": round(peak_memory_mb(), 1) if resource is not None else None}
+
+
+def best_of(runs):
+    """
+    Combine repeated runs of a scenario: the best value of every metric.
+    """
+    best = dict(runs[0])
+    best["fps"] = max(run["fps"] for run in runs)
+    for key in ("p50_ms", "p95_ms", "p99_ms"):
+        best[key] = min(run[key] for run in runs)
+    if best["peak_mb"] is not None:
+        best["peak_mb"] = min(run["peak_mb"] for run in runs)
+    return best
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare results with a baseline.
+
+    Returns:
+        list: Regression messages (empty if nothing got worse than the threshold).
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if result["fps"] < base["fps"] * (1 - threshold):
+            regressions.append(f"{name}: {result['fps']} fps, baseline {base['fps']}")
+        # p99 is reported but not checked: a few hundred frames make it too noisy
+        if result["p95_ms"] > max(base["p95_ms"] * (1 + threshold),
+                                  base["p95_ms"] + MIN_DELTA_MS):
+            regressions.append(f"{name}: p95 {result['p95_ms']} ms, "
+                               f"baseline {base['p95_ms']} ms")
+        if (result["peak_mb"] is not None and base.get("peak_mb") is not None
+                and result["peak_mb"] > base["peak_mb"] * (1 + threshold)):
+            regressions.append(f"{name}: peak {result['peak_mb']} MB, "
+                               f"baseline {base['peak_mb']} MB")
+    return regressions
+
+
+def main():
+    """Command line entry point: run the scenarios, write JSON, check the baseline."""
+    parser = argparse.ArgumentParser(description="Run the Breakout benchmark scenarios")
+    parser.add_argument("--frames", type=int, default=600,
+                        help="timed frames per scenario (default: 600)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per scenario, keeping the best numbers (default: 3)")
+    parser.add_argument("--only", nargs="+", choices=sorted(SCENARIOS), metavar="NAME",
+                        help="run only these scenarios")
+    parser.add_argument("--output", default="benchmark_results.json",
+                        help="results file (default: benchmark_results.json)")
+    parser.add_argument("--baseline", default=BASELINE_PATH,
+                        help="baseline to compare with (default: benchmarks/baseline.json)")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown or growth as a fraction (default: 0.25)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="save the results as the new baseline instead of comparing")
+    args = parser.parse_args()
+
+    names = args.only or list(SCENARIOS)
+    results = {}
+    # A fresh process per scenario: no shared caches, and its own peak memory
+    with multiprocessing.get_context("spawn").Pool(1, maxtasksperchild=1) as pool:
+        for name in names:
+            runs = [pool.apply(run_scenario, (name, args.frames))
+                    for _ in range(args.repeat)]
+            results[name] = result = best_of(runs)
+            print(f"{name:<18}{result['fps']:>9.1f} fps  p50 {result['p50_ms']:.2f}  "
+                  f"p95 {result['p95_ms']:.2f}  p99 {result['p99_ms']:.2f} ms  "
+                  f"peak {result['peak_mb']} MB")
+
+    report = {"python": platform.python_version(), "pygame": pygame.version.ver,
+              "platform": platform.platform(), "frames": args.frames,
+              "repeat": args.repeat,
+              "scenarios": results}
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one")
+        return 0
+    with open(args.baseline, "r", encoding="utf-8") as file:
+        baseline = json.load(file)["scenarios"]
+    regressions = compare(results, baseline, args.threshold)
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    if not regressions:
+        print(f"No regressions beyond {args.threshold:.0%} of the baseline")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""Regression checks for the simulation paths the benchmarks rely on.
+
+Run with: python -m pytest benchmarks
+"""
+import json
+import os
+
+# Must be set before pygame opens a display
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# pylint: disable=wrong-import-position
+import numpy as np
+import pygame
+import pytest
+from game_session import GameSession, FrameInput, GAME_OVER, LIFE_LOST, LEVEL_TRANSITION_MS
+from batch_sim import BatchSimulator
+from level_pack import Level, LevelPack, MAX_COLUMNS, MAX_ROWS, build_pack, parse_source
+from replay import Replay, ReplayPlayer, ReplayRecorder
+
+# pylint: disable=no-member
+
+SEED = 1234
+# Ticks each scripted game runs for: long enough to break most of a level (and to reach
+# level 2 in multi-ball mode)
+TICKS = 3000
+SAMPLE_LEVELS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             "levels", "sample.json")
+
+
+def bot_input(session):
+    """Follow the ball with the paddle and serve or unpause when needed."""
+    ball = session.game_ball
+    paddle = session.paddle.rect
+    presses = []
+    if session.current_state == LIFE_LOST or not session.ball_active:
+        presses.append((pygame.K_SPACE, " "))
+    if session.paused:
+        presses.append((pygame.K_p, "p"))
+    return FrameInput(ball.x < paddle.centerx - 10, ball.x > paddle.centerx + 10, presses)
+
+
+def snapshot(session):
+    """The parts of a session a replay has to reproduce."""
+    return (session.score, session.lives, session.current_level, session.current_state,
+            session.game_ball.x, session.game_ball.y, session.paddle.rect.x,
+            session.bricks.alive.tobytes())
+
+
+@pytest.mark.parametrize("swept, level_transition_ms, multiball", [
+    (True, 0, False),
+    (False, 0, False),
+    (True, LEVEL_TRANSITION_MS, True),
+])
+def test_replay_playback_matches_recording(swept, level_transition_ms, multiball):
+    session = GameSession(swept=swept, seed=SEED, level_transition_ms=level_transition_ms,
+                          multiball=multiball)
+    recorder = ReplayRecorder(session)
+    for _ in range(TICKS):
+        inputs = bot_input(session)
+        recorder.record(inputs, session)
+        session.step(inputs)
+
+    replay = Replay.from_bytes(recorder.replay.to_bytes())
+    assert len(replay) == TICKS
+    assert snapshot(ReplayPlayer(replay).play()) == snapshot(session)
+
+
+@pytest.mark.parametrize("speed_x, speed_y, paddle_speed", [
+    (-3.3, -4.1, 7),
+    (3.1, -3.9, 7),
+    (-3.9, -3.2, 6),
+])
+def test_batch_simulator_matches_game_session(speed_x, speed_y, paddle_speed):
+    session = GameSession(swept=False)
+    session.game_ball.speed_x = speed_x
+    session.game_ball.speed_y = speed_y
+    session.paddle.speed = paddle_speed
+    # The first tick leaves the welcome screen and already runs physics
+    session.step(FrameInput(presses=[(pygame.K_SPACE, " ")]))
+    for _ in range(TICKS - 1):
+        if session.current_state == GAME_OVER:
+            break
+        session.step(bot_input(session))
+    lives = session.lives if session.current_state != GAME_OVER else 0
+
+    batch = BatchSimulator(1, speed_x=speed_x, speed_y=speed_y, paddle_speed=paddle_speed)
+    batch.run(TICKS)
+    assert (int(batch.score[0]), int(batch.lives[0]), int(batch.level[0])) == \
+        (session.score, lives, session.current_level)
+
+
+def test_level_pack_round_trip(tmp_path):
+    with open(SAMPLE_LEVELS, "r", encoding="utf-8") as file:
+        types, levels = parse_source(json.load(file))
+    path = tmp_path / "sample.bkl"
+    path.write_bytes(build_pack(types, levels))
+
+    with LevelPack(str(path)) as pack:
+        assert pack.types == types
+        assert len(pack) == len(levels)
+        for index, level in enumerate(levels):
+            decoded = pack.level(index)
+            assert decoded.name == level.name
+            assert decoded.kinds.dtype == level.kinds.dtype
+            assert np.array_equal(decoded.kinds, level.kinds)
+
+
+def test_level_pack_rejects_levels_wider_than_the_screen():
+    source = {"levels": [{"name": "Wide", "rows": ["G" * (MAX_COLUMNS + 1)]}]}
+    with pytest.raises(ValueError):
+        parse_source(source)
+
+
+def test_level_pack_rejects_levels_taller_than_the_playfield(tmp_path):
+    source = {"levels": [{"name": "Tall", "rows": ["G"] * (MAX_ROWS + 1)}]}
+    with pytest.raises(ValueError):
+        parse_source(source)
+    source["levels"][0]["rows"].pop()
+    types, levels = parse_source(source)
+
+    # A pack written without the source checks is still refused when the level is read
+    tall = Level("Tall", np.zeros((MAX_ROWS + 1, 1), dtype=np.int8))
+    path = tmp_path / "tall.bkl"
+    path.write_bytes(build_pack(types, levels + [tall]))
+    with LevelPack(str(path)) as pack:
+        assert pack.level(0).kinds.shape == (MAX_ROWS, 1)
+        with pytest.raises(ValueError):
+            pack.level(1)
@@ -0,0 +1,407 @@
+"""Gym-style environment for training agents on the Breakout game.
+
+BreakoutEnv wraps a headless GameSession with reset()/step() in the Gymnasium style
+(step returns obs, reward, terminated, truncated, info). Observations are either a
+compact feature vector or the rendered frame, which is drawn straight into a NumPy
+array without copying. VectorEnv steps many environments per call, in this process or
+in worker processes that render straight into shared memory.
+"""
+import multiprocessing
+import os
+import random
+from multiprocessing import shared_memory
+import numpy as np
+import pygame
+from bricks import BRICK_WIDTH, BRICK_SPACING, BRICK_PADDING_LEFT, brick_colors
+from game_session import (
+    GameSession, FrameInput, SCREEN_WIDTH, SCREEN_HEIGHT, FPS, GAME_OVER, LIFE_LOST,
+)
+
+# pylint: disable=no-member
+
+# Actions
+NOOP = 0
+LEFT = 1
+RIGHT = 2
+NUM_ACTIONS = 3
+
+# Observation types
+FEATURES = "features"
+PIXELS = "pixels"
+
+# Ball position, ball velocity and paddle x come before the brick bitmap
+NUM_BALL_PADDLE_FEATURES = 5
+
+
+class BreakoutEnv:
+    """
+    One game of Breakout with a Gym-style reset()/step() interface.
+
+    Actions are NOOP (0), LEFT (1) or RIGHT (2). The reward is the score gained during
+    the step. Serving the ball, resuming after a lost life and unpausing after a level
+    are done automatically, so every step is spent playing.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, obs_type=FEATURES, hardmode=False, tick_rate=FPS, frame_skip=1,
+                 max_steps=None, rows_per_color=2, pixel_buffer=None):
+        """
+        Args:
+            obs_type (str, optional): FEATURES or PIXELS. Defaults to FEATURES.
+            hardmode (bool, optional): Play with one life. Defaults to False.
+            tick_rate (int, optional): Session ticks per second. Defaults to FPS.
+            frame_skip (int, optional): Ticks the action is repeated for in one step.
+                Defaults to 1.
+            max_steps (int, optional): Steps before the episode is truncated.
+            rows_per_color (int, optional): Brick rows per color in the session's
+                brick field. Defaults to 2.
+            pixel_buffer (numpy.ndarray, optional): C-contiguous (height, width, 3) uint8
+                array to render PIXELS observations into (e.g. a shared memory slot).
+                Defaults to a new array.
+        """
+        if obs_type not in (FEATURES, PIXELS):
+            raise ValueError(f"Unknown obs_type: {obs_type}")
+        self.obs_type = obs_type
+        self.hardmode = hardmode
+        self.tick_rate = tick_rate
+        self.frame_skip = frame_skip
+        self.max_steps = max_steps
+        self.rows_per_color = rows_per_color
+        self.session = None
+        self.steps = 0
+        # Seeds the sessions after reset(seed=...); unseeded until then
+        self.seed_rng = None
+
+        self.width = SCREEN_WIDTH
+        self.height = SCREEN_HEIGHT
+        self.rows = len(brick_colors) * rows_per_color
+        self.columns = (self.width - BRICK_PADDING_LEFT * 2 +
+                        BRICK_SPACING) // (BRICK_WIDTH + BRICK_SPACING)
+
+        # Pixel observations are drawn by a Renderer on a surface over this array
+        self.frame = pixel_buffer
+        self.surface = None
+        self.renderer = None
+        if obs_type == PIXELS:
+            self.observation_shape = (self.height, self.width, 3)
+            self.observation_dtype = np.uint8
+        else:
+            self.observation_shape = (NUM_BALL_PADDLE_FEATURES + self.rows * self.columns,)
+            self.observation_dtype = np.float32
+
+    def reset(self, seed=None):
+        """
+        Start a new game, already past the welcome screen.
+
+        Args:
+            seed (int, optional): Seed for this episode and the ones after it, as in
+                Gymnasium: reset(seed=s) followed by plain reset() calls always plays
+                the same sequence of games. Defaults to continuing the current
+                sequence (unseeded until a seed is given).
+
+        Returns:
+            tuple: (observation, info)
+        """
+        if seed is not None:
+            self.seed_rng = random.Random(seed)
+        session_seed = self.seed_rng.getrandbits(63) if self.seed_rng is not None else None
+        self.session = GameSession(hardmode=self.hardmode, tick_rate=self.tick_rate,
+                                   seed=session_seed, rows_per_color=self.rows_per_color)
+        self.session.step(FrameInput(presses=[(pygame.K_SPACE, " ")]))
+        self.steps = 0
+        return self.observe(), self.info([])
+
+    def step(self, action):
+        """
+        Hold the action for frame_skip ticks.
+
+        Args:
+            action (int): NOOP, LEFT or RIGHT.
+
+        Returns:
+            tuple: (observation, reward, terminated, truncated, info). terminated is
+            True once the game is over; truncated once max_steps is reached.
+        """
+        session = self.session
+        start_score = session.score
+        events = []
+        inputs = FrameInput(left=action == LEFT, right=action == RIGHT)
+        for _ in range(self.frame_skip):
+            inputs.presses = self.serve_presses()
+            events.extend(session.step(inputs))
+            if session.current_state == GAME_OVER:
+                break
+        self.steps += 1
+
+        terminated = session.current_state == GAME_OVER
+        truncated = (not terminated and self.max_steps is not None
+                     and self.steps >= self.max_steps)
+        reward = session.score - start_score
+        return self.observe(), reward, terminated, truncated, self.info(events)
+
+    def serve_presses(self):
+        """
+        Key presses that get the ball moving: SPACE to serve, P to unpause.
+        """
+        session = self.session
+        if session.level_cleared:
+            return []  # the next level starts on this tick
+        if session.current_state == LIFE_LOST or not session.ball_active:
+            return [(pygame.K_SPACE, " ")]
+        if session.paused:
+            return [(pygame.K_p, "p")]
+        return []
+
+    def info(self, events):
+        """Extra episode details returned with each observation."""
+        session = self.session
+        return {"score": session.score, "lives": session.lives,
+                "level": session.current_level, "events": events}
+
+    def observe(self):
+        """Observation of the current state in the configured obs_type."""
+        if self.obs_type == PIXELS:
+            return self.pixels()
+        return self.features()
+
+    def features(self):
+        """
+        Feature vector: ball x and y (0 to 1), ball speed x and y (pixels per 60 FPS
+        frame), paddle x (0 to 1), then 1.0 for each brick still standing, row by row.
+        """
+        session = self.session
+        ball = session.game_ball
+        obs = np.zeros(self.observation_shape, dtype=np.float32)
+        obs[0] = ball.x / self.width
+        obs[1] = ball.y / self.height
+        obs[2] = ball.speed_x
+        obs[3] = ball.speed_y
+        obs[4] = session.paddle.x / self.width
+        obs[NUM_BALL_PADDLE_FEATURES:] = session.bricks.alive.ravel()
+        return obs
+
+    def pixels(self):
+        """
+        The current frame as a (height, width, 3) uint8 array.
+
+        No pixels are copied: the render surface is built over the array itself, so the
+        same array is returned (and drawn over) every step. Copy it to keep a frame.
+
+        The surface wraps the array (pygame.image.frombuffer) rather than the array
+        viewing the surface (pygame.surfarray.pixels3d), because a pixels3d view locks
+        the surface for as long as it exists and a locked surface can't be blitted to.
+        """
+        if self.renderer is None:
+            # Imported here so feature-only environments never load fonts
+            from renderer import Renderer  # pylint: disable=import-outside-toplevel
+            pygame.font.init()
+            if self.frame is None:
+                self.frame = np.zeros(self.observation_shape, dtype=np.uint8)
+            self.surface = pygame.image.frombuffer(self.frame, (self.width, self.height),
+                                                   "RGB")
+            self.renderer = Renderer(self.surface)
+        self.renderer.draw(self.session)
+        return self.frame
+
+    def close(self):
+        """Release the render surface and its pixel array."""
+        self.renderer = None
+        self.surface = None
+        self.frame = None
+
+
+def env_worker(connection, slots, shm_name, shape, dtype, env_kwargs):
+    """
+    Subprocess loop for VectorEnv: owns the envs in slots and writes their observations
+    into the shared memory block.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    memory = shared_memory.SharedMemory(name=shm_name)
+    buffer = np.ndarray(shape, dtype=dtype, buffer=memory.buf)
+    envs = [make_env(env_kwargs, buffer, slot) for slot in slots]
+    try:
+        while True:
+            command, data = connection.recv()
+            if command == "reset":
+                infos = []
+                for env, slot in zip(envs, slots):
+                    infos.append(reset_into(env, buffer, slot,
+                                            None if data is None else data + slot))
+                connection.send(infos)
+            elif command == "step":
+                results = []
+                for env, slot, action in zip(envs, slots, data):
+                    results.append(step_into(env, buffer, slot, action))
+                connection.send(results)
+            elif command == "close":
+                break
+    finally:
+        for env in envs:
+            env.close()
+        # Drop every view of the block before closing it
+        envs.clear()
+        del buffer
+        memory.close()
+        connection.close()
+
+
+def make_env(env_kwargs, buffer, slot):
+    """
+    Create the env for buffer[slot]; pixel envs render straight into the slot.
+    """
+    if env_kwargs.get("obs_type") == PIXELS:
+        return BreakoutEnv(pixel_buffer=buffer[slot], **env_kwargs)
+    return BreakoutEnv(**env_kwargs)
+
+
+def reset_into(env, buffer, slot, seed=None):
+    """
+    Reset one env and write its observation into buffer[slot]. Returns the info.
+    """
+    obs, info = env.reset(seed)
+    if obs is not env.frame:
+        buffer[slot] = obs
+    return info
+
+
+def step_into(env, buffer, slot, action):
+    """
+    Step one env, write its observation into buffer[slot] and reset it when the
+    episode ends. Returns (reward, terminated, truncated, info).
+    """
+    obs, reward, terminated, truncated, info = env.step(action)
+    if terminated or truncated:
+        info["final_info"] = env.info([])
+        reset_into(env, buffer, slot)
+    elif obs is not env.frame:
+        buffer[slot] = obs
+    return reward, terminated, truncated, info
+
+
+class VectorEnv:
+    """
+    num_envs BreakoutEnvs stepped together, with batched observations.
+
+    Episodes that end are reset automatically; the returned observation for that env is
+    the first one of the new episode and info["final_info"] holds the finished game's
+    score, lives and level.
+
+    The "sync" backend steps every env in this process. The "subprocess" backend splits
+    them over worker processes, which write observations straight into a shared memory
+    block (pixel envs render into it directly); only actions, rewards and infos travel
+    through pipes.
+    """
+
+    def __init__(self, num_envs, backend="sync", workers=None, **env_kwargs):
+        """
+        Args:
+            num_envs (int): Number of environments.
+            backend (str, optional): "sync" or "subprocess". Defaults to "sync".
+            workers (int, optional): Worker processes for the subprocess backend.
+                Defaults to min(num_envs, number of CPUs).
+            **env_kwargs: Passed to every BreakoutEnv.
+        """
+        if backend not in ("sync", "subprocess"):
+            raise ValueError(f"Unknown backend: {backend}")
+        self.num_envs = num_envs
+        self.backend = backend
+        probe = BreakoutEnv(**env_kwargs)
+        self.observation_shape = probe.observation_shape
+        self.observation_dtype = probe.observation_dtype
+        shape = (num_envs,) + self.observation_shape
+
+        self.memory = None
+        self.processes = []
+        self.connections = []
+        self.envs = []
+        if backend == "sync":
+            self.observations = np.zeros(shape, dtype=self.observation_dtype)
+            self.envs = [make_env(env_kwargs, self.observations, slot)
+                         for slot in range(num_envs)]
+            return
+
+        size = int(np.prod(shape)) * np.dtype(self.observation_dtype).itemsize
+        self.memory = shared_memory.SharedMemory(create=True, size=size)
+        self.observations = np.ndarray(shape, dtype=self.observation_dtype,
+                                       buffer=self.memory.buf)
+        workers = min(num_envs, workers or os.cpu_count() or 1)
+        self.slots = np.array_split(np.arange(num_envs), workers)
+        for slots in self.slots:
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=env_worker, daemon=True,
+                args=(child, slots.tolist(), self.memory.name, shape,
+                      self.observation_dtype, env_kwargs))
+            process.start()
+            child.close()
+            self.processes.append(process)
+            self.connections.append(parent)
+
+    def reset(self, seed=None):
+        """
+        Reset every env.
+
+        Args:
+            seed (int, optional): Seeds env i with seed + i (see BreakoutEnv.reset()).
+
+        Returns:
+            tuple: (observations, infos). observations has shape
+            (num_envs, *observation_shape) and is overwritten by the next call.
+        """
+        if self.backend == "sync":
+            infos = [reset_into(env, self.observations, slot,
+                                None if seed is None else seed + slot)
+                     for slot, env in enumerate(self.envs)]
+            return self.observations, infos
+
+        for connection in self.connections:
+            connection.send(("reset", seed))
+        infos = []
+        for connection in self.connections:
+            infos.extend(connection.recv())
+        return self.observations, infos
+
+    def step(self, actions):
+        """
+        Step every env with its action.
+
+        Args:
+            actions (sequence): One action per env.
+
+        Returns:
+            tuple: (observations, rewards, terminated, truncated, infos) with one entry
+            per env. observations is overwritten by the next call.
+        """
+        if self.backend == "sync":
+            results = [step_into(env, self.observations, slot, action)
+                       for slot, (env, action) in enumerate(zip(self.envs, actions))]
+        else:
+            actions = np.asarray(actions)
+            for connection, slots in zip(self.connections, self.slots):
+                connection.send(("step", actions[slots].tolist()))
+            results = []
+            for connection in self.connections:
+                results.extend(connection.recv())
+
+        rewards, terminated, truncated, infos = zip(*results)
+        return (self.observations, np.array(rewards, dtype=np.int64),
+                np.array(terminated), np.array(truncated), list(infos))
+
+    def close(self):
+        """Stop the workers and free the shared memory."""
+        for env in self.envs:
+            env.close()
+        for connection in self.connections:
+            connection.send(("close", None))
+            connection.close()
+        for process in self.processes:
+            process.join()
+        self.connections = []
+        self.processes = []
+        if self.memory is not None:
+            self.observations = None
+            self.memory.close()
+            self.memory.unlink()
+            self.memory = None
@@ -0,0 +1,377 @@
+"""Array-backed brick field for the Breakout game.
+
+BrickField stores the whole brick grid as a few NumPy arrays (brick type, alive state,
+animation timers and shake offsets) instead of one sprite per brick, so a grid of
+thousands of bricks costs a few kilobytes and can be snapshotted with a handful of array
+copies. BrickLayer renders the field into one cached surface and only redraws the cells
+that changed, so drawing the bricks is a single blit whatever the grid size.
+"""
+import random
+import numpy as np
+import pygame
+from bricks import (
+    BRICK_WIDTH, BRICK_HEIGHT, BRICK_SPACING, BRICK_PADDING_LEFT, BRICK_PADDING_TOP,
+    brick_colors,
+)
+from particles import PARTICLE_COUNT, PARTICLE_LIFE, PARTICLE_RADIUS, PARTICLE_SPEED
+
+# pylint: disable=no-member
+
+# Brick type of a cell with no brick
+EMPTY = -1
+
+# How a brick is drawn: its color, inverted while flashing, black once faded
+LOOK_NORMAL = 0
+LOOK_FLASH = 1
+LOOK_FADED = 2
+
+# Furthest a shaking brick moves from its resting position
+SHAKE_OFFSET = 2
+
+# Brick hit effects, in 60 FPS frames
+FLASH_FRAMES = 5
+SHAKE_FRAMES = 10
+
+
+class BrickField:
+    """
+    Grid of bricks stored as arrays indexed by (row, column).
+
+    A brick is alive until it is hit, then animates (flash, shake, particle fade) and is
+    removed. Only animating cells are touched by update(); cells whose appearance
+    changed are collected in self.changed for BrickLayer.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, kinds, types=None, origin=(BRICK_PADDING_LEFT, BRICK_PADDING_TOP),
+                 rng=None):
+        """
+        Args:
+            kinds (array-like): 2-D grid of brick types (indexes into types), EMPTY for
+                cells without a brick.
+            types (list, optional): {"color", "score"} dicts. Defaults to brick_colors.
+            origin (tuple, optional): Screen position of the top-left cell.
+            rng (optional): Random source for the shake (e.g. a seeded random.Random).
+        """
+        self.types = types if types is not None else brick_colors
+        self.colors = [tuple(info["color"]) for info in self.types]
+        self.flash_colors = [tuple(255 - c for c in color) for color in self.colors]
+        self.scores = [info["score"] for info in self.types]
+        self.origin_x, self.origin_y = origin
+        self.pitch_x = BRICK_WIDTH + BRICK_SPACING
+        self.pitch_y = BRICK_HEIGHT + BRICK_SPACING
+        self.rng = rng if rng is not None else random
+
+        self.kind = np.array(kinds, dtype=np.int8)
+        self.rows, self.columns = self.kind.shape
+        self.alive = self.kind != EMPTY  # can still be hit
+        self.present = self.alive.copy()  # still drawn (alive or animating)
+        self.flash = np.zeros(self.kind.shape)
+        self.shake = np.zeros(self.kind.shape)
+        self.particle = np.zeros(self.kind.shape)
+        self.look = np.zeros(self.kind.shape, dtype=np.uint8)
+        self.offset = np.zeros(self.kind.shape + (2,), dtype=np.int8)
+        self.remaining = int(self.present.sum())
+        self.active = set()  # (row, column) of animating bricks
+        self.changed = set()  # cells drawn differently since BrickLayer last synced
+        self.generation = 0  # bumped when every cell may have changed (restore)
+
+    @staticmethod
+    def layout(screen_width, rows_per_color=2, types=None):
+        """
+        Brick types of the standard layout: rows_per_color rows of each type, as many
+        columns as fit the screen.
+        """
+        types = types if types is not None else brick_colors
+        columns = (screen_width - BRICK_PADDING_LEFT * 2 +
+                   BRICK_SPACING) // (BRICK_WIDTH + BRICK_SPACING)
+        row_kinds = np.repeat(np.arange(len(types)), rows_per_color)
+        return np.repeat(row_kinds[:, None], columns, axis=1)
+
+    @staticmethod
+    def rows_above(bottom):
+        """
+        Number of brick rows that fit between the top of the field and the y coordinate
+        bottom (e.g. the paddle's top, below which a brick could never be hit).
+        """
+        return (bottom - BRICK_PADDING_TOP + BRICK_SPACING) // (BRICK_HEIGHT + BRICK_SPACING)
+
+    @classmethod
+    def grid(cls, screen_width, rows_per_color=2, types=None, rng=None):
+        """
+        A field with the standard layout (see layout()).
+        """
+        return cls(cls.layout(screen_width, rows_per_color, types), types, rng=rng)
+
+    @classmethod
+    def empty(cls, shape, types=None, rng=None):
+        """
+        A field of the given (rows, columns) shape with no bricks, to fill with fill_row().
+        """
+        return cls(np.full(shape, EMPTY), types, rng=rng)
+
+    def __len__(self):
+        """Number of bricks still on the field (alive or animating)."""
+        return self.remaining
+
+    def cell_rect(self, cell):
+        """Resting screen rect of the brick in a cell."""
+        row, column = cell
+        return pygame.Rect(self.origin_x + column * self.pitch_x,
+                           self.origin_y + row * self.pitch_y, BRICK_WIDTH, BRICK_HEIGHT)
+
+    def brick_rect(self, cell):
+        """Screen rect of the brick in a cell, including its shake offset."""
+        offset_x, offset_y = self.offset[cell]
+        return self.cell_rect(cell).move(int(offset_x), int(offset_y))
+
+    def shake_rect(self, cell):
+        """Screen area the brick in a cell may cover while shaking."""
+        return self.cell_rect(cell).inflate(SHAKE_OFFSET * 2, SHAKE_OFFSET * 2)
+
+    def dirty_rect(self, cell):
+        """Screen area covered by a brick, its shake and its particles."""
+        area = self.shake_rect(cell)
+        if self.particle[cell] > 0:
+            # Furthest a particle can travel from the brick center during its life
+            reach = 2 * (PARTICLE_SPEED * PARTICLE_LIFE + PARTICLE_RADIUS + 1)
+            center = self.cell_rect(cell).center
+            area.union_ip(pygame.Rect(0, 0, reach, reach).move(
+                center[0] - reach // 2, center[1] - reach // 2))
+        return area
+
+    def bounds(self):
+        """Screen area any brick of the field may cover."""
+        return pygame.Rect(self.origin_x, self.origin_y,
+                           self.columns * self.pitch_x - BRICK_SPACING,
+                           self.rows * self.pitch_y - BRICK_SPACING).inflate(
+                               SHAKE_OFFSET * 2, SHAKE_OFFSET * 2)
+
+    def color(self, cell):
+        """Color the brick in a cell is drawn with."""
+        look = self.look[cell]
+        if look == LOOK_FLASH:
+            return self.flash_colors[self.kind[cell]]
+        if look == LOOK_FADED:
+            return (0, 0, 0)  # Fade to black after flash
+        return self.colors[self.kind[cell]]
+
+    def query(self, rect):
+        """
+        Cells of the alive bricks colliding with rect, in row-major order.
+        """
+        col_start = max(0, (rect.left - self.origin_x) // self.pitch_x)
+        col_end = min(self.columns - 1, (rect.right - 1 - self.origin_x) // self.pitch_x)
+        row_start = max(0, (rect.top - self.origin_y) // self.pitch_y)
+        row_end = min(self.rows - 1, (rect.bottom - 1 - self.origin_y) // self.pitch_y)
+        found = []
+        for row in range(row_start, row_end + 1):
+            for column in range(col_start, col_end + 1):
+                if (self.alive[row, column]
+                        and self.cell_rect((row, column)).colliderect(rect)):
+                    found.append((row, column))
+        return found
+
+    def hit(self, cell, ball, sound, particles=None):
+        """
+        Apply a ball hit to a brick (effects, sound, rally count) and return its score.
+        """
+        ball.bricks_hit_in_rally += 1
+        return self.break_brick(cell, sound, particles)
+
+    def break_brick(self, cell, sound, particles=None):
+        """
+        Break a brick (effects and sound, no rally count) and return its score.
+        """
+        # Play brick collision sound
+        sound.play_sound("brick_hit")
+
+        # Brick effects; a hit brick can't be hit again
+        self.alive[cell] = False
+        self.flash[cell] = FLASH_FRAMES
+        self.shake[cell] = SHAKE_FRAMES
+        self.particle[cell] = PARTICLE_LIFE
+        self.active.add(cell)
+
+        # Create particle burst
+        kind = self.kind[cell]
+        if particles is not None:
+            center = self.cell_rect(cell).center
+            particles.emit(center[0], center[1], self.colors[kind], PARTICLE_COUNT)
+        return self.scores[kind]
+
+    def fill_row(self, row, kinds):
+        """
+        Replace a row with new, unhit bricks (EMPTY for cells without one).
+
+        Args:
+            row (int): Row to fill.
+            kinds (array-like): Brick type of each column.
+        """
+        self.kind[row] = kinds
+        self.alive[row] = self.kind[row] != EMPTY
+        self.present[row] = self.alive[row]
+        for effect in (self.flash, self.shake, self.particle, self.look, self.offset):
+            effect[row] = 0
+        self.active.difference_update((row, column) for column in range(self.columns))
+        self.remaining = int(self.present.sum())
+        self.changed.update((row, column) for column in range(self.columns))
+
+    def animating(self):
+        """Cells of the animating bricks in row-major order."""
+        return sorted(self.active)
+
+    def update(self, step=1.0):
+        """
+        Advance the flash, shake and particle timers of the animating bricks and remove
+        the ones that finished. Timers count 60 FPS frames; step is the tick length.
+        """
+        for cell in self.animating():
+            # Flash effect
+            if self.flash[cell] > 0:
+                self.flash[cell] -= step
+                self.look[cell] = LOOK_FLASH
+            else:
+                self.look[cell] = LOOK_FADED
+
+            # Shake effect
+            if self.shake[cell] > 0:
+                self.shake[cell] -= step
+                self.offset[cell] = (self.rng.randint(-SHAKE_OFFSET, SHAKE_OFFSET),
+                                     self.rng.randint(-SHAKE_OFFSET, SHAKE_OFFSET))
+            else:
+                self.offset[cell] = (0, 0)
+
+            # Wait for the particle burst to fade before removing the brick
+            if self.particle[cell] > 0:
+                self.particle[cell] -= step
+            if self.flash[cell] <= 0 and self.shake[cell] <= 0 and self.particle[cell] <= 0:
+                self.present[cell] = False
+                self.active.discard(cell)
+                self.remaining -= 1
+            self.changed.add(cell)
+
+    def snapshot(self):
+        """
+        Copy of the field's state, for restore().
+        """
+        return {
+            "kind": self.kind.copy(), "alive": self.alive.copy(),
+            "present": self.present.copy(), "flash": self.flash.copy(),
+            "shake": self.shake.copy(), "particle": self.particle.copy(),
+            "look": self.look.copy(), "offset": self.offset.copy(),
+            "active": frozenset(self.active),
+        }
+
+    def restore(self, snapshot):
+        """
+        Return the field to a snapshot() of the same field.
+        """
+        for name in ("kind", "alive", "present", "flash", "shake", "particle", "look",
+                     "offset"):
+            getattr(self, name)[...] = snapshot[name]
+        self.active = set(snapshot["active"])
+        self.remaining = int(self.present.sum())
+        self.changed.clear()
+        self.generation += 1
+
+
+def handle_ball_field_collision(ball, field, score, sound, particles=None):
+    """
+    Checks for collisions between the ball and bricks and updates the score (the
+    original move-then-overlap check, GameSession(swept=False)).
+    """
+    # For every brick the ball hits: reverse ball's vertical direction and add points
+    for cell in field.query(ball.rect):
+        ball.speed_y *= -1
+        score += field.hit(cell, ball, sound, particles)
+    return score
+
+
+class BrickLayer:
+    """
+    Cached drawing of a BrickField over the gameplay background.
+
+    Only the cells in field.changed are redrawn; the whole layer is rebuilt when the
+    field or the background is replaced.
+    """
+
+    def __init__(self, target=None):
+        """
+        Args:
+            target (pygame.Surface, optional): Surface the layer is blitted to; the layer
+                is converted to its pixel format when a display mode is set.
+        """
+        self.target = target
+        self.field = None
+        self.background = None
+        self.generation = None
+        self.surface = None
+        self.area = None
+        self.rebuilds = 0
+        self.cells_redrawn = 0
+
+    def sync(self, field, background):
+        """
+        Bring the layer up to date with the field.
+        """
+        if (field is not self.field or background is not self.background
+                or field.generation != self.generation):
+            self.rebuild(field, background)
+        else:
+            for cell in field.changed:
+                self.draw_cell(cell)
+            self.cells_redrawn += len(field.changed)
+        field.changed.clear()
+
+    def rebuild(self, field, background):
+        """
+        Draw every brick of the field into a new layer surface.
+        """
+        self.field = field
+        self.background = background
+        self.generation = field.generation
+        self.area = field.bounds().clip(background.get_rect())
+        surface = pygame.Surface(self.area.size)
+        if (self.target is not None and pygame.display.get_init()
+                and pygame.display.get_surface() is not None):
+            surface = surface.convert(self.target)
+        self.surface = surface
+        surface.blit(background, (0, 0), self.area)
+        for row, column in zip(*np.nonzero(field.present)):
+            cell = (int(row), int(column))
+            surface.fill(field.color(cell), field.brick_rect(cell).move(
+                -self.area.x, -self.area.y))
+        self.rebuilds += 1
+
+    def draw_cell(self, cell):
+        """
+        Redraw one cell: restore the background under it, then draw its brick if present.
+        """
+        field = self.field
+        area = field.shake_rect(cell)
+        self.surface.blit(self.background, area.move(-self.area.x, -self.area.y), area)
+        if field.present[cell]:
+            self.surface.fill(field.color(cell), field.brick_rect(cell).move(
+                -self.area.x, -self.area.y))
+
+    def draw(self, screen, field, background, areas=None):
+        """
+        Draw the bricks onto the screen.
+
+        Args:
+            screen (pygame.Surface): Surface to draw on.
+            field (BrickField): The bricks.
+            background (pygame.Surface): Gameplay background behind the bricks.
+            areas (list, optional): Only copy these screen areas of the layer (for
+                dirty-rect frames). Defaults to the whole layer.
+        """
+        self.sync(field, background)
+        if areas is None:
+            screen.blit(self.surface, self.area)
+            return
+        for area in areas:
+            clipped = area.clip(self.area)
+            if clipped:
+                screen.blit(self.surface, clipped, clipped.move(-self.area.x, -self.area.y))
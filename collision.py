@@ -0,0 +1,176 @@
+"""Swept (continuous) ball collision for the Breakout game.
+
+Moves the ball along its path and finds the time of impact with the walls, the paddle
+and the bricks instead of only checking where it ends up, so a fast ball can't tunnel
+through a 20 px brick or the paddle. Long moves are split into substeps no longer than
+the ball's radius.
+"""
+import math
+import pygame
+
+# Longest distance (in ball radii) the ball moves in one substep
+MAX_SUBSTEP = 1.0
+# Safety limits for absurd speeds and pathological contact chains
+MAX_SUBSTEPS = 64
+MAX_CONTACTS = 4
+# Contacts closer together than this (fraction of a substep) count as one contact
+CONTACT_EPSILON = 1e-9
+
+
+def sweep_ball_rect(x, y, dx, dy, radius, rect):
+    """
+    Find when a ball moving from (x, y) by (dx, dy) first touches a rect.
+
+    The ball collides as its bounding square (like Ball.rect), so the test is a ray cast
+    against the rect grown by the radius on every side.
+
+    Returns:
+        tuple: (t, nx, ny) with t in [0, 1] the fraction of the move at impact and
+        (nx, ny) the outward normal of the face hit, or None if there is no contact.
+    """
+    t_enter = -math.inf
+    t_exit = math.inf
+    nx = ny = 0
+    for pos, delta, low, high, axis in (
+            (x, dx, rect.left - radius, rect.right + radius, 0),
+            (y, dy, rect.top - radius, rect.bottom + radius, 1)):
+        if delta == 0:
+            if pos <= low or pos >= high:
+                return None
+            continue
+        near = (low - pos) / delta
+        far = (high - pos) / delta
+        normal = -1 if delta > 0 else 1
+        if near > far:
+            near, far = far, near
+        if near > t_enter:
+            t_enter = near
+            nx, ny = (normal, 0) if axis == 0 else (0, normal)
+        t_exit = min(t_exit, far)
+    if t_enter > t_exit or t_exit <= 0 or t_enter > 1:
+        return None
+    # Only count contacts the ball is moving into (not ones it is leaving)
+    if nx * dx + ny * dy >= 0:
+        return None
+    return max(t_enter, 0.0), nx, ny
+
+
+def wall_contact(pos, delta, radius, low, high):
+    """
+    Time and normal of the first wall contact along one axis, or None.
+    """
+    if delta < 0 and pos - radius + delta <= low:
+        return max((low - (pos - radius)) / delta, 0.0), 1
+    if delta > 0 and pos + radius + delta >= high:
+        return max((high - (pos + radius)) / delta, 0.0), -1
+    return None
+
+
+def move_ball_swept(ball, step, bounds, paddle, bricks, sound, particles=None):
+    """
+    Move the ball for one tick with swept collision against walls, paddle and bricks.
+
+    Every contact is resolved once at its time of impact: the ball is moved to the
+    contact point, its velocity reflected off the face that was hit, and the rest of the
+    move continues from there. Bricks touched at the same moment are all scored but only
+    flip the ball once.
+
+    Args:
+        ball (Ball): The ball to move.
+        step (float): Length of the tick in 60 FPS frames.
+        bounds (tuple): (left, top, right, bottom) inner edges of the play area.
+        paddle (Paddle): The paddle.
+        bricks (BrickField): The brick field.
+        sound: Anything with play_sound(name).
+        particles (ParticlePool, optional): Pool for brick-hit particle bursts.
+
+    Returns:
+        tuple: (score gained, True if the ball bounced off the paddle).
+    """
+    left, top, right, bottom = bounds
+    radius = ball.radius
+    score = 0
+    paddle_hit = False
+
+    distance = max(abs(ball.speed_x), abs(ball.speed_y)) * step
+    substeps = min(MAX_SUBSTEPS, max(1, math.ceil(distance / (radius * MAX_SUBSTEP))))
+    fraction = step / substeps
+
+    for _ in range(substeps):
+        remaining = 1.0
+        for _ in range(MAX_CONTACTS):
+            dx = ball.speed_x * fraction * remaining
+            dy = ball.speed_y * fraction * remaining
+
+            # Find the earliest contact(s) along this move
+            best_t = 1.0
+            contacts = []
+
+            def consider(t, kind, nx, ny, target=None):
+                nonlocal best_t, contacts
+                if t < best_t - CONTACT_EPSILON:
+                    best_t = t
+                    contacts = [(kind, nx, ny, target)]
+                elif t <= best_t + CONTACT_EPSILON:
+                    contacts.append((kind, nx, ny, target))
+
+            hit = wall_contact(ball.x, dx, radius, left, right)
+            if hit:
+                consider(hit[0], "wall", hit[1], 0)
+            hit = wall_contact(ball.y, dy, radius, top, bottom)
+            if hit:
+                kind = "wall" if hit[1] > 0 else "floor"
+                consider(hit[0], kind, 0, hit[1])
+
+            hit = sweep_ball_rect(ball.x, ball.y, dx, dy, radius, paddle.rect)
+            if hit:
+                consider(hit[0], "paddle", hit[1], hit[2])
+
+            # Only bricks near the swept path
+            start = pygame.Rect(0, 0, radius * 2, radius * 2)
+            start.center = (ball.x, ball.y)
+            path = start.union(start.move(dx, dy)).inflate(4, 4)
+            for cell in bricks.query(path):
+                hit = sweep_ball_rect(ball.x, ball.y, dx, dy, radius, bricks.cell_rect(cell))
+                if hit:
+                    consider(hit[0], "brick", hit[1], hit[2], cell)
+
+            # Move to the contact (or the end of the move)
+            ball.x += dx * best_t
+            ball.y += dy * best_t
+            if not contacts:
+                break
+
+            flip_x = flip_y = False
+            for kind, nx, ny, target in contacts:
+                if kind == "floor":
+                    ball.bottom_hit = True
+                    ball.record_position()
+                    return score, paddle_hit
+                if nx:
+                    flip_x = nx
+                if ny:
+                    flip_y = ny
+                if kind == "wall":
+                    sound.play_sound("wall_hit")
+                elif kind == "brick":
+                    score += bricks.hit(target, ball, sound, particles)
+
+            # One reflection per contact, however many bricks it touched
+            if flip_x:
+                ball.speed_x = abs(ball.speed_x) * flip_x
+            if flip_y:
+                ball.speed_y = abs(ball.speed_y) * flip_y
+
+            if any(kind == "paddle" for kind, _, _, _ in contacts):
+                sound.play_sound("paddle_hit")
+                if flip_y < 0:
+                    ball.steer_from_paddle(paddle.rect)
+                # Trigger the paddle shake
+                paddle.shake()
+                paddle_hit = True
+
+            remaining *= 1.0 - best_t
+
+    ball.record_position()
+    return score, paddle_hit
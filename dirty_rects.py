@@ -0,0 +1,121 @@
+"""Dirty-rectangle tracking for the Breakout game.
+
+Keeps track of the screen regions that changed since the last frame so only
+those regions are restored, redrawn and pushed with pygame.display.update(rects).
+Falls back to a full redraw and pygame.display.flip() whenever the screen layout changes.
+"""
+import pygame
+
+
+class DirtyRectTracker:
+    """
+    Tracks moving objects between frames and pushes only the changed screen regions.
+
+    Dynamic rects (ball, paddle, particles, animating bricks) are restored from the
+    background on the next frame. Static rects (HUD text that changed) are only pushed
+    for the frame in which they were redrawn.
+    """
+
+    def __init__(self, screen, enabled=True):
+        """
+        Args:
+            screen (pygame.Surface): The display surface.
+            enabled (bool, optional): When False every frame is a full redraw. Defaults to True.
+        """
+        self.screen = screen
+        self.enabled = enabled
+        self.full = True
+        self.key = None
+        self.force_full = True
+        self.previous = []
+        self.current = []
+        self.static = []
+        # Stats for measuring the savings
+        self.frames = 0
+        self.full_frames = 0
+        self.area_pushed = 0
+        self.last_area = 0
+
+    def begin_frame(self, key, allow_dirty=True):
+        """
+        Start a new frame and decide whether it can be drawn with dirty rects.
+
+        Args:
+            key (tuple): Anything that changes the screen layout (state, paused, level...).
+                A new key forces a full redraw.
+            allow_dirty (bool, optional): False forces a full redraw for this frame.
+
+        Returns:
+            bool: True if only dirty regions should be redrawn this frame.
+        """
+        self.full = (not self.enabled or not allow_dirty
+                     or self.force_full or key != self.key)
+        self.key = key
+        self.force_full = False
+        self.current = []
+        self.static = []
+        return not self.full
+
+    def invalidate(self):
+        """
+        Force the next frame to be a full redraw.
+        """
+        self.force_full = True
+
+    def restore(self, background):
+        """
+        Copy the background over every region that was dynamic last frame.
+
+        Returns:
+            list: The restored rects.
+        """
+        for rect in self.previous:
+            self.screen.blit(background, rect, rect)
+        return self.previous
+
+    def add(self, rect):
+        """
+        Mark a region drawn by a moving object this frame; it is restored next frame.
+        """
+        self.current.append(pygame.Rect(rect))
+
+    def add_static(self, rect):
+        """
+        Mark a region redrawn this frame that does not need restoring next frame.
+        """
+        self.static.append(pygame.Rect(rect))
+
+    def touches_previous(self, rect):
+        """
+        Return True if the rect overlaps any region restored this frame.
+        """
+        return rect.collidelist(self.previous) != -1
+
+    def present(self):
+        """
+        Push the frame to the display and record how much screen area was pushed.
+        """
+        if self.full:
+            pygame.display.flip()
+            area = self.screen.get_width() * self.screen.get_height()
+            self.full_frames += 1
+        else:
+            screen_rect = self.screen.get_rect()
+            rects = [r.clip(screen_rect) for r in self.previous + self.current + self.static]
+            pygame.display.update(rects)
+            area = sum(r.width * r.height for r in rects)
+        self.previous = self.current
+        self.frames += 1
+        self.last_area = area
+        self.area_pushed += area
+
+    def report(self):
+        """
+        Return a one-line summary of the average screen area pushed per frame.
+        """
+        if not self.frames:
+            return "dirty rects: no frames rendered"
+        screen_area = self.screen.get_width() * self.screen.get_height()
+        average = self.area_pushed / self.frames
+        return (f"dirty rects: {self.frames} frames, {self.full_frames} full redraws, "
+                f"avg {average:.0f} px/frame ({100 * average / screen_area:.1f}% of screen)")
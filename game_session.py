@@ -0,0 +1,549 @@
+"""Headless game session for the Breakout game.
+
+Holds all game state (score, lives, level, paddle, ball and bricks) and advances it one
+frame at a time from recorded inputs. Nothing in this module opens a window, plays audio
+or waits on a clock, so sessions can be simulated as fast as the CPU allows.
+"""
+import random
+import numpy as np
+import pygame
+from paddle import Paddle
+from ball import Ball
+from brick_field import BrickField, handle_ball_field_collision
+from particles import ParticlePool
+from collision import move_ball_swept
+from multiball import BallPool, PowerUps, POWERUP_CHANCE
+
+# pylint: disable=no-member
+
+# Constants
+SCREEN_WIDTH = 550
+SCREEN_HEIGHT = 600
+FPS = 60
+BORDER_MARGIN = 25  # Margin for the white border around the game area
+BORDER_THICKNESS = 4  # Thickness of the white border
+
+# UI Labels
+PADDING_TOP = 35
+PADDING_SIDE = 50
+
+# Colors
+WHITE = (255, 255, 255)  # for the text and ball
+BLACK = (0, 0, 0)  # for the background
+RED = (232, 20, 5)  # for the bricks
+YELLOW = (232, 228, 5)  # for the bricks
+GREEN = (11, 230, 62)  # for the bricks
+BLUE = (34, 147, 240)  # for the paddle
+
+# Game states
+WELCOME = "welcome"
+GAMEPLAY = "gameplay"
+GAME_OVER = "game_over"
+LIFE_LOST = "life_lost"
+LEVEL_COMPLETE = "level_complete"
+
+# Length of the level complete transition in main.py, in milliseconds. The message is
+# shown over an empty field for the first half, then the next level's rows appear.
+LEVEL_TRANSITION_MS = 2000
+
+# Duration in milliseconds 1500 milliseconds = 1.5 seconds
+BONUS_DISPLAY_DURATION = 1500
+
+
+class FrameInput:
+    """
+    Player input for a single frame: the held movement keys and the keys pressed this frame.
+    """
+
+    __slots__ = ("left", "right", "presses")
+
+    def __init__(self, left=False, right=False, presses=()):
+        """
+        Args:
+            left (bool, optional): True while a move-left key is held.
+            right (bool, optional): True while a move-right key is held.
+            presses (iterable, optional): (key, unicode) pairs for each KEYDOWN this frame.
+        """
+        self.left = left
+        self.right = right
+        self.presses = list(presses)
+
+    @classmethod
+    def from_pygame(cls, events, keys):
+        """
+        Build the input for this frame from pygame events and pygame.key.get_pressed().
+        """
+        presses = [(event.key, event.unicode) for event in events
+                   if event.type == pygame.KEYDOWN]
+        return cls(keys[pygame.K_LEFT] or keys[pygame.K_a],
+                   keys[pygame.K_RIGHT] or keys[pygame.K_d],
+                   presses)
+
+
+class EventQueue:
+    """
+    Collects the events raised during a step.
+
+    Stands in for the SoundManager inside the game objects, so every play_sound call
+    becomes an event for the caller to play (or ignore when headless).
+    """
+
+    def __init__(self):
+        self.events = []
+
+    def play_sound(self, name):
+        """
+        Record a sound effect event.
+        """
+        self.events.append(name)
+
+    def emit(self, name):
+        """
+        Record a game event (e.g. 'quit', 'stop_music', 'level_complete').
+        """
+        self.events.append(name)
+
+
+class GameSession:
+    """
+    A single game of Breakout, advanced one fixed-length tick at a time with step().
+
+    Speeds and animation timers are defined per 60 FPS frame and scaled to the tick rate,
+    so the game plays the same at any tick rate. The session never draws; see
+    renderer.Renderer for turning a session into pixels.
+    """
+
+    def __init__(self, screen_width=SCREEN_WIDTH, screen_height=SCREEN_HEIGHT,
+                 scoreboard=None, hardmode=False, tick_rate=FPS, swept=True, seed=None,
+                 level_transition_ms=0, levels=None, multiball=False, rows_per_color=2):
+        """
+        Args:
+            screen_width (int, optional): Width of the game screen.
+            screen_height (int, optional): Height of the game screen.
+            scoreboard (Scoreboard, optional): Leaderboard used for high-score entry.
+                Without one, game over never asks for initials.
+            hardmode (bool, optional): Start with hard mode enabled.
+            tick_rate (int, optional): Ticks per second simulated by step(). Defaults to FPS.
+            swept (bool, optional): Use swept collision with substeps so fast balls can't
+                tunnel through bricks or the paddle. False uses the original
+                move-then-overlap checks. Defaults to True.
+            seed (int, optional): Seed for the brick shake and particle bursts. Two
+                sessions with the same seed and inputs play out identically. Defaults to
+                a random seed (kept in self.seed so the session can be replayed).
+            level_transition_ms (int, optional): Game time spent in the LEVEL_COMPLETE
+                state between levels, building the next level row by row. 0 starts the
+                next level on the tick after the last brick goes (or when the caller
+                calls start_next_level()). Defaults to 0.
+            levels (level_pack.LevelPack, optional): Levels to play, in order, starting
+                over after the last one. Defaults to the standard layout on every level.
+            multiball (bool, optional): Multi-ball mode: broken bricks can drop a
+                capsule that splits every ball in play into three (see multiball.py).
+                A life is only lost with the last ball. Defaults to False.
+            rows_per_color (int, optional): Brick rows of each color in the standard
+                layout (levels without a level pack). Defaults to 2.
+        """
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.scoreboard = scoreboard
+        self.hardmode = hardmode
+
+        self.current_state = WELCOME
+        self.ball_active = False
+        self.paused = False
+        self.initials_entered = False
+        self.player_initials = ""
+        self.input_active = False
+        self.initials_ready = False
+
+        self.score = 0
+        self.lives = 0
+        self.current_level = 1
+        self.bonus_message = ""
+        self.bonus_timer = 0
+        self.level_cleared = False
+        self.level_transition_ms = level_transition_ms
+        self.transition_start = 0
+        self.next_layout = None  # brick types of the level being built
+        self.rows_built = 0
+        self.levels = levels
+        self.rows_per_color = rows_per_color
+        self.brick_types = levels.types if levels is not None else None
+
+        # Game time in milliseconds, advanced by one tick per step
+        self.tick_rate = tick_rate
+        self.swept = swept
+        self.step_scale = FPS / tick_rate  # tick length in 60 FPS frames
+        self.frame = 0
+        self.time_ms = 0
+
+        # All randomness comes from the session seed
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(63)
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+        self.paddle = Paddle(screen_width, screen_height, BLUE,
+                             BORDER_MARGIN, BORDER_THICKNESS)
+        self.game_ball = Ball(screen_width, screen_height)
+        # Extra balls and falling capsules of multi-ball mode
+        self.multiball = multiball
+        self.balls = BallPool()
+        self.powerups = PowerUps()
+        self.bricks = self.new_field(self.current_level)
+        # One particle pool shared by every brick
+        self.particles = ParticlePool(seed=seed)
+
+    def level_layout(self, level):
+        """
+        Brick types of a level's grid: the level pack's level, or the standard layout.
+        """
+        standard = BrickField.layout(self.screen_width, self.rows_per_color)
+        if self.levels is None:
+            return standard
+        kinds = self.levels.level((level - 1) % len(self.levels)).kinds
+        columns = standard.shape[1]
+        if kinds.shape[1] > columns:
+            raise ValueError(f"Level {level} is {kinds.shape[1]} columns wide; "
+                             f"only {columns} fit the screen")
+        rows = BrickField.rows_above(self.paddle.rect.top)
+        if kinds.shape[0] > rows:
+            raise ValueError(f"Level {level} is {kinds.shape[0]} rows tall; "
+                             f"only {rows} fit above the paddle")
+        return kinds
+
+    def new_field(self, level):
+        """
+        A field holding a level's bricks.
+        """
+        return BrickField(self.level_layout(level), self.brick_types, rng=self.rng)
+
+    def start_lives(self):
+        """
+        Number of lives at the start of a game for the current mode.
+        """
+        return 1 if self.hardmode else 3
+
+    def restart(self):
+        """
+        Restart after game over: reset score, lives, paddle, ball and bricks.
+        """
+        self.score = 0
+        self.lives = self.start_lives()
+        self.paused = False  # no longer paused
+        self.ball_active = False  # wait for user to start
+        self.initials_entered = False
+        self.input_active = False
+        self.current_state = GAMEPLAY
+        self.paddle = Paddle(self.screen_width, self.screen_height, BLUE,
+                             BORDER_MARGIN, BORDER_THICKNESS)
+        self.game_ball.restart(self.screen_width, self.screen_height)
+        self.clear_multiball()
+        self.bricks = self.new_field(self.current_level)
+        self.next_layout = None
+        self.particles.clear()
+
+    def begin_level_transition(self):
+        """
+        Enter the LEVEL_COMPLETE state: the field is emptied and the next level's rows
+        are added during the transition (see update_transition()).
+        """
+        self.current_state = LEVEL_COMPLETE
+        self.transition_start = self.time_ms
+        # The ball waits at its start position while the next level is built
+        self.game_ball.restart(self.screen_width, self.screen_height)
+        self.ball_active = False
+        self.clear_multiball()
+        self.next_layout = self.level_layout(self.current_level + 1)
+        self.bricks = BrickField.empty(self.next_layout.shape, self.brick_types, rng=self.rng)
+        self.rows_built = 0
+
+    def build_rows(self, count):
+        """
+        Add the next level's rows to the field until count of them are there.
+        """
+        while self.rows_built < min(count, len(self.next_layout)):
+            self.bricks.fill_row(self.rows_built, self.next_layout[self.rows_built])
+            self.rows_built += 1
+
+    def update_transition(self):
+        """
+        Advance the level complete transition; the next level starts when it ends.
+        """
+        elapsed = self.time_ms - self.transition_start
+        if elapsed >= self.level_transition_ms:
+            self.start_next_level()
+            return
+        # Rows appear one at a time over the second half
+        half = self.level_transition_ms / 2
+        self.build_rows(int(len(self.next_layout) * max(0.0, elapsed - half) / half))
+
+    def transition_progress(self):
+        """
+        How far through the level complete transition the session is (0 to 1).
+        """
+        if self.current_state != LEVEL_COMPLETE or self.level_transition_ms <= 0:
+            return 1.0
+        return min(1.0, (self.time_ms - self.transition_start) / self.level_transition_ms)
+
+    def start_next_level(self):
+        """
+        All of the resets for completing a level.
+        """
+        self.level_cleared = False
+        self.current_level += 1
+        self.game_ball.speed_x *= 1.1
+        self.game_ball.speed_y *= 1.1
+        if self.next_layout is not None:
+            # Finish the level built during the transition
+            self.build_rows(len(self.next_layout))
+            self.next_layout = None
+            self.current_state = GAMEPLAY
+        else:
+            self.bricks = self.new_field(self.current_level)
+        self.particles.clear()
+        self.game_ball.restart(self.screen_width, self.screen_height)
+        self.clear_multiball()
+        self.ball_active = False
+        self.paused = True
+
+    def handle_key(self, key, unicode, events):
+        """
+        Apply a single key press to the game state.
+        """
+        # This is placed here to prevent p & q from messing with initials
+        if self.input_active and self.current_state == GAME_OVER:
+            if key == pygame.K_BACKSPACE:  # Backspace to remove letter
+                self.player_initials = self.player_initials[:-1]
+            elif unicode.isalpha() and len(self.player_initials) < 3:  # Allow typing of letters
+                self.player_initials += unicode.upper()
+                self.initials_ready = len(self.player_initials) == 3
+                # Automatically save when length reaches 3
+                if self.initials_ready:
+                    self.scoreboard.save_score(self.score, self.player_initials,
+                                               self.current_level)
+                    self.input_active = False
+                    self.initials_entered = True
+            return  # Needed to allow for Q and R to work
+
+        # Pause Checks
+        if key == pygame.K_p and self.current_state == GAMEPLAY and self.ball_active:
+            self.paused = not self.paused
+        # Restart after life lost
+        elif key == pygame.K_SPACE and self.current_state == LIFE_LOST:
+            self.current_state = GAMEPLAY
+            self.paused = False  # unpause when resuming
+            self.ball_active = True
+        elif key == pygame.K_SPACE:
+            if self.current_state == WELCOME:
+                events.play_sound("startup")
+                self.current_state = GAMEPLAY
+                self.ball_active = True  # start moving on gameplay load
+                self.lives = self.start_lives()
+            elif self.current_state == GAMEPLAY:
+                self.ball_active = True
+        # Restart during Game Over
+        elif key == pygame.K_r and self.current_state == GAME_OVER:
+            self.restart()
+        elif key == pygame.K_q and self.current_state == GAME_OVER:
+            events.emit("quit")
+        elif key == pygame.K_h and self.current_state == WELCOME:
+            self.hardmode = True
+
+    def step(self, inputs):
+        """
+        Advance the game by one tick.
+
+        Args:
+            inputs (FrameInput): Held keys and key presses for this tick.
+
+        Returns:
+            list: Event names raised this tick (sound effect names, 'stop_music',
+            'level_complete' and 'quit').
+        """
+        events = EventQueue()
+        self.frame += 1
+        self.time_ms = self.frame * 1000 // self.tick_rate
+
+        # Positions at the start of the tick, for interpolated drawing
+        self.game_ball.save_position()
+        self.balls.save_positions()
+        self.paddle.save_position()
+
+        # A cleared level the caller did not advance is advanced here
+        if self.level_cleared and self.current_state != LEVEL_COMPLETE:
+            self.start_next_level()
+
+        for key, unicode in inputs.presses:
+            self.handle_key(key, unicode, events)
+
+        # If score doesn't reach top 10, it will skip initial inputs
+        if self.input_active and self.current_state == GAME_OVER:
+            self.input_active = self.scoreboard.top_scores(self.score)
+
+        # Handle continuous key presses for paddle movement
+        if not self.paused and self.current_state == GAMEPLAY:
+            if inputs.left:
+                self.paddle.move_left(self.step_scale)
+            if inputs.right:
+                self.paddle.move_right(self.step_scale)
+
+        if self.current_state in (GAMEPLAY, LIFE_LOST):
+            self.update_play(events)
+        elif self.current_state == LEVEL_COMPLETE:
+            self.update_transition()
+
+        return events.events
+
+    def play_bounds(self):
+        """
+        Inner edges (left, top, right, bottom) the ball bounces off, as in Ball.bounce_walls.
+        """
+        return (BORDER_MARGIN + BORDER_THICKNESS,
+                BORDER_MARGIN + BORDER_THICKNESS + PADDING_SIDE,
+                self.screen_width - BORDER_THICKNESS - BORDER_MARGIN,
+                self.screen_height - BORDER_THICKNESS - BORDER_MARGIN)
+
+    def end_rally(self):
+        """
+        The ball returned to the paddle: award the rally bonus and reset the count.
+        """
+        ball = self.game_ball
+        self.award_rally(ball.bricks_hit_in_rally)
+
+        # Reset the rally count
+        ball.bricks_hit_in_rally = 0
+
+    def award_rally(self, bricks_hit):
+        """
+        Award the rally bonus for a ball that hit bricks_hit bricks before the paddle.
+        """
+        # Bonus logic: award bonus if 3 or more bricks are hit before paddle
+        if bricks_hit >= 3:
+            bonus = 100 + 50 * (bricks_hit - 3)
+            self.score += bonus
+            self.bonus_message = f"Bonus! +{bonus}"
+            self.bonus_timer = self.time_ms
+
+    def clear_multiball(self):
+        """
+        Remove the extra balls and falling capsules.
+        """
+        self.balls.clear()
+        self.powerups.clear()
+
+    def update_multiball(self, events, was_alive):
+        """
+        Move the extra balls, drop capsules from the bricks broken this tick (alive in
+        was_alive, a copy of bricks.alive from before the balls moved) and split the
+        balls when the paddle catches one.
+        """
+        gained, rallies, lost = self.balls.step(
+            self.step_scale, self.play_bounds(), self.paddle, self.bricks, events,
+            self.particles)
+        self.score += gained
+        # Each extra ball has its own rally; only long rallies earn a bonus
+        for bricks_hit in rallies[rallies >= 3].tolist():
+            self.award_rally(bricks_hit)
+        if lost:
+            events.play_sound("floor_hit")
+
+        for row, column in np.argwhere(was_alive & ~self.bricks.alive).tolist():
+            if self.rng.random() < POWERUP_CHANCE:
+                self.powerups.drop(self.bricks.cell_rect((row, column)).center)
+        caught = self.powerups.update(self.step_scale, self.paddle.rect,
+                                      self.play_bounds()[3])
+        if caught:
+            events.play_sound("powerup")
+        # Every capsule caught splits every ball, even two caught on the same tick
+        for _ in range(caught):
+            self.balls.split(self.game_ball)
+
+    def promote_ball(self):
+        """
+        The main ball was lost while extra balls are in play: the oldest extra ball
+        becomes the main ball.
+        """
+        ball = self.game_ball
+        ball.x, ball.y, ball.speed_x, ball.speed_y, ball.bricks_hit_in_rally = (
+            self.balls.take(0))
+        ball.save_position()
+        ball.trail.clear()
+        ball.record_position()
+        ball.bottom_hit = False
+
+    def update_play(self, events):
+        """
+        Update bricks, the bonus message and the ball during gameplay.
+        """
+        self.bricks.update(self.step_scale)
+        self.particles.update(self.step_scale)
+
+        # Hide the bonus message after 1.5 seconds
+        if self.bonus_message and self.time_ms - self.bonus_timer >= BONUS_DISPLAY_DURATION:
+            self.bonus_message = ""
+
+        if self.current_state != GAMEPLAY or self.paused or not self.ball_active:
+            return
+
+        ball = self.game_ball
+        # Bricks alive before any ball moved, to find the ones broken this tick
+        was_alive = self.bricks.alive.copy() if self.multiball else None
+        if self.swept:
+            gained, paddle_hit = move_ball_swept(
+                ball, self.step_scale, self.play_bounds(), self.paddle,
+                self.bricks, events, self.particles)
+            self.score += gained
+            if paddle_hit:
+                self.end_rally()
+        else:
+            ball.move(self.step_scale)
+            ball.bounce_walls(self.screen_width, self.screen_height, BORDER_MARGIN,
+                              BORDER_THICKNESS, PADDING_SIDE, events)
+            if ball.rect.colliderect(self.paddle.rect):
+                ball.bounce_paddle(self.paddle.rect, self.paddle, events)
+                self.end_rally()
+
+            # Check if the ball hit any bricks
+            self.score = handle_ball_field_collision(
+                ball, self.bricks, self.score, events, self.particles)
+
+        if self.multiball:
+            self.update_multiball(events, was_alive)
+
+        # Life update
+        if ball.bottom_hit and len(self.balls):
+            # Not the last ball: play on with another one
+            events.play_sound("floor_hit")
+            self.promote_ball()
+        elif ball.bottom_hit:
+            # Sound when ball hits the bottom
+            events.play_sound("floor_hit")
+            events.play_sound("life_lost")  # Sound when a life is lost
+            self.lives -= 1
+            ball.restart(self.screen_width, self.screen_height)
+            self.powerups.clear()
+            ball.bottom_hit = False
+            if self.lives > 0:
+                self.current_state = LIFE_LOST
+                self.paused = False  # don't move until user resumes
+            else:
+                events.play_sound("game_over")
+                events.emit("stop_music")
+                self.current_state = GAME_OVER
+                self.initials_entered = False
+                self.player_initials = ""
+
+                # Only activate input if score qualifies (on this mode's board)
+                self.input_active = False
+                if self.scoreboard is not None:
+                    self.scoreboard.set_mode(self.hardmode)
+                    if self.scoreboard.top_scores(self.score):
+                        self.scoreboard.new_initials(self.score)
+                        self.input_active = True
+
+        # Level complete: play the transition, or leave it to the caller without one
+        if len(self.bricks) == 0:
+            self.level_cleared = True
+            events.emit("level_complete")
+            if self.level_transition_ms > 0:
+                self.begin_level_transition()
@@ -0,0 +1,63 @@
+"""Cache of pre-composited static screen layers for the Breakout game.
+
+Content that almost never changes (the border, the HUD underline, the welcome screen
+text, the game over title and footer) is drawn once into an off-screen surface in the
+display's pixel format. Each frame then starts with a single blit of the layer, which is
+only rebuilt when the inputs it was drawn from (its key) change.
+"""
+import pygame
+
+# pylint: disable=no-member
+
+
+class LayerCache:
+    """
+    Named off-screen layers, each rebuilt only when its key changes.
+    """
+
+    def __init__(self, target):
+        """
+        Args:
+            target (pygame.Surface): The surface layers are blitted to; layers are
+                converted to its pixel format so blitting them is a plain copy.
+        """
+        self.target = target
+        self.layers = {}  # name -> (key, surface)
+        self.rebuilds = {}  # name -> number of times the layer was drawn
+
+    def get(self, name, key, build):
+        """
+        Return the layer called name, drawing it first if key differs from last time.
+
+        Args:
+            name (str): Layer name.
+            key (tuple): Everything the layer's contents depend on (size, mode...).
+            build (callable): Draws the layer onto the surface it is given.
+
+        Returns:
+            pygame.Surface: The layer, the same size as the target.
+        """
+        cached = self.layers.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        surface = pygame.Surface(self.target.get_size())
+        build(surface)
+        # Match the display format (only possible once a display mode is set)
+        if pygame.display.get_init() and pygame.display.get_surface() is not None:
+            surface = surface.convert(self.target)
+        self.layers[name] = (key, surface)
+        self.rebuilds[name] = self.rebuilds.get(name, 0) + 1
+        return surface
+
+    def blit(self, name, key, build):
+        """
+        Draw the layer over the whole target (see get()).
+        """
+        self.target.blit(self.get(name, key, build), (0, 0))
+
+    def clear(self):
+        """
+        Drop every layer so each one is rebuilt on next use.
+        """
+        self.layers.clear()
@@ -0,0 +1,267 @@
+"""Level packs for the Breakout game.
+
+A level pack holds any number of authored levels and the brick types they use in one
+compact binary file. Opening a pack maps the file into memory and reads only its header
+and brick types; a level's bytes are decoded when that level is asked for, so a pack of
+hundreds of levels opens as fast as a pack of one.
+
+File layout (little-endian):
+    magic b"BKLP", version (u8), brick type count (u8), level count (u16),
+    brick types: (red, green, blue (u8 each), score (u16)) each,
+    offset table: (level count + 1) u32 file offsets; level i spans offsets i to i + 1,
+    levels: rows (u8), columns (u8), name length (u8), UTF-8 name, then rows * columns
+    brick type bytes in row-major order (255 = no brick).
+
+Packs are built from a JSON source that is easy to edit by hand:
+
+    {
+        "types": [{"key": "G", "color": [11, 230, 62], "score": 1}, ...],
+        "levels": [{"name": "Classic", "rows": ["GGGGG", "G.G.G"]}, ...]
+    }
+
+Each row is a string with one character per column: a type's key, or "." or " " for
+no brick. "types" defaults to the standard green (G), yellow (Y) and red (R) bricks.
+A level can be at most MAX_COLUMNS wide, the columns of the standard layout on the
+game's screen, and at most MAX_ROWS tall, the rows that fit above the paddle; bigger
+levels would have bricks the ball can't reach.
+
+Usage:
+    python level_pack.py levels.json levels.bkl
+    python level_pack.py --info levels.bkl
+"""
+import argparse
+import json
+import mmap
+import struct
+import numpy as np
+from bricks import brick_colors
+from brick_field import BrickField, EMPTY
+from game_session import SCREEN_WIDTH, SCREEN_HEIGHT
+from paddle import Paddle
+
+MAGIC = b"BKLP"
+VERSION = 1
+HEADER = struct.Struct("<4sBBH")
+BRICK_TYPE = struct.Struct("<BBBH")
+OFFSET = struct.Struct("<I")
+LEVEL_HEADER = struct.Struct("<BBB")
+
+# Brick type byte of a cell without a brick
+NO_BRICK = 255
+# Most brick types a pack can have (BrickField keeps types in int8)
+MAX_TYPES = 127
+# Widest level: the columns that fit between the game screen's walls
+MAX_COLUMNS = BrickField.layout(SCREEN_WIDTH).shape[1]
+# Tallest level: the rows that end above the paddle on the game screen
+MAX_ROWS = BrickField.rows_above(Paddle(SCREEN_WIDTH, SCREEN_HEIGHT).rect.top)
+# Characters that mean "no brick" in a source row
+EMPTY_KEYS = ". "
+# Keys of the standard brick types, for sources without a "types" list
+DEFAULT_KEYS = "GYR"
+
+
+class Level:
+    """
+    One decoded level: its name and its grid of brick types.
+    """
+
+    def __init__(self, name, kinds):
+        """
+        Args:
+            name (str): Level name.
+            kinds (numpy.ndarray): (rows, columns) brick types, EMPTY for no brick.
+        """
+        self.name = name
+        self.kinds = kinds
+
+
+class LevelPack:
+    """
+    A level pack file, memory-mapped and decoded one level at a time.
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Level pack file (see the module docstring for the format).
+        """
+        self.path = path
+        with open(path, "rb") as file:
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self.types, self.level_count = self.read_header()
+        except (ValueError, struct.error):
+            self.data.close()
+            raise
+
+    def read_header(self):
+        """Check the header and decode the brick types."""
+        magic, version, type_count, level_count = HEADER.unpack_from(self.data)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a Breakout level pack")
+        if version != VERSION:
+            raise ValueError(f"Unsupported level pack version {version}")
+        types = []
+        for i in range(type_count):
+            red, green, blue, score = BRICK_TYPE.unpack_from(
+                self.data, HEADER.size + i * BRICK_TYPE.size)
+            types.append({"color": (red, green, blue), "score": score})
+        self.offsets_at = HEADER.size + type_count * BRICK_TYPE.size
+        return types, level_count
+
+    def __len__(self):
+        """Number of levels in the pack."""
+        return self.level_count
+
+    def level(self, index):
+        """
+        Decode one level.
+
+        Args:
+            index (int): Level index, from 0.
+
+        Returns:
+            Level: The level's name and brick types.
+        """
+        if not 0 <= index < self.level_count:
+            raise IndexError(f"Level {index} is not in {self.path}")
+        start = OFFSET.unpack_from(self.data, self.offsets_at + index * OFFSET.size)[0]
+        rows, columns, name_length = LEVEL_HEADER.unpack_from(self.data, start)
+        if columns > MAX_COLUMNS:
+            raise ValueError(f"Level {index} of {self.path} is {columns} columns wide; "
+                             f"at most {MAX_COLUMNS} fit the screen")
+        if rows > MAX_ROWS:
+            raise ValueError(f"Level {index} of {self.path} is {rows} rows tall; "
+                             f"at most {MAX_ROWS} fit above the paddle")
+        name_at = start + LEVEL_HEADER.size
+        name = self.data[name_at:name_at + name_length].decode("utf-8")
+        cells = np.frombuffer(self.data, dtype=np.uint8, count=rows * columns,
+                              offset=name_at + name_length)
+        if (cells[cells != NO_BRICK] >= len(self.types)).any():
+            raise ValueError(f"Level {index} of {self.path} uses an undefined brick type")
+        kinds = np.where(cells == NO_BRICK, EMPTY, cells).astype(np.int8)
+        return Level(name, kinds.reshape(rows, columns))
+
+    def close(self):
+        """Unmap the file."""
+        self.data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def parse_source(source):
+    """
+    Read a JSON source (as loaded by json.load) into brick types and levels.
+
+    Returns:
+        tuple: (types, levels): {"color", "score"} dicts and Level objects.
+    """
+    if "types" in source:
+        keys = [info["key"] for info in source["types"]]
+        types = [{"color": tuple(info["color"]), "score": info["score"]}
+                 for info in source["types"]]
+    else:
+        keys = list(DEFAULT_KEYS)
+        types = [dict(info) for info in brick_colors]
+    if len(types) > MAX_TYPES:
+        raise ValueError(f"A pack can have at most {MAX_TYPES} brick types")
+    index = {}
+    for i, key in enumerate(keys):
+        if len(key) != 1 or key in EMPTY_KEYS or key in index:
+            raise ValueError(f"Brick type key {key!r} must be one unique character "
+                             f"other than {EMPTY_KEYS!r}")
+        index[key] = i
+
+    levels = []
+    for number, level in enumerate(source["levels"], 1):
+        name = level.get("name", f"Level {number}")
+        rows = level["rows"]
+        columns = max((len(row) for row in rows), default=0)
+        if not 0 < len(rows) <= MAX_ROWS:
+            raise ValueError(f"{name}: a level has 1 to {MAX_ROWS} rows "
+                             f"(as many as fit above the paddle)")
+        if not 0 < columns <= MAX_COLUMNS:
+            raise ValueError(f"{name}: a level has 1 to {MAX_COLUMNS} columns "
+                             f"(as many as fit the screen)")
+        kinds = np.full((len(rows), columns), EMPTY, dtype=np.int8)
+        for row, text in enumerate(rows):
+            for column, key in enumerate(text):
+                if key in EMPTY_KEYS:
+                    continue
+                if key not in index:
+                    raise ValueError(f"{name}: unknown brick type {key!r} in row {row + 1}")
+                kinds[row, column] = index[key]
+        if not (kinds != EMPTY).any():
+            raise ValueError(f"{name}: a level needs at least one brick")
+        levels.append(Level(name, kinds))
+    return types, levels
+
+
+def build_pack(types, levels):
+    """
+    Encode brick types and levels in the level pack format.
+
+    Returns:
+        bytes: The pack file's contents.
+    """
+    if len(levels) > 0xFFFF:
+        raise ValueError("A pack can have at most 65535 levels")
+    out = bytearray(HEADER.pack(MAGIC, VERSION, len(types), len(levels)))
+    for info in types:
+        out += BRICK_TYPE.pack(*info["color"], info["score"])
+    offsets_at = len(out)
+    out += bytes(OFFSET.size * (len(levels) + 1))
+    for i, level in enumerate(levels):
+        OFFSET.pack_into(out, offsets_at + i * OFFSET.size, len(out))
+        # At most 255 bytes, without cutting a character in half
+        name = level.name.encode("utf-8")[:255].decode("utf-8", "ignore").encode("utf-8")
+        rows, columns = level.kinds.shape
+        out += LEVEL_HEADER.pack(rows, columns, len(name)) + name
+        out += np.where(level.kinds == EMPTY, NO_BRICK, level.kinds).astype(np.uint8).tobytes()
+    OFFSET.pack_into(out, offsets_at + len(levels) * OFFSET.size, len(out))
+    return bytes(out)
+
+
+def convert(source_path, pack_path):
+    """
+    Build a level pack file from a JSON source file.
+
+    Returns:
+        int: Number of levels written.
+    """
+    with open(source_path, "r", encoding="utf-8") as file:
+        types, levels = parse_source(json.load(file))
+    with open(pack_path, "wb") as file:
+        file.write(build_pack(types, levels))
+    return len(levels)
+
+
+def main():
+    """Command line entry point: convert a JSON source, or describe a pack."""
+    parser = argparse.ArgumentParser(description="Build or inspect Breakout level packs")
+    parser.add_argument("source", nargs="?", help="JSON level source")
+    parser.add_argument("pack", help="level pack file to write (or read with --info)")
+    parser.add_argument("--info", action="store_true", help="list the levels in the pack")
+    args = parser.parse_args()
+
+    if not args.info:
+        if args.source is None:
+            parser.error("a JSON source is needed to build a pack")
+        count = convert(args.source, args.pack)
+        print(f"Wrote {count} levels to {args.pack}")
+        return
+    with LevelPack(args.pack) as pack:
+        print(f"{len(pack)} levels, {len(pack.types)} brick types")
+        for i in range(len(pack)):
+            level = pack.level(i)
+            rows, columns = level.kinds.shape
+            print(f"{i + 1:>4}  {level.name}  {rows}x{columns}, "
+                  f"{int((level.kinds != EMPTY).sum())} bricks")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,378 +1,214 @@
-"""Breakout game main file: handles state switching, rendering, and input."""
+"""Breakout game main file: opens the window, reads input and runs the game loop.
+
+Game state lives in game_session.GameSession and drawing in renderer.Renderer.
+
+Startup shows the welcome screen as early as possible: only the display and the fonts
+it needs are set up before the first frame. After it, the audio device opens on a
+background thread while the scoreboard and game session are built.
+"""
+import time
+startup_started = time.perf_counter_ns()
+# pylint: disable=wrong-import-position
+import argparse
 import sys
 import pygame
-from paddle import Paddle  # Import the Paddle class
-from ball import Ball  # Import the Ball class
-# Import the Bricks class
-from bricks import create_brick_grid, handle_ball_brick_collision
 from scoreboard import Scoreboard  # Import the scoreboard class
+from score_store import SQLiteScoreStore
 from assets.sound_manager import SoundManager
+import game_session
+from game_session import (
+    GameSession, FrameInput, SCREEN_WIDTH, SCREEN_HEIGHT, FPS, LEVEL_TRANSITION_MS,
+)
+from renderer import Renderer
+from timestep import FixedTimestep
+from replay import ReplayRecorder
+from level_pack import LevelPack
+from profiler import StartupProfiler, FrameProfiler
+from brick_field import BrickField, BrickLayer
+from particles import ParticlePool
+from multiball import BallPool
+from text_renderer import TextRenderer
 
 # disable "pygame has no member" errors - it's a linter issue not a pygame issue.
-# disable "invalid-name" - the actual constants are all uppercase as per PEP 8:
-# "current_state" and "running" are not constants.
+# disable "invalid-name" - "running" is not a constant.
 # pylint: disable=no-member, invalid-name
 
-# Initialize pygame
-pygame.init()
-
-# Constants
-SCREEN_WIDTH = 550
-SCREEN_HEIGHT = 600
-FPS = 60
-BORDER_MARGIN = 25  # Margin for the white border around the game area
-BORDER_THICKNESS = 4  # Thickness of the white border
-
-# Creates and initializes the SoundManager
-sound = SoundManager()
-sound.play_sound("startup")
-sound.play_music()
-
-# Colors
-WHITE = (255, 255, 255)  # for the text and ball
-BLACK = (0, 0, 0)  # for the background
-RED = (232, 20, 5)  # for the bricks
-YELLOW = (232, 228, 5)  # for the bricks
-GREEN = (11, 230, 62)  # for the bricks
-BLUE = (34, 147, 240)  # for the paddle
-
-# Game states
-WELCOME = "welcome"
-GAMEPLAY = "gameplay"
-GAME_OVER = "game_over"
-LIFE_LOST = "life_lost"
-current_state = WELCOME
-
-# Game state variables
-ball_active = False
-initials_entered = False
-player_initials = ""
-input_active = False
-initials_ready = False
-
-# Font sizes
-FONT_SIZE_TITLE = 40
-FONT_SIZE_SUBTITLE = 20
-FONT_SIZE_CREDITS = 16
-FONT_SIZE_SCORE = 18
-
-# Setup window
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("Breakout Game")
-
-# Instantiate the paddle (for gameplay)
-paddle = Paddle(SCREEN_WIDTH, SCREEN_HEIGHT, BLUE,
-                BORDER_MARGIN, BORDER_THICKNESS)
+# Command line options
+parser = argparse.ArgumentParser(description="Breakout game")
+# Dirty-rect rendering: only redraw and push the regions that changed.
+# Full redraws are still used whenever the screen layout changes.
+parser.add_argument("--dirty-rects", action="store_true",
+                    help="only redraw and push the screen regions that changed")
+parser.add_argument("--tick-rate", type=int, default=120,
+                    help="physics ticks per second, independent of FPS (default: 120)")
+parser.add_argument("--max-catchup-ticks", type=int, default=8,
+                    help="most physics ticks run for one rendered frame (default: 8)")
+parser.add_argument("--seed", type=int, default=None,
+                    help="random seed for the game (default: a new one each run)")
+parser.add_argument("--record", metavar="PATH",
+                    help="save a replay of the game to PATH on exit (see replay.py)")
+parser.add_argument("--scores-db", metavar="PATH",
+                    help="keep every score in an SQLite database, with separate normal "
+                         "and hard mode boards, instead of scoreboard.txt")
+parser.add_argument("--sound-cache", metavar="DIR",
+                    help="keep the synthesized sound effects in DIR between runs")
+parser.add_argument("--startup-profile", action="store_true",
+                    help="print the time to first frame and how long each startup "
+                         "phase took")
+parser.add_argument("--frame-profile", metavar="CSV",
+                    help="time every frame's phases and write them to CSV "
+                         "(F3 shows the statistics on screen)")
+parser.add_argument("--levels", metavar="PACK",
+                    help="play the levels of a level pack (see level_pack.py) "
+                         "instead of the standard layout")
+parser.add_argument("--multiball", action="store_true",
+                    help="multi-ball mode: broken bricks can drop a capsule that splits "
+                         "every ball into three")
+args = parser.parse_args()
+if args.levels and args.record:
+    # Replays do not store the level pack, so they could not be played back
+    parser.error("--record cannot be used with --levels")
+
+profiler = StartupProfiler(startup_started)
+profiler.record("imports", startup_started, time.perf_counter_ns())
+
+
+def start_audio(manager):
+    """Startup sound and music, once the mixer is ready."""
+    manager.play_sound("startup")
+    manager.play_music()
+
+
+# Setup window; only the display and fonts are needed for the first frame
+with profiler.phase("display"):
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("Breakout Game")
+
+with profiler.phase("first frame"):
+    renderer = Renderer(screen, dirty_rects=args.dirty_rects)
+    renderer.draw_loading()
+    renderer.present()
+profiler.mark_first_frame()
+
+# Creates the SoundManager; the mixer opens and the sounds load on a background thread
+sound = SoundManager(cache_dir=args.sound_cache, background=True)
+sound.when_ready(start_audio)
 
 # Instantiate scoreboard
-scoreboard = Scoreboard(SCREEN_WIDTH, SCREEN_HEIGHT)
-
-# Font helper
-
-
-def render_text(text, size, color, x, y, center=True, bold=False):
-    """Render text on the screen with optional centering and bold styling."""
-    font_path = (
-        "assets/fonts/ChakraPetch-Bold.ttf"
-        if bold else "assets/fonts/ChakraPetch-Regular.ttf"
-    )
-    font = pygame.font.Font(font_path, size)
-    rendered = font.render(text, True, color)
-    rect = rendered.get_rect()
-    if center:
-        rect.center = (x, y)
-    else:
-        rect.topleft = (x, y)
-    screen.blit(rendered, rect)
-
-
-# Ball creation
-game_ball = Ball(SCREEN_WIDTH, SCREEN_HEIGHT)
-
-# Create bricks
-brick_group = create_brick_grid(SCREEN_WIDTH)
-
-# Initialize score variable
-score = 0
-hardmode = False
-lives = 0
-current_level = 1
-bonus_message = ""
-bonus_timer = 0
-# Duration in milliseconds 1500 milliseconds = 1.5 seconds
-BONUS_DISPLAY_DURATION = 1500
+with profiler.phase("scoreboard"):
+    score_store = SQLiteScoreStore(args.scores_db) if args.scores_db else None
+    scoreboard = Scoreboard(SCREEN_WIDTH, SCREEN_HEIGHT, store=score_store)
+
+# All game state lives in the session
+with profiler.phase("game session"):
+    level_pack = LevelPack(args.levels) if args.levels else None
+    session = GameSession(SCREEN_WIDTH, SCREEN_HEIGHT, scoreboard=scoreboard,
+                          tick_rate=args.tick_rate, seed=args.seed,
+                          level_transition_ms=LEVEL_TRANSITION_MS, levels=level_pack,
+                          multiball=args.multiball)
+recorder = ReplayRecorder(session) if args.record else None
+
+
+def make_frame_profiler(csv_path):
+    """Frame profiler for the main loop's phases and the game's inner work."""
+    frame_profiler = FrameProfiler(
+        ["wait", "events", "simulate", "render", "sound", "present"],
+        ["bricks", "collision", "particles", "text", "brick_layer", "particle_draw"],
+        csv_path=csv_path)
+    frame_profiler.instrument(BrickField, "update", "bricks")
+    frame_profiler.instrument(game_session, "move_ball_swept", "collision")
+    frame_profiler.instrument(game_session, "handle_ball_field_collision", "collision")
+    frame_profiler.instrument(BallPool, "step", "collision")
+    frame_profiler.instrument(ParticlePool, "update", "particles")
+    frame_profiler.instrument(TextRenderer, "draw", "text")
+    frame_profiler.instrument(BrickLayer, "draw", "brick_layer")
+    frame_profiler.instrument(ParticlePool, "draw", "particle_draw")
+    return frame_profiler
+
+
+# Frame timing only runs with --frame-profile or while the F3 overlay is shown
+frame_profiler = make_frame_profiler(args.frame_profile)
+frame_profiler.set_enabled(args.frame_profile is not None)
+show_profile = False
+profile_rows = []
+
+# Printed once the audio thread is done too
+startup_report_pending = args.startup_profile
 
 # Main loop
 clock = pygame.time.Clock()  # Initialize the clock for FPS control
+timestep = FixedTimestep(args.tick_rate, args.max_catchup_ticks)
+pending_presses = []
 running = True
-paused = False
 
 while running:
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
+    if startup_report_pending and not sound.loader.is_alive():
+        if sound.load_time is not None:
+            profiler.record("audio", *sound.load_time, thread=sound.loader.name)
+        print(profiler.report())
+        startup_report_pending = False
+
+    frame_profiler.begin_frame()
+    # Physics runs in fixed ticks; rendering happens once per frame
+    ticks = timestep.advance(clock.tick(FPS) / 1000)
+    frame_profiler.lap("wait")
+
+    events = pygame.event.get()
+    if any(event.type == pygame.QUIT for event in events):
+        running = False
+    # F3 toggles the frame profiler overlay
+    if any(event.type == pygame.KEYDOWN and event.key == pygame.K_F3 for event in events):
+        show_profile = not show_profile
+        frame_profiler.set_enabled(show_profile or args.frame_profile is not None)
+
+    inputs = FrameInput.from_pygame(events, pygame.key.get_pressed())
+    # Key presses go to the first tick; keep them if no tick runs this frame
+    pending_presses.extend(inputs.presses)
+    game_events = []
+    for _ in range(ticks):
+        inputs.presses, pending_presses = pending_presses, []
+        if recorder is not None:
+            recorder.record(inputs, session)
+        game_events.extend(session.step(inputs))
+    frame_profiler.lap("simulate")
+
+    renderer.draw(session, timestep.alpha)
+    if show_profile:
+        # New statistics twice a second, so the overlay text stays readable
+        if frame_profiler.count % (FPS // 2) == 0 or not profile_rows:
+            profile_rows = frame_profiler.rows()
+        renderer.draw_profile_overlay(profile_rows)
+    frame_profiler.lap("render")
+    sound.begin_frame()
+    for name in game_events:
+        if name == "quit":
             running = False
-
-        # This is placed here to prevent p & q from messing with initials
-        if input_active and current_state == GAME_OVER:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_BACKSPACE:  # Backspace to remove letter
-                    player_initials = player_initials[:-1]
-                elif event.unicode.isalpha() and len(player_initials) < 3:  # Allow typing of letters
-                    player_initials += event.unicode.upper()
-                    initials_ready = len(player_initials) == 3
-                    # Automatically save when length reaches 3
-                    if initials_ready:
-                        scoreboard.save_score(score, player_initials)
-                        input_active = False
-                        initials_entered = True
-            continue  # Needed to allow for Q and R to work
-
-        # Change state on key press
-        if event.type == pygame.KEYDOWN:
-            # Pause Checks
-            if event.key == pygame.K_p and current_state == GAMEPLAY and ball_active:
-                paused = not paused
-            # Restart after life lost
-            elif event.key == pygame.K_SPACE and current_state == LIFE_LOST:
-                current_state = GAMEPLAY
-                paused = False  # unpause when resuming
-                ball_active = True
-            elif event.key == pygame.K_SPACE:
-                if current_state == WELCOME:
-                    sound.play_sound("startup")
-                    current_state = GAMEPLAY
-                    game_ball.draw(screen)
-                    ball_active = True  # start moving on gameplay load
-                    lives = 1 if hardmode else 3
-                elif current_state == GAMEPLAY:
-                    ball_active = True
-            # Restart during Game Over
-            elif event.key == pygame.K_r and current_state == GAME_OVER:
-                score = 0
-                lives = 1 if hardmode else 3
-                paused = False  # no longer paused
-                ball_active = False  # wait for user to start
-                initials_entered = False
-                input_active = False
-                current_state = GAMEPLAY
-                paddle = Paddle(SCREEN_WIDTH, SCREEN_HEIGHT, BLUE,
-                                BORDER_MARGIN, BORDER_THICKNESS)
-                game_ball.restart(SCREEN_WIDTH, SCREEN_HEIGHT)
-                brick_group.empty()
-                brick_group = create_brick_grid(SCREEN_WIDTH)
-            elif event.key == pygame.K_q and current_state == GAME_OVER:
-                running = False
-            elif event.key == pygame.K_h and current_state == WELCOME:
-                hardmode = True
-
-    # If score doesn't reach top 10, it will skip initial inputs
-    if input_active and current_state == GAME_OVER:
-        if scoreboard.top_scores(score):
-            input_active = True
-        else:
-            input_active = False
-
-    # (Optional) Add other key handling for GAME_OVER if needed
-
-    screen.fill(BLACK)
-
-    # Render based on paused status
-    if current_state == GAMEPLAY:
-        if not ball_active and current_level == 1:
-            render_text("PRESS SPACE TO START", FONT_SIZE_TITLE, WHITE,
-                        SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2-40, bold=True)
-            render_text("PRESS 'P' TO PAUSE/UNPAUSE", FONT_SIZE_SUBTITLE, WHITE,
-                        SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
-        elif paused:
-            render_text("(P)AUSED", FONT_SIZE_TITLE, WHITE,
-                        SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, bold=True)
-    # Handle continuous key presses for paddle movement
-    if not paused:
-        if current_state == GAMEPLAY:
-            keys = pygame.key.get_pressed()
-            if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-                paddle.move_left()
-            if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-                paddle.move_right()
-
-    # Render based on current state
-    if current_state == WELCOME:
-        # Title
-        render_text("Welcome to Breakout!", FONT_SIZE_TITLE, WHITE,
-                    SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 60, bold=True)
-        # Subtitle
-        render_text("Press SPACE to Start", FONT_SIZE_SUBTITLE, WHITE,
-                    SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 20)
-        render_text("Press 'H' to Enable Hardmode", FONT_SIZE_SUBTITLE, WHITE,
-                    SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 19)
-        render_text("Press 'P' to Pause/Unpause", FONT_SIZE_SUBTITLE, WHITE,
-                    SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 2)
-        # Credits
-        render_text("CMSC495-6981 Group 3", FONT_SIZE_CREDITS, WHITE,
-                    SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60)
-        render_text("By Rebecca Allen, Tej Charfi, Mariel de la Garza,", FONT_SIZE_CREDITS, WHITE,
-                    SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 80)
-        render_text("Robel Girma, Veronica Hercules Villeda,", FONT_SIZE_CREDITS, WHITE,
-                    SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 100)
-        render_text("William Hoover, Paige Ratliff-Jackson,", FONT_SIZE_CREDITS, WHITE,
-                    SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 120)
-        render_text("and Megan Weatherbee", FONT_SIZE_CREDITS, WHITE,
-                    SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 140)
-        # Let the User know what mode is enabled.
-        if hardmode:
-            render_text("HARDMODE ENABLED", FONT_SIZE_SUBTITLE, RED,
-                        SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 120, bold=True)
+        elif name == "stop_music":
+            sound.stop_music()
+        elif name == "level_complete":
+            pass  # the session plays the transition in its LEVEL_COMPLETE state
         else:
-            render_text("Normal Mode", FONT_SIZE_SUBTITLE, WHITE,
-                        SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 120, bold=True)
-
-    elif current_state in (GAMEPLAY, LIFE_LOST):
-        # White border
-        pygame.draw.rect(screen, WHITE,
-                         (BORDER_MARGIN, BORDER_MARGIN, SCREEN_WIDTH - 2 *
-                          BORDER_MARGIN, SCREEN_HEIGHT - 2*BORDER_MARGIN),
-                         BORDER_THICKNESS)
-
-        # Draw all the bricks on the screen
-        brick_group.update()
-        brick_group.draw(screen)
-
-        # Draw brick particles
-        for brick in brick_group:
-            brick.draw_particles(screen)
-
-        # UI Labels
-        PADDING_TOP = 35
-        PADDING_SIDE = 50
-
-        # Top-left: LEVEL
-        render_text(f"LEVEL: {current_level}", FONT_SIZE_SCORE, WHITE, PADDING_SIDE,
-                    PADDING_TOP, center=False, bold=True)
-
-        # Top-right: LIVES + SCORE
-        RIGHT_X = SCREEN_WIDTH - PADDING_SIDE - 120
-        render_text(f"LIVES: {lives}", FONT_SIZE_SCORE, WHITE, RIGHT_X,
-                    PADDING_TOP, center=False, bold=True)
-        render_text(f"SCORE: {score}", FONT_SIZE_SCORE, WHITE, RIGHT_X,
-                    PADDING_TOP + 20, center=False, bold=True)
-
-        # Show bonus message to the left of SCORE for 1.5 seconds
-        current_time = pygame.time.get_ticks()
-        if bonus_message and current_time - bonus_timer < BONUS_DISPLAY_DURATION:
-            bonus_x = RIGHT_X - 140  # adjust spacing as needed
-            render_text(bonus_message, FONT_SIZE_SCORE, WHITE,
-                        bonus_x, PADDING_TOP + 20, center=False, bold=True)
-        else:
-            bonus_message = ""
-
-        # Horizontal underline (2px height)
-        UNDERLNE_Y = PADDING_TOP + 45
-        pygame.draw.line(screen, WHITE, (30, UNDERLNE_Y),
-                         (SCREEN_WIDTH - 30, UNDERLNE_Y), 2)
-
-        if current_state == GAMEPLAY and not paused and ball_active:
-            game_ball.move()
-            game_ball.bounce_walls(
-                SCREEN_WIDTH, SCREEN_HEIGHT, BORDER_MARGIN, BORDER_THICKNESS, PADDING_SIDE, sound)
-            if game_ball.rect.colliderect(paddle.rect):
-                game_ball.bounce_paddle(paddle.rect, paddle, sound)
-
-                # Bonus logic: award bonus if 3 or more bricks are hit before paddle
-                if game_ball.bricks_hit_in_rally >= 3:
-                    bonus = 100 + 50 * (game_ball.bricks_hit_in_rally - 3)
-                    score += bonus
-                    bonus_message = f"Bonus! +{bonus}"
-                    bonus_timer = pygame.time.get_ticks()
-
-                # Reset the rally count
-                game_ball.bricks_hit_in_rally = 0
-
-            # Check if the ball hit any bricks
-            score = handle_ball_brick_collision(
-                game_ball, brick_group, score, sound)
-
-            # Life update
-            if game_ball.bottom_hit:
-                # Sound when ball hits the bottom
-                sound.play_sound("floor_hit")
-                sound.play_sound("life_lost")  # Sound when a life is lost
-                lives -= 1
-                game_ball.restart(SCREEN_WIDTH, SCREEN_HEIGHT)
-                game_ball.bottom_hit = False
-                if lives > 0:
-                    current_state = LIFE_LOST
-                    paused = False  # don't move until user resumes
-                elif lives <= 0:
-                    sound.play_sound("game_over")
-                    sound.stop_music()
-                    current_state = GAME_OVER
-                    initials_entered = False
-                    player_initials = ""
-
-                    # Only activate input if score qualifies
-                    if scoreboard.top_scores(score):
-                        scoreboard.new_initials(score)
-                        input_active = True
-                    else:
-                        input_active = False
-            # All of the resets for completing a level
-            if len(brick_group) == 0:
-                render_text(f"Level {current_level} Complete!", FONT_SIZE_TITLE,
-                            WHITE, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
-                pygame.display.flip()
-                pygame.time.delay(2000)
-                current_level += 1
-                game_ball.speed_x *= 1.1
-                game_ball.speed_y *= 1.1
-                brick_group.empty()
-                brick_group = create_brick_grid(SCREEN_WIDTH)
-                game_ball.restart(SCREEN_WIDTH, SCREEN_HEIGHT)
-                ball_active = False
-                paused = True
-
-        game_ball.draw(screen)
-
-        if current_state == LIFE_LOST:
-            render_text("LIFE LOST", FONT_SIZE_TITLE, WHITE,
-                        SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40, bold=True)
-            render_text(f"LIVES REMAINING: {lives}", FONT_SIZE_SUBTITLE, WHITE,
-                        SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
-            render_text("PRESS SPACE TO START", FONT_SIZE_SUBTITLE, WHITE,
-                        SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 40)
-
-        # Draw the paddle
-        paddle.draw(screen)
-
-    elif current_state == GAME_OVER:
-        pygame.draw.rect(screen, WHITE,
-                         (BORDER_MARGIN, BORDER_MARGIN, SCREEN_WIDTH - 2 *
-                          BORDER_MARGIN, SCREEN_HEIGHT - 2 * BORDER_MARGIN),
-                         BORDER_THICKNESS)
-
-        # Title
-        render_text("GAME OVER", FONT_SIZE_TITLE, WHITE,
-                    SCREEN_WIDTH // 2, BORDER_MARGIN + 30, bold=True)
-
-        # Horizontal underline (2px height)
-        underline_y = PADDING_TOP + 45
-        pygame.draw.line(screen, WHITE, (30, underline_y),
-                         (SCREEN_WIDTH - 30, underline_y), 2)
-
-        # Allows scoreboard to display
-        if input_active:
-            scoreboard.draw_scoreboard_initials(screen, player_initials)
-        else:
-            scoreboard.draw_scoreboard(screen, SCREEN_WIDTH)
-
-        # Retry and Quit text at the bottom
-        BOTTOM_Y = SCREEN_HEIGHT - BORDER_MARGIN - 30
-        render_text("RETRY (R)", FONT_SIZE_SUBTITLE, WHITE,
-                    SCREEN_WIDTH // 4, BOTTOM_Y, bold=True)
-        render_text("QUIT (Q)", FONT_SIZE_SUBTITLE, WHITE,
-                    SCREEN_WIDTH * 3 // 4, BOTTOM_Y, bold=True)
-
-    pygame.display.flip()
-    clock.tick(FPS)
-
+            sound.play_sound(name)
+    frame_profiler.lap("sound")
+
+    renderer.present()
+    frame_profiler.lap("present")
+    frame_profiler.end_frame()
+
+if args.dirty_rects:
+    print(renderer.tracker.report())
+if frame_profiler.count:
+    print(frame_profiler.report())
+frame_profiler.close()
+if recorder is not None:
+    recorder.save(args.record)
+try:
+    scoreboard.close()
+except OSError as error:
+    print(f"Could not save the scoreboard: {error}", file=sys.stderr)
+if level_pack is not None:
+    level_pack.close()
 pygame.quit()
 sys.exit()
@@ -0,0 +1,376 @@
+"""Array-backed extra balls and the multi-ball power-up for the Breakout game.
+
+In multi-ball mode, broken bricks sometimes drop a power-up capsule; catching it with
+the paddle splits every ball in play into three. The extra balls live in one BallPool
+of NumPy arrays (structure of arrays, like ParticlePool), and their wall, paddle and
+brick tests run as a few array operations per substep for all of them at once, so
+hundreds of balls cost about the same Python work as one. Each ball keeps its own rally
+count for the rally bonus.
+
+The main ball (GameSession.game_ball) keeps its swept collision. Extra balls move in
+substeps no longer than their radius and collide by overlap, which is enough to stop a
+10 px ball tunneling through a 20 px brick.
+"""
+import math
+import numpy as np
+import pygame
+from bricks import BRICK_WIDTH, BRICK_HEIGHT
+from collision import MAX_SUBSTEP, MAX_SUBSTEPS
+
+# pylint: disable=no-member
+
+# Most extra balls in play; balls split off beyond this are dropped
+MAX_BALLS = 256
+# Angle (degrees) between a ball and each of the two balls split off it
+SPLIT_ANGLE = 20
+
+# Chance that a broken brick drops a multi-ball capsule
+POWERUP_CHANCE = 0.15
+# Capsule fall speed in pixels per 60 FPS frame, and its size
+POWERUP_SPEED = 2
+POWERUP_WIDTH = 24
+POWERUP_HEIGHT = 10
+POWERUP_COLOR = (34, 147, 240)
+
+
+class BallPool:
+    """
+    Fixed-capacity pool of balls stored as parallel NumPy arrays.
+
+    Balls in play are kept packed at the front of the arrays; lost balls are compacted
+    away at the end of each step().
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, capacity=MAX_BALLS, radius=5, color=(255, 255, 255)):
+        """
+        Args:
+            capacity (int, optional): Most balls in play. Defaults to MAX_BALLS.
+            radius (int, optional): Ball radius in pixels. Defaults to 5 (as Ball).
+            color (tuple, optional): Ball color. Defaults to white.
+        """
+        self.capacity = capacity
+        self.radius = radius
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        # Positions at the previous tick, for interpolated drawing
+        self.prev_x = np.zeros(capacity)
+        self.prev_y = np.zeros(capacity)
+        self.speed_x = np.zeros(capacity)
+        self.speed_y = np.zeros(capacity)
+        # Bricks hit since each ball last left the paddle
+        self.rally = np.zeros(capacity, dtype=np.int64)
+        self.count = 0
+        self.dropped = 0
+
+        # Drawn with one blit per ball from a single pre-rendered sprite
+        self.sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(self.sprite, color, (radius, radius), radius)
+
+    def __len__(self):
+        return self.count
+
+    def spawn(self, x, y, speed_x, speed_y):
+        """
+        Add balls (arrays or single values); balls past the pool's capacity are dropped.
+
+        Returns:
+            int: Number of balls added.
+        """
+        x, y, speed_x, speed_y = np.broadcast_arrays(
+            *(np.atleast_1d(np.asarray(values, dtype=np.float64))
+              for values in (x, y, speed_x, speed_y)))
+        added = min(len(x), self.capacity - self.count)
+        self.dropped += len(x) - added
+        new = slice(self.count, self.count + added)
+        self.x[new] = self.prev_x[new] = x[:added]
+        self.y[new] = self.prev_y[new] = y[:added]
+        self.speed_x[new] = speed_x[:added]
+        self.speed_y[new] = speed_y[:added]
+        self.rally[new] = 0
+        self.count += added
+        return added
+
+    def split(self, ball):
+        """
+        Split every ball in play (the pool's and ball, the main Ball) into three: two
+        new balls leave each one SPLIT_ANGLE degrees either side of its direction.
+
+        Returns:
+            int: Number of balls added.
+        """
+        n = self.count
+        x = np.append(self.x[:n], ball.x)
+        y = np.append(self.y[:n], ball.y)
+        speed_x = np.append(self.speed_x[:n], ball.speed_x)
+        speed_y = np.append(self.speed_y[:n], ball.speed_y)
+        added = 0
+        for angle in (SPLIT_ANGLE, -SPLIT_ANGLE):
+            cos, sin = math.cos(math.radians(angle)), math.sin(math.radians(angle))
+            added += self.spawn(x, y, speed_x * cos - speed_y * sin,
+                                speed_x * sin + speed_y * cos)
+        return added
+
+    def take(self, index):
+        """
+        Remove one ball from the pool.
+
+        Returns:
+            tuple: The ball's (x, y, speed x, speed y, rally count).
+        """
+        ball = (float(self.x[index]), float(self.y[index]), float(self.speed_x[index]),
+                float(self.speed_y[index]), int(self.rally[index]))
+        keep = np.ones(self.count, dtype=bool)
+        keep[index] = False
+        self.compact(keep)
+        return ball
+
+    def compact(self, keep):
+        """
+        Keep only the balls where keep (one bool per ball in play) is True.
+        """
+        kept = int(keep.sum())
+        for array in (self.x, self.y, self.prev_x, self.prev_y, self.speed_x,
+                      self.speed_y, self.rally):
+            array[:kept] = array[:self.count][keep]
+        self.count = kept
+
+    def clear(self):
+        """
+        Remove every ball.
+        """
+        self.count = 0
+
+    def save_positions(self):
+        """
+        Remember the current positions as the previous tick's positions.
+        """
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+
+    def step(self, step, bounds, paddle, bricks, sound, particles=None):
+        """
+        Move every ball for one tick and bounce it off the walls, paddle and bricks.
+
+        Args:
+            step (float): Length of the tick in 60 FPS frames.
+            bounds (tuple): (left, top, right, bottom) inner edges of the play area.
+            paddle (Paddle): The paddle.
+            bricks (BrickField): The brick field.
+            sound: Anything with play_sound(name).
+            particles (ParticlePool, optional): Pool for brick-hit particle bursts.
+
+        Returns:
+            tuple: (score gained, rally counts of the balls that returned to the paddle
+            as an array, number of balls lost off the bottom).
+        """
+        n = self.count
+        if not n:
+            return 0, np.zeros(0, dtype=np.int64), 0
+        left, top, right, bottom = bounds
+        radius = self.radius
+        x, y = self.x[:n], self.y[:n]
+        speed_x, speed_y = self.speed_x[:n], self.speed_y[:n]
+        rally = self.rally[:n]
+        lost = np.zeros(n, dtype=bool)
+        score = 0
+        rallies = []
+        wall_hit = False
+
+        distance = max(np.abs(speed_x).max(), np.abs(speed_y).max()) * step
+        substeps = min(MAX_SUBSTEPS, max(1, math.ceil(distance / (radius * MAX_SUBSTEP))))
+        fraction = step / substeps
+
+        for _ in range(substeps):
+            x += speed_x * fraction
+            y += speed_y * fraction
+
+            # Walls: only bounce a ball moving into the wall, so it can't stick to it
+            side = (((x - radius <= left) & (speed_x < 0))
+                    | ((x + radius >= right) & (speed_x > 0)))
+            ceiling = (y - radius <= top) & (speed_y < 0)
+            if side.any() or ceiling.any():
+                speed_x[side] *= -1
+                speed_y[ceiling] *= -1
+                wall_hit = True
+            lost |= y + radius >= bottom
+            play = ~lost
+
+            # Paddle, as Ball.bounce_paddle and Ball.steer_from_paddle
+            rect = paddle.rect
+            on_paddle = (play & (speed_y > 0)
+                         & (x + radius > rect.left) & (x - radius < rect.right)
+                         & (y + radius > rect.top) & (y - radius < rect.bottom))
+            if on_paddle.any():
+                speed_y[on_paddle] = -np.abs(speed_y[on_paddle])
+                steer_left = on_paddle & (x < rect.centerx - 20)
+                steer_right = on_paddle & (x > rect.centerx + 20)
+                speed_x[steer_left] = -np.abs(speed_x[steer_left])
+                speed_x[steer_right] = np.abs(speed_x[steer_right])
+                rallies.append(rally[on_paddle].copy())
+                rally[on_paddle] = 0
+                sound.play_sound("paddle_hit")
+                paddle.shake()
+
+            score += self.collide_bricks(bricks, play, sound, particles)
+
+        if wall_hit:
+            sound.play_sound("wall_hit")
+        lost_count = int(lost.sum())
+        if lost_count:
+            self.compact(~lost)
+        rallies = np.concatenate(rallies) if rallies else np.zeros(0, dtype=np.int64)
+        return score, rallies, lost_count
+
+    def collide_bricks(self, bricks, play, sound, particles=None):
+        """
+        Bounce the balls in play off the alive bricks they overlap and break those bricks.
+
+        A ball is never larger than a grid cell, so it overlaps at most 2 x 2 cells: the
+        broadphase checks those four cells for every ball at once. A brick touched by
+        several balls in the same substep is broken (and scored) by the first of them.
+
+        Returns:
+            int: Score of the bricks broken.
+        """
+        n = self.count
+        radius = self.radius
+        x, y = self.x[:n], self.y[:n]
+        col_lo = np.floor((x - radius - bricks.origin_x) / bricks.pitch_x).astype(np.int64)
+        row_lo = np.floor((y - radius - bricks.origin_y) / bricks.pitch_y).astype(np.int64)
+        hit_balls, hit_rows, hit_columns = [], [], []
+        for d_row in (0, 1):
+            for d_column in (0, 1):
+                row = row_lo + d_row
+                column = col_lo + d_column
+                candidate = (play & (row >= 0) & (row < bricks.rows)
+                             & (column >= 0) & (column < bricks.columns))
+                balls = np.flatnonzero(candidate)
+                if not len(balls):
+                    continue
+                row, column = row[balls], column[balls]
+                brick_left = bricks.origin_x + column * bricks.pitch_x
+                brick_top = bricks.origin_y + row * bricks.pitch_y
+                touching = (bricks.alive[row, column]
+                            & (x[balls] + radius > brick_left)
+                            & (x[balls] - radius < brick_left + BRICK_WIDTH)
+                            & (y[balls] + radius > brick_top)
+                            & (y[balls] - radius < brick_top + BRICK_HEIGHT))
+                hit_balls.append(balls[touching])
+                hit_rows.append(row[touching])
+                hit_columns.append(column[touching])
+        if not hit_balls:
+            return 0
+        balls = np.concatenate(hit_balls)
+        if not len(balls):
+            return 0
+        row = np.concatenate(hit_rows)
+        column = np.concatenate(hit_columns)
+
+        # Reflect off the face the ball overlaps least: a side or the top/bottom
+        center_x = bricks.origin_x + column * bricks.pitch_x + BRICK_WIDTH / 2
+        center_y = bricks.origin_y + row * bricks.pitch_y + BRICK_HEIGHT / 2
+        ball_x, ball_y = x[balls], y[balls]
+        depth_x = BRICK_WIDTH / 2 + radius - np.abs(ball_x - center_x)
+        depth_y = BRICK_HEIGHT / 2 + radius - np.abs(ball_y - center_y)
+        side = depth_x < depth_y
+        away_x = np.where(ball_x < center_x, -1.0, 1.0)
+        away_y = np.where(ball_y < center_y, -1.0, 1.0)
+        speed_x, speed_y = self.speed_x[:n], self.speed_y[:n]
+        speed_x[balls[side]] = np.abs(speed_x[balls[side]]) * away_x[side]
+        speed_y[balls[~side]] = np.abs(speed_y[balls[~side]]) * away_y[~side]
+
+        # Break each brick once, crediting the rally of the first ball touching it
+        cells, first = np.unique(row * bricks.columns + column, return_index=True)
+        np.add.at(self.rally, balls[first], 1)
+        score = 0
+        for cell in cells.tolist():
+            score += bricks.break_brick(divmod(cell, bricks.columns), sound, particles)
+        return score
+
+    def draw(self, screen, alpha=1.0):
+        """
+        Draw every ball alpha of the way from its previous to its current position.
+        """
+        n = self.count
+        if not n:
+            return
+        x = self.prev_x[:n] + (self.x[:n] - self.prev_x[:n]) * alpha - self.radius
+        y = self.prev_y[:n] + (self.y[:n] - self.prev_y[:n]) * alpha - self.radius
+        sprite = self.sprite
+        screen.blits([(sprite, position) for position in zip(x.tolist(), y.tolist())],
+                     doreturn=False)
+
+    def dirty_rects(self):
+        """
+        Screen areas covered by each ball at its previous and current positions.
+        """
+        n = self.count
+        size = self.radius * 2 + 2
+        left = np.minimum(self.x[:n], self.prev_x[:n]) - size / 2
+        top = np.minimum(self.y[:n], self.prev_y[:n]) - size / 2
+        width = np.abs(self.x[:n] - self.prev_x[:n]) + size
+        height = np.abs(self.y[:n] - self.prev_y[:n]) + size
+        return [pygame.Rect(*area) for area in zip(
+            np.floor(left).astype(int).tolist(), np.floor(top).astype(int).tolist(),
+            np.ceil(width).astype(int).tolist(), np.ceil(height).astype(int).tolist())]
+
+
+class PowerUps:
+    """
+    Multi-ball capsules falling from broken bricks until caught or missed.
+    """
+
+    def __init__(self):
+        self.capsules = []  # pygame.Rect of each falling capsule
+        self.fall = []  # distance each capsule has fallen, in pixels
+
+    def __len__(self):
+        return len(self.capsules)
+
+    def drop(self, center):
+        """
+        Start a capsule falling from a point (a broken brick's center).
+        """
+        capsule = pygame.Rect(0, 0, POWERUP_WIDTH, POWERUP_HEIGHT)
+        capsule.center = center
+        self.capsules.append(capsule)
+        self.fall.append(0.0)
+
+    def update(self, step, paddle_rect, bottom):
+        """
+        Move the capsules down; remove the ones caught by the paddle or past bottom.
+
+        Returns:
+            int: Number of capsules caught this tick.
+        """
+        caught = 0
+        for i in range(len(self.capsules) - 1, -1, -1):
+            capsule = self.capsules[i]
+            self.fall[i] += POWERUP_SPEED * step
+            capsule.y += int(self.fall[i])
+            self.fall[i] -= int(self.fall[i])
+            if capsule.colliderect(paddle_rect):
+                caught += 1
+            elif capsule.bottom < bottom:
+                continue
+            del self.capsules[i]
+            del self.fall[i]
+        return caught
+
+    def clear(self):
+        """
+        Remove every capsule.
+        """
+        self.capsules.clear()
+        self.fall.clear()
+
+    def draw(self, screen):
+        """
+        Draw the capsules and return the areas they cover.
+        """
+        for capsule in self.capsules:
+            pygame.draw.rect(screen, POWERUP_COLOR, capsule, border_radius=POWERUP_HEIGHT // 2)
+        return [capsule.copy() for capsule in self.capsules]
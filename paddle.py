@@ -32,6 +32,8 @@ class Paddle:
         # Start position: centered horizontally, 50px from bottom
         self.x = (screen_width - self.width) // 2
         self.y = screen_height - 50 - self.height
+        # Position at the previous tick, for interpolated drawing
+        self.prev_x = self.x
         # Store as pygame.Rect for collision and movement logic
         self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
         self.screen_width = screen_width
@@ -40,21 +42,33 @@ class Paddle:
         self.shake_frames = 0
         self.shake_offset_y = 0
 
-    def move_left(self):
+    def move_left(self, step=1.0):
         """
         Move the paddle left, staying inside the game border.
+
+        step is the length of the tick in 60 FPS frames (speed is in pixels per frame).
         """
         # Respect left game border
         left_limit = self.border_margin + self.border_thickness
-        self.rect.x = max(left_limit, self.rect.x - self.speed)
+        self.x = max(left_limit, self.x - self.speed * step)
+        self.rect.x = round(self.x)
 
-    def move_right(self):
+    def move_right(self, step=1.0):
         """
         Move the paddle right, staying inside the game border.
+
+        step is the length of the tick in 60 FPS frames (speed is in pixels per frame).
         """
         right_limit = self.screen_width - self.border_margin - \
             self.border_thickness - self.width
-        self.rect.x = min(right_limit, self.rect.x + self.speed)
+        self.x = min(right_limit, self.x + self.speed * step)
+        self.rect.x = round(self.x)
+
+    def save_position(self):
+        """
+        Remember the current position as the previous tick's position.
+        """
+        self.prev_x = self.x
 
     def shake(self):
         """
@@ -62,9 +76,18 @@ class Paddle:
         """
         self.shake_frames = 5
 
-    def draw(self, surface):
+    def dirty_rect(self):
+        """
+        Return the screen area the paddle may cover, including the shake offset.
+        """
+        previous = self.rect.move(round(self.prev_x) - self.rect.x, 0)
+        return self.rect.union(self.rect.move(0, 3)).union(previous)
+
+    def draw(self, surface, alpha=1.0):
         """
         Draw the paddle on the provided surface with shake when collided.
+
+        alpha is how far between the previous and current tick to draw the paddle (0 to 1).
         """
         if self.shake_frames > 0:
             self.shake_offset_y = 3
@@ -73,5 +96,6 @@ class Paddle:
             self.shake_offset_y = 0
 
         # Create a temporary rect with the vertical offset
-        shaken_rect = self.rect.move(0, self.shake_offset_y)
+        x = round(self.prev_x + (self.x - self.prev_x) * alpha)
+        shaken_rect = self.rect.move(x - self.rect.x, self.shake_offset_y)
         pygame.draw.rect(surface, self.color, shaken_rect)
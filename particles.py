@@ -0,0 +1,129 @@
+"""Array-backed particle system for the Breakout game.
+
+All brick-hit particles live in one preallocated pool of NumPy arrays (structure of
+arrays). Updates are vectorized and drawing is one Surface.blits call using
+pre-rendered dot sprites, so thousands of particles cost about the same as a few.
+"""
+import numpy as np
+import pygame
+
+# Default particle settings (match the original per-brick bursts)
+PARTICLE_RADIUS = 3
+PARTICLE_LIFE = 10  # frames
+PARTICLE_SPEED = 2  # max pixels per frame on each axis
+PARTICLE_COUNT = 15  # particles per burst
+
+
+class ParticlePool:
+    """
+    Fixed-capacity pool of particles stored as parallel NumPy arrays.
+
+    Live particles are kept packed at the front of the arrays; dead ones are compacted
+    away after each update. When the pool is full, new particles are dropped.
+    """
+
+    def __init__(self, capacity=16384, radius=PARTICLE_RADIUS, seed=None):
+        """
+        Args:
+            capacity (int, optional): Maximum number of live particles. Defaults to 16384.
+            radius (int, optional): Radius of each particle dot in pixels. Defaults to 3.
+            seed (int, optional): Seed for the burst directions.
+        """
+        self.capacity = capacity
+        self.radius = radius
+        self.rng = np.random.default_rng(seed)
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.dx = np.zeros(capacity, dtype=np.float32)
+        self.dy = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.color = np.zeros(capacity, dtype=np.uint8)  # index into self.palette
+        self.count = 0
+        self.dropped = 0
+        # Pre-rendered dot sprite for each color used so far
+        self.palette = []
+        self.sprites = []
+        self.palette_index = {}
+
+    def __len__(self):
+        return self.count
+
+    def color_index(self, color):
+        """
+        Return the palette index for a color, rendering its dot sprite on first use.
+        """
+        color = tuple(color[:3])
+        index = self.palette_index.get(color)
+        if index is None:
+            index = len(self.palette)
+            size = self.radius * 2
+            sprite = pygame.Surface((size, size))
+            # Any key color that is not the dot color works for transparency
+            key = (0, 0, 0) if color != (0, 0, 0) else (255, 0, 255)
+            sprite.fill(key)
+            sprite.set_colorkey(key)
+            pygame.draw.circle(sprite, color, (self.radius, self.radius), self.radius)
+            self.palette.append(color)
+            self.sprites.append(sprite)
+            self.palette_index[color] = index
+        return index
+
+    def emit(self, x, y, color, count=PARTICLE_COUNT, speed=PARTICLE_SPEED, life=PARTICLE_LIFE):
+        """
+        Add a burst of particles at (x, y) moving in random directions.
+
+        Returns:
+            int: Number of particles actually added (less than count when the pool is full).
+        """
+        added = min(count, self.capacity - self.count)
+        self.dropped += count - added
+        if added <= 0:
+            return 0
+        start, end = self.count, self.count + added
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.dx[start:end] = self.rng.uniform(-speed, speed, added)
+        self.dy[start:end] = self.rng.uniform(-speed, speed, added)
+        self.life[start:end] = life
+        self.color[start:end] = self.color_index(color)
+        self.count = end
+        return added
+
+    def update(self, step=1):
+        """
+        Move every live particle, age it and compact away the ones that died.
+        """
+        n = self.count
+        if n == 0:
+            return
+        self.x[:n] += self.dx[:n] * step
+        self.y[:n] += self.dy[:n] * step
+        self.life[:n] -= step
+        alive = self.life[:n] > 0
+        if alive.all():
+            return
+        # Keep live particles packed at the front (stable, so draw order is preserved)
+        keep = np.flatnonzero(alive)
+        remaining = len(keep)
+        for array in (self.x, self.y, self.dx, self.dy, self.life, self.color):
+            array[:remaining] = array[keep]
+        self.count = remaining
+
+    def clear(self):
+        """
+        Remove every particle.
+        """
+        self.count = 0
+
+    def draw(self, surface):
+        """
+        Draw all live particles with a single Surface.blits call.
+        """
+        n = self.count
+        if n == 0:
+            return
+        sprites = self.sprites
+        xs = (self.x[:n] - self.radius).astype(np.int32).tolist()
+        ys = (self.y[:n] - self.radius).astype(np.int32).tolist()
+        surface.blits(zip(map(sprites.__getitem__, self.color[:n].tolist()), zip(xs, ys)),
+                      doreturn=False)
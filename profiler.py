@@ -0,0 +1,238 @@
+"""Timing tools for the Breakout game.
+
+StartupProfiler times the phases of startup (imports, opening the window, drawing the
+first frame, and the work deferred until after it) for main.py --startup-profile.
+
+FrameProfiler times the phases of each frame of the main loop, keeps rolling p50, p95
+and p99 statistics for the on-screen overlay and can log every frame to a CSV file.
+Inner phases (brick updates, collision, text, particles) are timed by wrapping the
+functions that do the work while the profiler is enabled, so a disabled profiler costs
+nothing inside the game code.
+"""
+import csv
+import functools
+import threading
+import time
+from contextlib import contextmanager
+import numpy as np
+
+
+class StartupProfiler:
+    """
+    Records named startup phases as (start, end) times relative to program start.
+
+    Phases may be recorded from any thread; the report lists them in start order and
+    marks the ones that ran off the main thread.
+    """
+
+    def __init__(self, started_ns=None):
+        """
+        Args:
+            started_ns (int, optional): time.perf_counter_ns() at program start.
+                Defaults to now.
+        """
+        self.started_ns = started_ns if started_ns is not None else time.perf_counter_ns()
+        self.phases = []  # (name, start ns, end ns, thread name)
+        self.first_frame_ns = None
+        self.lock = threading.Lock()
+
+    def record(self, name, start_ns, end_ns, thread=None):
+        """
+        Add a phase timed elsewhere (e.g. by a background thread).
+        """
+        thread = thread or threading.current_thread().name
+        with self.lock:
+            self.phases.append((name, start_ns, end_ns, thread))
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Time the body of a with statement as a phase.
+        """
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter_ns())
+
+    def mark_first_frame(self):
+        """
+        Note that the first frame has been pushed to the display.
+        """
+        self.first_frame_ns = time.perf_counter_ns()
+
+    def report(self):
+        """
+        Time to first frame and the per-phase breakdown, as printable text.
+        """
+        def ms(ns):
+            return ns / 1e6
+
+        lines = []
+        if self.first_frame_ns is not None:
+            lines.append(f"Time to first frame: "
+                         f"{ms(self.first_frame_ns - self.started_ns):.1f} ms")
+        lines.append(f"{'phase':<24}{'start ms':>10}{'took ms':>10}")
+        with self.lock:
+            phases = sorted(self.phases, key=lambda phase: phase[1])
+        for name, start, end, thread in phases:
+            where = "" if thread == "MainThread" else f"  [{thread}]"
+            lines.append(f"{name:<24}{ms(start - self.started_ns):>10.1f}"
+                         f"{ms(end - start):>10.1f}{where}")
+        return "\n".join(lines)
+
+
+class FrameProfiler:
+    """
+    Per-frame phase timings with rolling percentiles and an optional CSV log.
+
+    The main loop calls begin_frame(), then lap(phase) after each top-level phase and
+    end_frame() at the end. Inner phases come from functions wrapped with instrument();
+    their time is also part of the top-level phase they ran in.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, phases, inner_phases=(), window=600, csv_path=None):
+        """
+        Args:
+            phases (list): Names of the top-level phases, in loop order.
+            inner_phases (list, optional): Names of the phases timed by instrument().
+            window (int, optional): Frames the rolling statistics cover. Defaults to 600.
+            csv_path (str, optional): File to log every profiled frame to.
+        """
+        self.phases = list(phases)
+        self.inner_phases = list(inner_phases)
+        self.columns = ["frame"] + self.phases + self.inner_phases
+        self.index = {name: i for i, name in enumerate(self.columns)}
+        self.window = window
+        # Rolling nanosecond timings, one row per frame (column 0 is the frame total)
+        self.history = np.zeros((window, len(self.columns)), dtype=np.int64)
+        self.count = 0
+        self.current = [0] * len(self.columns)
+        self.frame_start = self.last = 0
+        self.enabled = False
+        self.patched = []  # (owner, attribute name, original)
+        self.wrapped = []  # (owner, attribute name, phase) to wrap while enabled
+        self.csv_file = None
+        self.writer = None
+        if csv_path is not None:
+            self.csv_file = open(csv_path, "w", newline="", encoding="utf-8")
+            self.writer = csv.writer(self.csv_file)
+            self.writer.writerow([f"{name}_ns" for name in self.columns])
+
+    def instrument(self, owner, name, phase):
+        """
+        Time calls to owner.name (a function on a class or module) as phase while the
+        profiler is enabled.
+        """
+        self.wrapped.append((owner, name, phase))
+        if self.enabled:
+            self.wrap(owner, name, phase)
+
+    def wrap(self, owner, name, phase):
+        """Replace owner.name with a timing wrapper."""
+        original = getattr(owner, name)
+        column = self.index[phase]
+        current = self.current
+        clock = time.perf_counter_ns
+
+        @functools.wraps(original)
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                current[column] += clock() - start
+
+        setattr(owner, name, timed)
+        self.patched.append((owner, name, original))
+
+    def set_enabled(self, enabled):
+        """
+        Turn profiling on or off. Wrappers only exist while it is on.
+        """
+        if enabled == self.enabled:
+            return
+        self.enabled = enabled
+        if enabled:
+            for owner, name, phase in self.wrapped:
+                self.wrap(owner, name, phase)
+        else:
+            for owner, name, original in reversed(self.patched):
+                setattr(owner, name, original)
+            self.patched.clear()
+
+    def begin_frame(self):
+        """Start timing a frame."""
+        if not self.enabled:
+            return
+        current = self.current
+        for i in range(len(current)):
+            current[i] = 0
+        self.frame_start = self.last = time.perf_counter_ns()
+
+    def lap(self, phase):
+        """Charge the time since the last lap (or the frame start) to phase."""
+        if not self.enabled:
+            return
+        now = time.perf_counter_ns()
+        self.current[self.index[phase]] += now - self.last
+        self.last = now
+
+    def end_frame(self):
+        """Finish the frame: store it in the rolling window and the log."""
+        if not self.enabled:
+            return
+        current = self.current
+        current[0] = time.perf_counter_ns() - self.frame_start
+        self.history[self.count % self.window] = current
+        self.count += 1
+        if self.writer is not None:
+            self.writer.writerow(current)
+
+    def percentiles(self):
+        """
+        Rolling statistics of the profiled frames.
+
+        Returns:
+            dict: Phase name ("frame" for the whole frame) -> (p50, p95, p99) in
+            milliseconds.
+        """
+        frames = self.history[:min(self.count, self.window)]
+        if not len(frames):
+            return {}
+        stats = np.percentile(frames, [50, 95, 99], axis=0) / 1e6
+        return {name: tuple(stats[:, i]) for i, name in enumerate(self.columns)}
+
+    def rows(self):
+        """
+        The rolling statistics as (label, p50, p95, p99) rows in milliseconds; inner
+        phases are indented under the top-level ones.
+        """
+        stats = self.percentiles()
+        if not stats:
+            return []
+        return [("  " + name if name in self.inner_phases else name, *stats[name])
+                for name in self.columns]
+
+    def report(self):
+        """
+        The rolling statistics as printable text.
+        """
+        rows = self.rows()
+        if not rows:
+            return "frame profile: no frames"
+        lines = [f"frame profile, last {min(self.count, self.window)} frames (ms)",
+                 f"{'phase':<16}{'p50':>8}{'p95':>8}{'p99':>8}"]
+        for label, p50, p95, p99 in rows:
+            lines.append(f"{label:<16}{p50:>8.2f}{p95:>8.2f}{p99:>8.2f}")
+        return "\n".join(lines)
+
+    def close(self):
+        """Remove the wrappers and close the log."""
+        self.set_enabled(False)
+        if self.csv_file is not None:
+            self.csv_file.close()
+            self.csv_file = None
+            self.writer = None
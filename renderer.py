@@ -0,0 +1,337 @@
+"""Renderer for the Breakout game.
+
+Draws a GameSession onto a pygame surface: the welcome screen, gameplay with the HUD,
+and the game over scoreboard. Supports full redraws and dirty-rect rendering. Static
+content (border, underline, menu text) comes from pre-drawn layers in a LayerCache.
+"""
+import pygame
+from dirty_rects import DirtyRectTracker
+from layer_cache import LayerCache
+from brick_field import BrickLayer
+from text_renderer import text_renderer
+from game_session import (
+    BORDER_MARGIN, BORDER_THICKNESS, PADDING_TOP, PADDING_SIDE,
+    WHITE, BLACK, RED, WELCOME, GAMEPLAY, GAME_OVER, LIFE_LOST, LEVEL_COMPLETE,
+)
+
+# pylint: disable=no-member
+
+# Font sizes
+FONT_SIZE_TITLE = 40
+FONT_SIZE_SUBTITLE = 20
+FONT_SIZE_CREDITS = 16
+FONT_SIZE_SCORE = 18
+FONT_SIZE_OVERLAY = 12
+
+
+class Renderer:
+    """
+    Draws game sessions onto a surface (usually the display).
+    """
+
+    def __init__(self, screen, dirty_rects=False):
+        """
+        Args:
+            screen (pygame.Surface): The surface to draw on.
+            dirty_rects (bool, optional): Only redraw and push changed regions during
+                gameplay. Defaults to False.
+        """
+        self.screen = screen
+        self.underline_y = PADDING_TOP + 45
+        self.tracker = DirtyRectTracker(screen, enabled=dirty_rects)
+        self.layers = LayerCache(screen)
+        self.brick_layer = BrickLayer(screen)
+        self.hud_key = None
+        self.hud_rects = []
+        self.width = self.height = self.right_x = None
+        self.update_size()
+
+    def update_size(self):
+        """
+        Pick up the screen's current size; layers are keyed on it and rebuild themselves.
+        """
+        width, height = self.screen.get_size()
+        if (width, height) != (self.width, self.height):
+            self.width = width
+            self.height = height
+            self.right_x = self.width - PADDING_SIDE - 120
+            self.tracker.invalidate()
+
+    @property
+    def background(self):
+        """Gameplay background (border and HUD underline), also used to restore dirty regions."""
+        return self.layers.get("gameplay", (self.width, self.height),
+                               self.draw_gameplay_layer)
+
+    def render_text(self, text, size, color, x, y, center=True, bold=False, surface=None):
+        """Render text on the screen (or surface) with optional centering and bold styling."""
+        return text_renderer.draw(surface or self.screen, text, size, color, x, y,
+                                  center, bold)
+
+    def draw_border(self, surface):
+        """Draw the white border around the game area."""
+        pygame.draw.rect(surface, WHITE,
+                         (BORDER_MARGIN, BORDER_MARGIN, self.width - 2 *
+                          BORDER_MARGIN, self.height - 2 * BORDER_MARGIN),
+                         BORDER_THICKNESS)
+
+    def draw_underline(self, surface):
+        """Horizontal underline (2px height) below the HUD."""
+        pygame.draw.line(surface, WHITE, (30, self.underline_y),
+                         (self.width - 30, self.underline_y), 2)
+
+    def draw(self, session, alpha=1.0):
+        """
+        Draw one frame of the session. Call present() to push it to the display.
+
+        alpha is how far the frame is between the session's last two ticks (0 to 1);
+        the ball and paddle are drawn at interpolated positions.
+        """
+        self.update_size()
+        # Only active, unpaused gameplay can be drawn with dirty rects
+        dirty_frame = self.tracker.begin_frame(
+            (session.current_state, session.paused, session.ball_active,
+             session.current_level),
+            allow_dirty=(session.current_state == GAMEPLAY and session.ball_active
+                         and not session.paused))
+        size = (self.width, self.height)
+        if dirty_frame:
+            self.tracker.restore(self.background)
+        elif session.current_state == WELCOME:
+            self.blit_welcome(session.hardmode)
+        elif session.current_state in (GAMEPLAY, LIFE_LOST, LEVEL_COMPLETE):
+            self.screen.blit(self.background, (0, 0))
+        elif session.current_state == GAME_OVER:
+            self.layers.blit("game_over", size, self.draw_game_over_layer)
+        else:
+            self.screen.fill(BLACK)
+
+        # Render the moving parts based on current state
+        if session.current_state in (GAMEPLAY, LIFE_LOST):
+            self.draw_gameplay(session, dirty_frame, alpha)
+        elif session.current_state == LEVEL_COMPLETE:
+            self.draw_gameplay(session, dirty_frame, alpha)
+            self.draw_level_complete(session.current_level, session.transition_progress())
+        elif session.current_state == GAME_OVER:
+            self.draw_game_over(session)
+
+    def draw_loading(self, hardmode=False):
+        """
+        Draw the welcome screen before any session exists, so the first frame can be
+        shown while the rest of the game loads. Call present() to push it.
+        """
+        self.update_size()
+        # Same layout key as a new session's welcome screen
+        self.tracker.begin_frame((WELCOME, False, False, 1), allow_dirty=False)
+        self.blit_welcome(hardmode)
+
+    def blit_welcome(self, hardmode):
+        """Draw the cached welcome layer over the whole screen."""
+        self.layers.blit("welcome", (self.width, self.height, hardmode),
+                         lambda surface: self.draw_welcome(surface, hardmode))
+
+    def present(self):
+        """
+        Push the last drawn frame to the display.
+        """
+        self.tracker.present()
+
+    def draw_welcome(self, surface, hardmode):
+        """Draw the welcome screen (cached as the "welcome" layer)."""
+        surface.fill(BLACK)
+        center_x = self.width // 2
+        center_y = self.height // 2
+        # Title
+        self.render_text("Welcome to Breakout!", FONT_SIZE_TITLE, WHITE,
+                         center_x, center_y - 60, bold=True, surface=surface)
+        # Subtitle
+        self.render_text("Press SPACE to Start", FONT_SIZE_SUBTITLE, WHITE,
+                         center_x, center_y - 20, surface=surface)
+        self.render_text("Press 'H' to Enable Hardmode", FONT_SIZE_SUBTITLE, WHITE,
+                         center_x, center_y + 19, surface=surface)
+        self.render_text("Press 'P' to Pause/Unpause", FONT_SIZE_SUBTITLE, WHITE,
+                         center_x, center_y - 2, surface=surface)
+        # Credits
+        self.render_text("CMSC495-6981 Group 3", FONT_SIZE_CREDITS, WHITE,
+                         center_x, center_y + 60, surface=surface)
+        self.render_text("By Rebecca Allen, Tej Charfi, Mariel de la Garza,",
+                         FONT_SIZE_CREDITS, WHITE, center_x, center_y + 80, surface=surface)
+        self.render_text("Robel Girma, Veronica Hercules Villeda,", FONT_SIZE_CREDITS, WHITE,
+                         center_x, center_y + 100, surface=surface)
+        self.render_text("William Hoover, Paige Ratliff-Jackson,", FONT_SIZE_CREDITS, WHITE,
+                         center_x, center_y + 120, surface=surface)
+        self.render_text("and Megan Weatherbee", FONT_SIZE_CREDITS, WHITE,
+                         center_x, center_y + 140, surface=surface)
+        # Let the User know what mode is enabled.
+        if hardmode:
+            self.render_text("HARDMODE ENABLED", FONT_SIZE_SUBTITLE, RED,
+                             center_x, center_y - 120, bold=True, surface=surface)
+        else:
+            self.render_text("Normal Mode", FONT_SIZE_SUBTITLE, WHITE,
+                             center_x, center_y - 120, bold=True, surface=surface)
+
+    def draw_hud(self, session):
+        """Draw the level, lives, score and bonus labels and return the rects they cover."""
+        rects = [
+            # Top-left: LEVEL
+            self.render_text(f"LEVEL: {session.current_level}", FONT_SIZE_SCORE, WHITE,
+                             PADDING_SIDE, PADDING_TOP, center=False, bold=True),
+            # Top-right: LIVES + SCORE
+            self.render_text(f"LIVES: {session.lives}", FONT_SIZE_SCORE, WHITE,
+                             self.right_x, PADDING_TOP, center=False, bold=True),
+            self.render_text(f"SCORE: {session.score}", FONT_SIZE_SCORE, WHITE,
+                             self.right_x, PADDING_TOP + 20, center=False, bold=True),
+        ]
+        # Show bonus message to the left of SCORE
+        if session.bonus_message:
+            bonus_x = self.right_x - 140  # adjust spacing as needed
+            rects.append(self.render_text(session.bonus_message, FONT_SIZE_SCORE, WHITE,
+                                          bonus_x, PADDING_TOP + 20, center=False, bold=True))
+        return rects
+
+    def draw_gameplay(self, session, dirty_frame, alpha=1.0):
+        """Draw the border, bricks, HUD, ball and paddle."""
+        screen = self.screen
+        tracker = self.tracker
+        center_x = self.width // 2
+        center_y = self.height // 2
+
+        # Render based on paused status
+        if session.current_state == GAMEPLAY:
+            if not session.ball_active and session.current_level == 1:
+                self.render_text("PRESS SPACE TO START", FONT_SIZE_TITLE, WHITE,
+                                 center_x, center_y - 40, bold=True)
+                self.render_text("PRESS 'P' TO PAUSE/UNPAUSE", FONT_SIZE_SUBTITLE, WHITE,
+                                 center_x, center_y)
+            elif session.paused:
+                self.render_text("(P)AUSED", FONT_SIZE_TITLE, WHITE,
+                                 center_x, center_y, bold=True)
+
+        # HUD labels (drawn before the particles so restoring them never erases one)
+        hud_key = (session.current_level, session.lives, session.score,
+                   session.bonus_message)
+        if not dirty_frame:
+            self.hud_rects = self.draw_hud(session)
+        elif (hud_key != self.hud_key
+              or any(tracker.touches_previous(r) for r in self.hud_rects)):
+            # Clear the old labels before redrawing them
+            for rect in self.hud_rects:
+                screen.blit(self.background, rect, rect)
+                tracker.add_static(rect)
+            self.hud_rects = self.draw_hud(session)
+            for rect in self.hud_rects:
+                tracker.add_static(rect)
+        self.hud_key = hud_key
+
+        # Draw all the bricks on the screen from the cached brick layer
+        bricks = session.bricks
+        animating = bricks.animating()
+        if dirty_frame:
+            # Only animating bricks and the regions restored from the background
+            areas = [bricks.shake_rect(cell) for cell in animating] + tracker.previous
+            self.brick_layer.draw(screen, bricks, self.background, areas)
+        else:
+            self.brick_layer.draw(screen, bricks, self.background)
+
+        # Draw brick particles
+        session.particles.draw(screen)
+        for cell in animating:
+            tracker.add(bricks.dirty_rect(cell))
+
+        # Underline drawn over any particles
+        self.draw_underline(screen)
+
+        session.game_ball.draw(screen, alpha)
+        tracker.add(session.game_ball.dirty_rect())
+        # Multi-ball mode's extra balls and falling capsules
+        session.balls.draw(screen, alpha)
+        for rect in session.balls.dirty_rects() + session.powerups.draw(screen):
+            tracker.add(rect)
+
+        if session.current_state == LIFE_LOST:
+            self.render_text("LIFE LOST", FONT_SIZE_TITLE, WHITE,
+                             center_x, center_y - 40, bold=True)
+            self.render_text(f"LIVES REMAINING: {session.lives}", FONT_SIZE_SUBTITLE, WHITE,
+                             center_x, center_y)
+            self.render_text("PRESS SPACE TO START", FONT_SIZE_SUBTITLE, WHITE,
+                             center_x, center_y + 40)
+
+        # Draw the paddle
+        session.paddle.draw(screen, alpha)
+        tracker.add(session.paddle.dirty_rect())
+
+    def draw_level_complete(self, level, progress=0.0):
+        """
+        Draw the level complete message over the current frame; once the transition is
+        half way (progress 0.5) the next level is announced under it.
+        """
+        self.render_text(f"Level {level} Complete!", FONT_SIZE_TITLE,
+                         WHITE, self.width // 2, self.height // 2)
+        if progress >= 0.5:
+            self.render_text(f"Get ready for level {level + 1}", FONT_SIZE_SUBTITLE, WHITE,
+                             self.width // 2, self.height // 2 + 40)
+        self.tracker.invalidate()
+
+    def draw_profile_overlay(self, rows):
+        """
+        Draw frame profiler statistics in the bottom-left corner, over everything else.
+
+        Args:
+            rows (list): (label, p50, p95, p99) rows from FrameProfiler.rows().
+        """
+        header = ("ms", "p50", "p95", "p99")
+        cells = [[text_renderer.render(value if isinstance(value, str) else f"{value:.2f}",
+                                       FONT_SIZE_OVERLAY, WHITE) for value in row]
+                 for row in [header] + rows]
+        # Columns as wide as their widest cell: labels left-aligned, numbers right-aligned
+        widths = [max(row[i].get_width() for row in cells) for i in range(len(header))]
+        line_height = FONT_SIZE_OVERLAY + 2
+        padding = 4
+        box = pygame.Rect(0, 0, sum(widths) + 10 * (len(widths) - 1) + 2 * padding,
+                          line_height * len(cells) + 2 * padding)
+        box.bottomleft = (BORDER_MARGIN + BORDER_THICKNESS,
+                          self.height - BORDER_MARGIN - BORDER_THICKNESS)
+        self.screen.fill(BLACK, box)
+        for line, row in enumerate(cells):
+            x = box.x + padding
+            y = box.y + padding + line * line_height
+            for column, cell in enumerate(row):
+                offset = 0 if column == 0 else widths[column] - cell.get_width()
+                self.screen.blit(cell, (x + offset, y))
+                x += widths[column] + 10
+        # Restored from the background next frame, like the moving objects
+        self.tracker.add(box)
+
+    def draw_gameplay_layer(self, surface):
+        """Draw the gameplay background: border and HUD underline (the "gameplay" layer)."""
+        surface.fill(BLACK)
+        self.draw_border(surface)
+        self.draw_underline(surface)
+
+    def draw_game_over_layer(self, surface):
+        """Draw the static parts of the game over screen (the "game_over" layer)."""
+        surface.fill(BLACK)
+        self.draw_border(surface)
+
+        # Title
+        self.render_text("GAME OVER", FONT_SIZE_TITLE, WHITE,
+                         self.width // 2, BORDER_MARGIN + 30, bold=True, surface=surface)
+
+        self.draw_underline(surface)
+
+        # Retry and Quit text at the bottom
+        bottom_y = self.height - BORDER_MARGIN - 30
+        self.render_text("RETRY (R)", FONT_SIZE_SUBTITLE, WHITE,
+                         self.width // 4, bottom_y, bold=True, surface=surface)
+        self.render_text("QUIT (Q)", FONT_SIZE_SUBTITLE, WHITE,
+                         self.width * 3 // 4, bottom_y, bold=True, surface=surface)
+
+    def draw_game_over(self, session):
+        """Draw the scoreboard over the game over layer."""
+        # Allows scoreboard to display
+        scoreboard = session.scoreboard
+        if scoreboard is not None:
+            if session.input_active:
+                scoreboard.draw_scoreboard_initials(self.screen, session.player_initials)
+            else:
+                scoreboard.draw_scoreboard(self.screen, self.width)
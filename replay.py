@@ -0,0 +1,313 @@
+"""Replay recording and playback for the Breakout game.
+
+A replay is the session seed plus one input bitmask per tick, so any game (or bug
+report) can be re-simulated exactly. Masks are run-length encoded in a small binary
+file: a header, then (mask byte, varint run length) pairs. A 10 minute game is a few
+kilobytes.
+
+File layout (little-endian):
+    magic b"BKRP", version (u8, 2; version 1 files, without flags 4 and 8, still load),
+    flags (u8: 1 = hardmode, 2 = swept,
+    4 = level transitions of LEVEL_TRANSITION_MS, 8 = multi-ball mode),
+    tick rate (u16), seed (u64), tick count (u32), run count (u32), then the runs.
+
+Usage:
+    python replay.py game.bkr [--seek FRAME]
+"""
+import argparse
+import struct
+import time
+import pygame
+from game_session import GameSession, FrameInput, GAME_OVER, FPS, LEVEL_TRANSITION_MS
+
+# pylint: disable=no-member
+
+MAGIC = b"BKRP"
+VERSION = 2
+HEADER = struct.Struct("<4sBBHQII")
+
+FLAG_HARDMODE = 1
+FLAG_SWEPT = 2
+FLAG_LEVEL_TRANSITION = 4
+FLAG_MULTIBALL = 8
+# Flags each version can set; files with other bits would not play back correctly.
+# Version 1 predates the level transition and multi-ball flags.
+VERSION_FLAGS = {
+    1: FLAG_HARDMODE | FLAG_SWEPT,
+    2: FLAG_HARDMODE | FLAG_SWEPT | FLAG_LEVEL_TRANSITION | FLAG_MULTIBALL,
+}
+
+# Input bits: held movement keys, then one bit per key pressed during the tick
+BIT_LEFT = 1
+BIT_RIGHT = 2
+# (bit, key, unicode) for the keys main.py acts on; a tick's presses replay in this order
+PRESS_BITS = (
+    (4, pygame.K_SPACE, " "),
+    (8, pygame.K_p, "p"),
+    (16, pygame.K_h, "h"),
+    (32, pygame.K_r, "r"),
+)
+KEY_BITS = {key: bit for bit, key, _ in PRESS_BITS}
+
+
+def encode_input(inputs):
+    """
+    Pack a FrameInput into an input bitmask. Keys without a bit are left out.
+    """
+    mask = (BIT_LEFT if inputs.left else 0) | (BIT_RIGHT if inputs.right else 0)
+    for key, _ in inputs.presses:
+        mask |= KEY_BITS.get(key, 0)
+    return mask
+
+
+def decode_input(mask):
+    """
+    Unpack an input bitmask into a FrameInput.
+    """
+    return FrameInput(bool(mask & BIT_LEFT), bool(mask & BIT_RIGHT),
+                      [(key, unicode) for bit, key, unicode in PRESS_BITS if mask & bit])
+
+
+def write_varint(out, value):
+    """Append value to a bytearray as an unsigned LEB128 varint."""
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data, pos):
+    """Read an unsigned LEB128 varint; returns (value, next position)."""
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+class Replay:
+    """
+    A recorded game: the session settings and the run-length encoded input masks.
+    """
+
+    def __init__(self, seed, tick_rate=FPS, hardmode=False, swept=True, runs=None,
+                 level_transition_ms=0, multiball=False):
+        """
+        Args:
+            seed (int): The session seed.
+            tick_rate (int, optional): Session ticks per second. Defaults to FPS.
+            hardmode (bool, optional): Hard mode at the start. Defaults to False.
+            swept (bool, optional): Swept collision (see GameSession). Defaults to True.
+            runs (list, optional): [mask, count] pairs in tick order.
+            level_transition_ms (int, optional): The session's level transition length,
+                0 or LEVEL_TRANSITION_MS. Defaults to 0.
+            multiball (bool, optional): Multi-ball mode (see GameSession). Defaults to
+                False.
+        """
+        if level_transition_ms not in (0, LEVEL_TRANSITION_MS):
+            raise ValueError("Replays can only record the standard level transition")
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.hardmode = hardmode
+        self.swept = swept
+        self.runs = runs if runs is not None else []
+        self.level_transition_ms = level_transition_ms
+        self.multiball = multiball
+
+    def __len__(self):
+        """Number of recorded ticks."""
+        return sum(count for _, count in self.runs)
+
+    def masks(self):
+        """Yield the input mask of every tick in order."""
+        for mask, count in self.runs:
+            for _ in range(count):
+                yield mask
+
+    def new_session(self):
+        """
+        A fresh headless session set up like the recorded one.
+        """
+        return GameSession(hardmode=self.hardmode, tick_rate=self.tick_rate,
+                           swept=self.swept, seed=self.seed,
+                           level_transition_ms=self.level_transition_ms,
+                           multiball=self.multiball)
+
+    def to_bytes(self):
+        """Encode the replay in the binary file format."""
+        flags = ((FLAG_HARDMODE if self.hardmode else 0) | (FLAG_SWEPT if self.swept else 0)
+                 | (FLAG_LEVEL_TRANSITION if self.level_transition_ms else 0)
+                 | (FLAG_MULTIBALL if self.multiball else 0))
+        out = bytearray(HEADER.pack(MAGIC, VERSION, flags, self.tick_rate, self.seed,
+                                    len(self), len(self.runs)))
+        for mask, count in self.runs:
+            out.append(mask)
+            write_varint(out, count)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Decode a replay from the binary file format."""
+        magic, version, flags, tick_rate, seed, ticks, run_count = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Not a Breakout replay")
+        if version not in VERSION_FLAGS:
+            raise ValueError(f"Unsupported replay version {version}")
+        if flags & ~VERSION_FLAGS[version]:
+            raise ValueError(f"Unknown replay flags {flags & ~VERSION_FLAGS[version]:#x}")
+        runs = []
+        pos = HEADER.size
+        for _ in range(run_count):
+            mask = data[pos]
+            count, pos = read_varint(data, pos + 1)
+            runs.append([mask, count])
+        replay = cls(seed, tick_rate, bool(flags & FLAG_HARDMODE), bool(flags & FLAG_SWEPT),
+                     runs, LEVEL_TRANSITION_MS if flags & FLAG_LEVEL_TRANSITION else 0,
+                     bool(flags & FLAG_MULTIBALL))
+        if len(replay) != ticks:
+            raise ValueError("Replay is truncated")
+        return replay
+
+    def save(self, path):
+        """Write the replay to a file."""
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        """Read a replay from a file."""
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+
+class ReplayRecorder:
+    """
+    Records the inputs given to a session, one tick at a time.
+    """
+
+    def __init__(self, session):
+        """
+        Args:
+            session (GameSession): The session about to be played (before its first step).
+        """
+        self.replay = Replay(session.seed, session.tick_rate, session.hardmode,
+                             session.swept, level_transition_ms=session.level_transition_ms,
+                             multiball=session.multiball)
+
+    def record(self, inputs, session):
+        """
+        Record the inputs for the session's next step(). Call just before it.
+        """
+        mask = encode_input(inputs)
+        # Letters typed as high-score initials aren't game input
+        if session.input_active and session.current_state == GAME_OVER:
+            mask &= BIT_LEFT | BIT_RIGHT
+        runs = self.replay.runs
+        if runs and runs[-1][0] == mask:
+            runs[-1][1] += 1
+        else:
+            runs.append([mask, 1])
+
+    def save(self, path):
+        """Write the recording to a file."""
+        self.replay.save(path)
+
+
+class ReplayPlayer:
+    """
+    Re-simulates a replay headlessly, as fast as the CPU allows.
+
+    The session is available as self.session at any point; seek() moves to any tick,
+    re-simulating from the start when moving backwards.
+    """
+
+    def __init__(self, replay):
+        """
+        Args:
+            replay (Replay): The replay to play.
+        """
+        self.replay = replay
+        self.length = len(replay)
+        self.session = None
+        self.frame = 0
+        self.run_index = 0
+        self.run_offset = 0
+        self.rewind()
+
+    def rewind(self):
+        """Go back to the start of the replay."""
+        self.session = self.replay.new_session()
+        self.frame = 0
+        self.run_index = 0
+        self.run_offset = 0
+
+    def done(self):
+        """True once every recorded tick has been played."""
+        return self.frame >= self.length
+
+    def step(self):
+        """
+        Play one tick.
+
+        Returns:
+            list: Events raised by the session during the tick.
+        """
+        mask, count = self.replay.runs[self.run_index]
+        self.run_offset += 1
+        if self.run_offset == count:
+            self.run_index += 1
+            self.run_offset = 0
+        self.frame += 1
+        return self.session.step(decode_input(mask))
+
+    def seek(self, frame):
+        """
+        Move to just after the given number of ticks (0 is the start).
+
+        Returns:
+            GameSession: The session at that point.
+        """
+        frame = max(0, min(frame, self.length))
+        if frame < self.frame:
+            self.rewind()
+        while self.frame < frame:
+            self.step()
+        return self.session
+
+    def play(self):
+        """
+        Play to the end of the replay.
+
+        Returns:
+            GameSession: The session after the last tick.
+        """
+        return self.seek(self.length)
+
+
+def main():
+    """Command line entry point: play a replay and print where it ends up."""
+    parser = argparse.ArgumentParser(description="Play a Breakout replay headlessly")
+    parser.add_argument("replay", help="replay file recorded with main.py --record")
+    parser.add_argument("--seek", type=int, default=None,
+                        help="stop after this many ticks (default: the whole replay)")
+    args = parser.parse_args()
+
+    replay = Replay.load(args.replay)
+    player = ReplayPlayer(replay)
+    started = time.perf_counter()
+    session = player.seek(args.seek if args.seek is not None else player.length)
+    elapsed = time.perf_counter() - started
+
+    print(f"{player.length} ticks ({player.length / replay.tick_rate:.1f}s of play) "
+          f"in {len(replay.runs)} runs, {len(replay.to_bytes())} bytes")
+    print(f"Tick {player.frame}: state={session.current_state} score={session.score} "
+          f"level={session.current_level} lives={session.lives}")
+    print(f"Simulated in {elapsed:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,424 @@
+"""Leaderboard storage for the Breakout game.
+
+TextScoreStore keeps the scoreboard.txt leaderboard in memory and only re-reads the file
+when its modification time or size changes, so the game over screen can ask for the
+scores every frame. The re-read runs on a background thread while the frame keeps
+showing the cached board. Saves are merged with the file's current scores and written
+by a background thread to a temporary file that is then renamed over the scoreboard, so
+a slow disk never stalls a frame, a crash never leaves a half-written file and scores
+written by another process are kept.
+
+SQLiteScoreStore keeps every score ever played, with a board per game mode, in an
+SQLite database (see --scores-db in main.py).
+"""
+import heapq
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+# Game modes, each with its own board in SQLiteScoreStore
+MODE_NORMAL = "normal"
+MODE_HARD = "hard"
+# Score range counted together in SQLiteScoreStore's score_buckets table: rank() sums
+# the buckets above a score, then the single scores above it within its own bucket
+RANK_BUCKET = 1024
+# Bytes of scoreboard.txt parsed between GIL releases while it is re-read in the background
+READ_CHUNK_BYTES = 4 * 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    mode TEXT NOT NULL,
+    level INTEGER,
+    created_at REAL NOT NULL
+);
+-- Top N and rank: walk one mode's scores in board order
+CREATE INDEX IF NOT EXISTS scores_board ON scores (mode, score DESC, id DESC);
+-- Personal best: one player's highest score in a mode
+CREATE INDEX IF NOT EXISTS scores_player ON scores (mode, name, score);
+-- Rank: how many scores a mode has of each value, and in each RANK_BUCKET range
+CREATE TABLE IF NOT EXISTS score_counts (
+    mode TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (mode, score)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS score_buckets (
+    mode TEXT NOT NULL,
+    bucket INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (mode, bucket)
+) WITHOUT ROWID;
+-- Fill the counts of a database made before they existed
+INSERT INTO score_counts (mode, score, count)
+    SELECT mode, score, COUNT(*) FROM scores
+    WHERE NOT EXISTS (SELECT 1 FROM score_counts) GROUP BY mode, score;
+INSERT INTO score_buckets (mode, bucket, count)
+    SELECT mode, score / {bucket}, SUM(count) FROM score_counts
+    WHERE NOT EXISTS (SELECT 1 FROM score_buckets) GROUP BY mode, score / {bucket};
+-- Triggers keep the counts right whichever process writes
+CREATE TRIGGER IF NOT EXISTS scores_counted AFTER INSERT ON scores BEGIN
+    INSERT INTO score_counts (mode, score, count) VALUES (NEW.mode, NEW.score, 1)
+        ON CONFLICT (mode, score) DO UPDATE SET count = count + 1;
+    INSERT INTO score_buckets (mode, bucket, count)
+        VALUES (NEW.mode, NEW.score / {bucket}, 1)
+        ON CONFLICT (mode, bucket) DO UPDATE SET count = count + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS scores_uncounted AFTER DELETE ON scores BEGIN
+    UPDATE score_counts SET count = count - 1 WHERE mode = OLD.mode AND score = OLD.score;
+    UPDATE score_buckets SET count = count - 1
+        WHERE mode = OLD.mode AND bucket = OLD.score / {bucket};
+END;
+""".format(bucket=RANK_BUCKET)
+
+
+def parse_scores(lines):
+    """
+    Parse "name,score" lines into (score, name) entries, skipping malformed lines.
+    """
+    entries = []
+    for line in lines:
+        parts = line.split(',')
+        if len(parts) == 2:
+            try:
+                entries.append((int(parts[1]), parts[0]))
+            except ValueError:
+                continue
+    return entries
+
+
+def write_atomic(path, text):
+    """
+    Replace path with text: write a temporary file next to it, then rename it over.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    handle, temp_path = tempfile.mkstemp(dir=directory, prefix=".scoreboard-", suffix=".tmp")
+    try:
+        with os.fdopen(handle, "w", encoding="utf-8") as file:
+            file.write(text)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+class TextScoreStore:
+    """
+    Top scores kept in a "name,score" text file, cached in memory and written behind.
+    """
+
+    def __init__(self, path="scoreboard.txt", max_entries=5):
+        """
+        Args:
+            path (str, optional): Scoreboard file. Defaults to "scoreboard.txt".
+            max_entries (int, optional): Number of scores kept. Defaults to 5.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.cached = []  # the file's board with the unsaved scores added
+        self.file_entries = None  # board last read from or written to the file
+        self.file_key = None  # (mtime, size) of the file file_entries came from
+        self.lock = threading.Lock()
+        self.unsaved = []  # scores added but not yet written, oldest first
+        self.writer = None
+        self.write_error = None  # OSError of the last failed write, until one succeeds
+        self.loader = None  # thread re-reading the changed file
+        self.generation = 0  # bumped by every write, so a slower re-read can't undo it
+        self.stats = {"loads": 0, "hits": 0, "writes": 0}
+
+    def stat_key(self):
+        """(mtime_ns, size) of the file, or None if it doesn't exist."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def board(self, file_entries):
+        """
+        The top scores of a board read from the file with the unsaved scores added. A
+        newer score goes above an equal older one.
+        """
+        entries = self.unsaved[::-1] + file_entries
+        return sorted(entries, key=lambda x: -x[0])[:self.max_entries]
+
+    def entries(self, mode=None):
+        """
+        Top scores as (score, name) tuples, highest first. All modes share one board.
+
+        The file is only read again when it changed on disk since the last read. The
+        first read happens here; later ones run on a loader thread and the cached board
+        is returned until the new one is ready.
+        """
+        with self.lock:
+            if self.writer is not None or self.loader is not None:
+                # A save is still being written (it reads any change itself) or the file
+                # is being read again
+                self.stats["hits"] += 1
+                return self.cached
+            key = self.stat_key()
+            if key == self.file_key and self.file_entries is not None:
+                self.stats["hits"] += 1
+                return self.cached
+            if self.file_entries is None:
+                self.publish(self.read(), key)
+                return self.cached
+            self.loader = threading.Thread(target=self.load, args=(key, self.generation),
+                                           daemon=True)
+            self.loader.start()
+            self.stats["hits"] += 1
+            return self.cached
+
+    def publish(self, file_entries, key):
+        """Make a board read from the file current. Call with the lock held."""
+        self.file_entries = file_entries
+        self.file_key = key
+        self.cached = self.board(file_entries)
+        self.stats["loads"] += 1
+
+    def load(self, key, generation):
+        """
+        Loader thread: read the changed file and swap it in as the cached board, unless a
+        save wrote the file while it was being read.
+        """
+        try:
+            entries = self.read(background=True)
+        except OSError:
+            entries = None
+        with self.lock:
+            self.loader = None
+            if entries is None or generation != self.generation:
+                return
+            self.publish(entries, key)
+
+    def read(self, background=False):
+        """
+        Read the top scores from the file, highest first; equal scores keep file order.
+
+        Args:
+            background (bool, optional): Give up the GIL between chunks of the file so the
+                frame thread never waits long for it. Defaults to False.
+        """
+        if not os.path.exists(self.path):
+            return []
+        entries = []
+        with open(self.path, "r", encoding="utf-8") as file:
+            while True:
+                lines = file.readlines(READ_CHUNK_BYTES)
+                if not lines:
+                    break
+                # nlargest is a stable sort, so earlier lines win ties as before
+                entries = heapq.nlargest(self.max_entries, entries + parse_scores(lines),
+                                         key=lambda x: x[0])
+                if background:
+                    time.sleep(0)
+        return entries
+
+    def add(self, score, name, mode=None, level=None):
+        """
+        Add a score. The in-memory board changes at once; the file is written in the
+        background, merged with whatever the file holds by then (another process may
+        have changed it). The text file has no room for the mode or level.
+        """
+        with self.lock:
+            if self.file_entries is None and self.writer is None:
+                self.publish(self.read(), self.stat_key())
+            self.unsaved.append((score, name))
+            self.cached = self.board(self.file_entries or [])
+            self.start_writer()
+
+    def start_writer(self):
+        """Start the writer thread if it isn't running. Call with the lock held."""
+        if self.writer is None:
+            self.writer = threading.Thread(target=self.write_pending, daemon=True)
+            self.writer.start()
+
+    def write_pending(self):
+        """
+        Writer thread: merge the unsaved scores into the file until none are left.
+        """
+        while True:
+            with self.lock:
+                if not self.unsaved:
+                    self.writer = None
+                    return
+                # Newest first, so a newer score goes above an equal older one
+                added = self.unsaved[::-1]
+                file_entries, file_key = self.file_entries, self.file_key
+            try:
+                # Another process (or a re-read still running) may have changed the file
+                key = self.stat_key()
+                if key != file_key or file_entries is None:
+                    file_entries = self.read(background=True)
+                entries = sorted(added + file_entries, key=lambda x: -x[0])[:self.max_entries]
+                write_atomic(self.path, "".join(f"{n},{s}\n" for s, n in entries))
+            except OSError as error:
+                # Keep playing with the in-memory board; the scores stay unsaved and the
+                # next save or flush() tries again
+                with self.lock:
+                    self.writer = None
+                    self.write_error = error
+                return
+            with self.lock:
+                del self.unsaved[:len(added)]
+                self.generation += 1
+                self.file_entries = entries
+                self.file_key = self.stat_key()
+                self.cached = self.board(entries)
+                self.write_error = None
+                self.stats["writes"] += 1
+
+    def flush(self, timeout=None):
+        """
+        Wait for any background write or re-read to finish (e.g. before the program exits).
+        Scores left unsaved by a failed write are written again first.
+        """
+        with self.lock:
+            if self.unsaved:
+                self.start_writer()
+            threads = (self.writer, self.loader)
+        for thread in threads:
+            if thread is not None:
+                thread.join(timeout)
+
+    def close(self):
+        """
+        Finish any background write or re-read.
+
+        Raises:
+            OSError: Scores could not be written; the error of the last attempt.
+        """
+        self.flush()
+        with self.lock:
+            if self.unsaved and self.write_error is not None:
+                raise self.write_error
+
+
+class SQLiteScoreStore:
+    """
+    Full score history in an SQLite database, with a separate board per game mode.
+
+    Every score is kept with its mode, level and time. Top N and personal best are
+    answered from indexes and rank from per-score counts kept by triggers, and the
+    database runs in WAL mode so several game processes can write to it at once while
+    others read.
+    """
+
+    def __init__(self, path="scores.db", max_entries=5, timeout=5.0):
+        """
+        Args:
+            path (str, optional): Database file. Defaults to "scores.db".
+            max_entries (int, optional): Scores shown on a board. Defaults to 5.
+            timeout (float, optional): Seconds to wait for another writer. Defaults to 5.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.connection = sqlite3.connect(path, timeout=timeout)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        # With WAL, NORMAL stays consistent after a crash without an fsync per commit
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        # One transaction, so no other process adds a score between filling the counts
+        # and creating the triggers
+        try:
+            self.connection.executescript(f"BEGIN IMMEDIATE; {SCHEMA} COMMIT;")
+        except sqlite3.Error:
+            self.connection.rollback()
+            raise
+        # Boards read since the database last changed, keyed by mode
+        self.cached = {}
+        self.data_version = None
+        self.stats = {"loads": 0, "hits": 0, "writes": 0}
+
+    def changed(self):
+        """
+        True if another connection (in this process or another) wrote since the last check.
+        """
+        version = self.connection.execute("PRAGMA data_version").fetchone()[0]
+        if version != self.data_version:
+            self.data_version = version
+            return True
+        return False
+
+    def entries(self, mode=MODE_NORMAL):
+        """
+        Top scores for a mode as (score, name) tuples, highest first. Cached until the
+        database changes.
+        """
+        if self.changed():
+            self.cached.clear()
+        board = self.cached.get(mode)
+        if board is None:
+            board = self.top(self.max_entries, mode)
+            self.cached[mode] = board
+            self.stats["loads"] += 1
+        else:
+            self.stats["hits"] += 1
+        return board
+
+    def add(self, score, name, mode=MODE_NORMAL, level=None):
+        """
+        Record a score.
+        """
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO scores (name, score, mode, level, created_at) "
+                "VALUES (?, ?, ?, ?, ?)", (name, score, mode, level, time.time()))
+        # data_version does not change for this connection's own writes
+        self.cached.clear()
+        self.stats["writes"] += 1
+
+    def top(self, n, mode=MODE_NORMAL):
+        """
+        The n highest scores for a mode as (score, name) tuples. Equal scores list the
+        newest first, like the text scoreboard.
+        """
+        return self.connection.execute(
+            "SELECT score, name FROM scores WHERE mode = ? "
+            "ORDER BY score DESC, id DESC LIMIT ?", (mode, n)).fetchall()
+
+    def rank(self, score, mode=MODE_NORMAL):
+        """
+        Rank (1 = best) a new score would get on a mode's board; ties go to the new score.
+
+        Sums the bucket counts above the score's bucket and the counts of the higher
+        scores within it, so the cost depends on the score range, not the number of rows.
+        """
+        bucket = score // RANK_BUCKET
+        better = self.connection.execute(
+            "SELECT (SELECT COALESCE(SUM(count), 0) FROM score_buckets "
+            "        WHERE mode = ? AND bucket > ?) + "
+            "       (SELECT COALESCE(SUM(count), 0) FROM score_counts "
+            "        WHERE mode = ? AND score > ? AND score < ?)",
+            (mode, bucket, mode, score, (bucket + 1) * RANK_BUCKET)).fetchone()[0]
+        return better + 1
+
+    def personal_best(self, name, mode=MODE_NORMAL):
+        """
+        A player's highest score for a mode, or None if they have no scores.
+        """
+        return self.connection.execute(
+            "SELECT MAX(score) FROM scores WHERE mode = ? AND name = ?",
+            (mode, name)).fetchone()[0]
+
+    def count(self, mode=MODE_NORMAL):
+        """
+        Number of scores recorded for a mode.
+        """
+        return self.connection.execute(
+            "SELECT COUNT(*) FROM scores WHERE mode = ?", (mode,)).fetchone()[0]
+
+    def flush(self, timeout=None):
+        """
+        Scores are committed as they are added; nothing to wait for.
+        """
+
+    def close(self):
+        """Close the database connection."""
+        self.connection.close()
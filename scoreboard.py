@@ -1,8 +1,8 @@
 """Defines the Scoreboard class for the Breakout game
 
 Handles rendering, sorting and saving to scoreboard.txt"""
-import os
-import pygame
+from text_renderer import text_renderer
+from score_store import TextScoreStore, MODE_NORMAL, MODE_HARD
 
 
 class Scoreboard:
@@ -11,10 +11,13 @@ class Scoreboard:
     high score is reached.
     """
 
-    def __init__(self, screen_width, screen_height):
+    def __init__(self, screen_width, screen_height, store=None):
         """Will generate two different scoreboards depending on if the player manages to hit
         top ten scores.
-        Calculates """
+        Calculates
+
+        store is where scores are kept (score_store.TextScoreStore or SQLiteScoreStore);
+        defaults to scoreboard.txt."""
         super().__init__()
 
         self.new_score = 0
@@ -33,22 +36,18 @@ class Scoreboard:
         # Text manipulation
         self.size_subtitle = 48
         self.size_row = 30
-        self.font_bold = "assets/fonts/ChakraPetch-Bold.ttf"
-        self.font_path = "assets/fonts/ChakraPetch-Regular.ttf"
         self.max_entries = 5
         self.scoreboard_file = "scoreboard.txt"
+        # Cached in memory and written in the background
+        if store is None:
+            store = TextScoreStore(self.scoreboard_file, self.max_entries)
+        self.store = store
+        # Board shown and saved to (only SQLiteScoreStore keeps the modes apart)
+        self.mode = MODE_NORMAL
 
     def render_text(self, screen, text, size, color, x, y, center=True, bold=False):
         """Render text on the screen with optional centering and bold styling."""
-        font_path = self.font_bold if bold else self.font_path
-        font = pygame.font.Font(font_path, size)
-        rendered = font.render(text, True, color)
-        rect = rendered.get_rect()
-        if center:
-            rect.center = (x, y)
-        else:
-            rect.topleft = (x, y)
-        screen.blit(rendered, rect)
+        return text_renderer.draw(screen, text, size, color, x, y, center, bold)
 
     def top_scores(self, score):
         """
@@ -61,32 +60,16 @@ class Scoreboard:
 
     def load_scoreboard(self):
         """
-        Contains logic that will pull the text from the scoreboard file and allow the program
-        to read it.
-        """
-        if not os.path.exists(self.scoreboard_file):
-            return []
-
-        # Open/Read files
-        with open(self.scoreboard_file, "r", encoding="utf-8") as file:
-            lines = file.readlines()
-
-        entries = []
-
-        # Split line by comma and into two parts
-        for line in lines:
-            parts = line.split(',')
-            if len(parts) == 2:
-                name = parts[0]
-                try:
-                    # Convert score from string to int
-                    score = int(parts[1])
-                    entries.append((score, name))
-                except ValueError:
-                    # Added to skip if not integer
-                    continue
-        # Return score descending based on scores
-        return sorted(entries, key=lambda x: -x[0])[:self.max_entries]
+        Returns the top scores as (score, name) tuples, highest first. The file is only
+        read again when it has changed.
+        """
+        return self.store.entries(self.mode)
+
+    def set_mode(self, hardmode):
+        """
+        Switches to the normal or hard mode board.
+        """
+        self.mode = MODE_HARD if hardmode else MODE_NORMAL
 
     def new_initials(self, score):
         """
@@ -156,21 +139,20 @@ class Scoreboard:
             self.render_text(screen, name, self.size_row,
                              self.white, self.name, row_y)
 
-    def save_score(self, score, name):
+    def save_score(self, score, name, level=None):
+        """
+        Saves a new score into the scoreboard file (written in the background).
         """
-        Saves a new score into the scoreboard file.
+        self.store.add(score, name, self.mode, level)
+
+    def close(self):
         """
-        entries = self.load_scoreboard()
-        # Insert new score at the top
-        entries.insert(0, (score, name))
+        Waits for any score still being saved and closes the store.
 
-        # Sort by score in descending order but keep same-score entries in order of insertion
-        entries = sorted(entries, key=lambda x: -x[0])
-        # Keep only top N entries
-        entries = entries[:self.max_entries]
-        with open(self.scoreboard_file, "w", encoding="utf-8") as file:
-            for s, n in entries:
-                file.write(f"{n},{s}\n")
+        Raises:
+            OSError: A score could not be saved.
+        """
+        self.store.close()
 
     def get_rank_suffix(self, rank):
         """
@@ -0,0 +1,246 @@
+"""Difficulty parameter sweep for the Breakout game.
+
+Runs batches of simulated games (batch_sim.BatchSimulator) for every combination of
+ball speed, per-level speedup, paddle speed, lives and brick score scale, spread over a
+process pool. Each finished combination is appended to a JSON Lines results file as
+soon as it is done, so a sweep that was stopped can be resumed where it left off. The
+file's first line records the games, ticks and seed of the sweep; resuming with
+different ones is refused, so results run with different settings are never mixed.
+
+Usage:
+    python sweep.py --speed-x -2 -3 -4 --paddle-speed 5 7 9 --output sweep.jsonl
+"""
+import argparse
+import itertools
+import json
+import os
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+from batch_sim import BatchSimulator, TRACK_DEADZONE
+from bricks import brick_colors
+
+# Defaults match the game as shipped (Ball, Paddle, start_next_level, brick_colors)
+DEFAULT_GRID = {
+    "speed_x": [-3.0],
+    "speed_y": [-4.0],
+    "level_speedup": [1.1],
+    "paddle_speed": [7.0],
+    "lives": [3],
+    "score_scale": [1.0],
+}
+
+# Scripted player: follows the ball, aiming a per-game random offset from the
+# paddle's center so the games in a batch play out differently
+AIM_SPREAD = 40
+
+
+def config_key(config):
+    """Stable string identifying one parameter combination."""
+    return json.dumps(config, sort_keys=True)
+
+
+def build_grid(grid):
+    """
+    Every combination of the parameter values in grid.
+
+    Args:
+        grid (dict): Parameter name to list of values.
+
+    Returns:
+        list: One dict per combination.
+    """
+    names = sorted(grid)
+    return [dict(zip(names, values))
+            for values in itertools.product(*(grid[name] for name in names))]
+
+
+def aiming_policy(aim):
+    """
+    Paddle policy that tracks the ball with a fixed aim offset per game.
+
+    Args:
+        aim (numpy.ndarray): Offset from the paddle's center for each game.
+    """
+    def policy(sim):
+        center = np.floor(sim.paddle_x + 0.5) + sim.paddle_width // 2 + aim
+        return (np.where(sim.ball_x < center - TRACK_DEADZONE, -1, 0)
+                + np.where(sim.ball_x > center + TRACK_DEADZONE, 1, 0))
+    return policy
+
+
+def run_config(config, games, ticks, seed=0):
+    """
+    Simulate one parameter combination and summarize the results.
+
+    Runs in a worker process, so it only takes and returns plain data.
+
+    Args:
+        config (dict): Parameter values (see DEFAULT_GRID).
+        games (int): Number of games to simulate.
+        ticks (int): Most ticks to simulate each game for.
+        seed (int, optional): Base random seed. Defaults to 0.
+
+    Returns:
+        dict: The config with score, level and survival statistics.
+    """
+    started = time.perf_counter()
+    key = config_key(config)
+    # Same seed for the same config, whatever order the sweep runs in
+    rng = np.random.default_rng([seed, zlib.crc32(key.encode())])
+    scores = [round(info["score"] * config["score_scale"]) for info in brick_colors]
+    sim = BatchSimulator(games, speed_x=config["speed_x"], speed_y=config["speed_y"],
+                         level_speedup=config["level_speedup"],
+                         paddle_speed=config["paddle_speed"], lives=config["lives"],
+                         brick_scores=scores)
+    aim = rng.uniform(-AIM_SPREAD, AIM_SPREAD, games)
+    ran = sim.run(ticks, aiming_policy(aim))
+
+    score = sim.score
+    return {
+        "key": key,
+        **config,
+        "games": games,
+        "ticks": ran,
+        "score_mean": float(score.mean()),
+        "score_p10": float(np.percentile(score, 10)),
+        "score_p50": float(np.percentile(score, 50)),
+        "score_p90": float(np.percentile(score, 90)),
+        "level_mean": float(sim.level.mean()),
+        "level_max": int(sim.level.max()),
+        "game_over_rate": float(sim.done.mean()),
+        "ticks_survived_mean": float(sim.ticks.mean()),
+        "bricks_hit_mean": float(sim.bricks_hit.mean()),
+        "paddle_hits_mean": float(sim.paddle_hits.mean()),
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+def sweep_settings(games, ticks, seed):
+    """The settings shared by every result in a results file (its header line)."""
+    return {"games": games, "ticks": ticks, "seed": seed}
+
+
+def read_results(path):
+    """
+    Read a results file for resuming.
+
+    Returns:
+        tuple: (the settings in its header line, or None; keys of the combinations
+        already done; length in bytes of its complete lines). Anything after that
+        length is a line cut short by an interrupted write, so that combination runs
+        again.
+    """
+    settings = None
+    keys = set()
+    length = 0
+    if not os.path.exists(path):
+        return settings, keys, length
+    with open(path, "rb") as file:
+        for line in file:
+            if not line.endswith(b"\n"):
+                break
+            length += len(line)
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if "settings" in record:
+                settings = record["settings"]
+            elif "key" in record:
+                keys.add(record["key"])
+    return settings, keys, length
+
+
+def run_sweep(grid, output, games=1000, ticks=20000, workers=None, seed=0, resume=True,
+              log=print):
+    """
+    Run every combination in grid that is not already in the output file.
+
+    Args:
+        grid (dict): Parameter name to list of values; missing names use DEFAULT_GRID.
+        output (str): JSON Lines results file, appended to as combinations finish.
+        games (int, optional): Games per combination. Defaults to 1000.
+        ticks (int, optional): Most ticks per game. Defaults to 20000.
+        workers (int, optional): Worker processes. Defaults to the number of CPUs.
+        seed (int, optional): Base random seed. Defaults to 0.
+        resume (bool, optional): Skip combinations already in output. Defaults to True.
+        log (callable, optional): Progress output. Defaults to print.
+
+    Returns:
+        int: Number of combinations run.
+
+    Raises:
+        ValueError: When resuming a results file run with other games, ticks or seed.
+    """
+    settings = sweep_settings(games, ticks, seed)
+    configs = build_grid({**DEFAULT_GRID, **grid})
+    done = set()
+    length = 0
+    if resume:
+        found, done, length = read_results(output)
+        if length and found != settings:
+            raise ValueError(f"{output} has results for {found}, not {settings}; "
+                             f"use another output file or don't resume")
+    todo = [config for config in configs if config_key(config) not in done]
+    log(f"{len(configs)} combinations, {len(configs) - len(todo)} already done")
+    if not todo:
+        return 0
+
+    started = time.perf_counter()
+    with open(output, "a" if resume else "w", encoding="utf-8") as file, \
+            ProcessPoolExecutor(max_workers=workers) as pool:
+        # Drop a line cut short by an interrupted write before appending
+        file.truncate(length)
+        if not length:
+            file.write(json.dumps({"settings": settings}) + "\n")
+            file.flush()
+        futures = [pool.submit(run_config, config, games, ticks, seed) for config in todo]
+        for count, future in enumerate(as_completed(futures), 1):
+            result = future.result()
+            # One line per combination, written as soon as it finishes
+            file.write(json.dumps(result) + "\n")
+            file.flush()
+            log(f"[{count}/{len(todo)}] score {result['score_mean']:.0f} "
+                f"level {result['level_mean']:.2f} {result['key']}")
+    log(f"Finished in {time.perf_counter() - started:.1f}s")
+    return len(todo)
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Breakout difficulty parameter sweep")
+    parser.add_argument("--speed-x", type=float, nargs="+", help="starting ball x speeds")
+    parser.add_argument("--speed-y", type=float, nargs="+", help="starting ball y speeds")
+    parser.add_argument("--level-speedup", type=float, nargs="+",
+                        help="ball speed multipliers per level")
+    parser.add_argument("--paddle-speed", type=float, nargs="+",
+                        help="paddle speeds in pixels per frame")
+    parser.add_argument("--lives", type=int, nargs="+", help="starting lives")
+    parser.add_argument("--score-scale", type=float, nargs="+",
+                        help="multipliers for the brick scores")
+    parser.add_argument("--games", type=int, default=1000,
+                        help="games per combination (default: 1000)")
+    parser.add_argument("--ticks", type=int, default=20000,
+                        help="most ticks per game (default: 20000)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (default: number of CPUs)")
+    parser.add_argument("--seed", type=int, default=0, help="base random seed")
+    parser.add_argument("--output", default="sweep.jsonl",
+                        help="results file (default: sweep.jsonl)")
+    parser.add_argument("--no-resume", action="store_true",
+                        help="overwrite the results file instead of resuming")
+    args = parser.parse_args()
+
+    grid = {name: values for name, values in vars(args).items()
+            if name in DEFAULT_GRID and values is not None}
+    try:
+        run_sweep(grid, args.output, games=args.games, ticks=args.ticks,
+                  workers=args.workers, seed=args.seed, resume=not args.no_resume)
+    except ValueError as error:
+        parser.error(str(error))
+
+
+if __name__ == "__main__":
+    main()
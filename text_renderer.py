@@ -0,0 +1,111 @@
+"""Shared text rendering service for the Breakout game.
+
+Caches loaded fonts and rendered text surfaces so the HUD, menus and scoreboard
+do not reload the TTF files or re-rasterize glyphs every frame.
+"""
+from collections import OrderedDict
+import pygame
+
+FONT_REGULAR = "assets/fonts/ChakraPetch-Regular.ttf"
+FONT_BOLD = "assets/fonts/ChakraPetch-Bold.ttf"
+
+
+class TextRenderer:
+    """
+    Renders text through a keyed font cache and a bounded LRU cache of rendered surfaces.
+
+    Fonts are cached by (path, size) and never evicted since the game only uses a handful.
+    Rendered surfaces are cached by (text, size, color, bold) and the least recently used
+    entry is evicted once max_surfaces is reached.
+    """
+
+    def __init__(self, max_surfaces=256, regular_path=FONT_REGULAR, bold_path=FONT_BOLD):
+        """
+        Args:
+            max_surfaces (int, optional): Maximum number of rendered surfaces kept. Defaults to 256.
+            regular_path (str, optional): Path of the regular font file.
+            bold_path (str, optional): Path of the bold font file.
+        """
+        self.max_surfaces = max_surfaces
+        self.regular_path = regular_path
+        self.bold_path = bold_path
+        self.fonts = {}
+        self.surfaces = OrderedDict()
+        self.reset_stats()
+
+    def reset_stats(self):
+        """
+        Reset the hit/miss/eviction counters.
+        """
+        self.stats = {
+            "font_loads": 0,
+            "font_hits": 0,
+            "surface_hits": 0,
+            "surface_misses": 0,
+            "evictions": 0,
+        }
+
+    def get_font(self, path, size):
+        """
+        Return the pygame Font for (path, size), loading it on first use.
+        """
+        key = (path, size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(path, size)
+            self.fonts[key] = font
+            self.stats["font_loads"] += 1
+        else:
+            self.stats["font_hits"] += 1
+        return font
+
+    def render(self, text, size, color, bold=False):
+        """
+        Return a rendered (anti-aliased) surface for the text, reusing a cached one if possible.
+
+        The returned surface is shared with the cache and must not be drawn on.
+        """
+        key = (text, size, tuple(color), bold)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.stats["surface_hits"] += 1
+            return surface
+
+        self.stats["surface_misses"] += 1
+        font = self.get_font(self.bold_path if bold else self.regular_path, size)
+        surface = font.render(text, True, color)
+        self.surfaces[key] = surface
+
+        # Evict least recently used surfaces
+        while len(self.surfaces) > self.max_surfaces:
+            self.surfaces.popitem(last=False)
+            self.stats["evictions"] += 1
+        return surface
+
+    def draw(self, screen, text, size, color, x, y, center=True, bold=False):
+        """
+        Render text on the screen with optional centering and bold styling.
+
+        Returns:
+            pygame.Rect: The screen area covered by the text.
+        """
+        rendered = self.render(text, size, color, bold)
+        rect = rendered.get_rect()
+        if center:
+            rect.center = (x, y)
+        else:
+            rect.topleft = (x, y)
+        screen.blit(rendered, rect)
+        return rect
+
+    def clear(self):
+        """
+        Drop all cached fonts and surfaces (e.g. after pygame.font.quit()).
+        """
+        self.fonts.clear()
+        self.surfaces.clear()
+
+
+# Shared instance used by main.py and the Scoreboard
+text_renderer = TextRenderer()
@@ -0,0 +1,55 @@
+"""Fixed-timestep accumulator for the Breakout game loop.
+
+Lets the physics run at a fixed tick rate no matter how fast frames are rendered,
+and tells the renderer how far it is between two ticks for interpolation.
+"""
+
+
+class FixedTimestep:
+    """
+    Converts real elapsed time into a whole number of fixed-length simulation ticks.
+    """
+
+    def __init__(self, tick_rate=120, max_ticks=8):
+        """
+        Args:
+            tick_rate (int, optional): Simulation ticks per second. Defaults to 120.
+            max_ticks (int, optional): Most ticks run for one rendered frame. Time beyond
+                that is dropped so a long stall cannot make the game spiral. Defaults to 8.
+        """
+        self.tick_rate = tick_rate
+        self.dt = 1.0 / tick_rate
+        self.max_ticks = max_ticks
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self.dropped_ticks = 0
+
+    def advance(self, elapsed):
+        """
+        Add real elapsed time and return how many ticks to simulate now.
+
+        Args:
+            elapsed (float): Seconds since the last call.
+
+        Returns:
+            int: Number of ticks to run before rendering this frame.
+        """
+        self.accumulator += elapsed
+        ticks = int(self.accumulator / self.dt)
+        if ticks > self.max_ticks:
+            # Too far behind: run the capped number of ticks and drop the rest
+            self.dropped_ticks += ticks - self.max_ticks
+            ticks = self.max_ticks
+            self.accumulator %= self.dt
+        else:
+            self.accumulator -= ticks * self.dt
+        # Fraction of the way to the next tick, used to interpolate positions
+        self.alpha = self.accumulator / self.dt
+        return ticks
+
+    def reset(self):
+        """
+        Forget any accumulated time (e.g. after a deliberate pause).
+        """
+        self.accumulator = 0.0
+        self.alpha = 0.0